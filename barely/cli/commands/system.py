@@ -41,7 +41,7 @@ def help():
         ("today", "List today's tasks", "barely today"),
         ("week", "List this week's tasks", "barely week"),
         ("backlog", "List backlog tasks", "barely backlog"),
-        ("archive", "View archived/completed tasks", "barely archive"),
+        ("archive", "View archived/completed tasks", "barely archive [--since 30d|all]"),
         ("pull", "Pull tasks into scope", "barely pull <task_id(s)> <scope>"),
         ("project add", "Create a project", 'barely project add "Project name"'),
         ("project ls", "List projects", "barely project ls"),
@@ -4,7 +4,6 @@ PURPOSE: Task management commands (add, ls, done, rm, edit, desc, show, mv, assi
 """
 
 import sys
-import json
 import os
 import tempfile
 import subprocess
@@ -15,7 +14,7 @@ from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 
-from ..main import app, console, error_console
+from ..main import app, catch_barely, console, error_console, ordered_id_errors, parse_id_list, stream_json_array
 from ...core import service, repository
 from ...core.exceptions import (
     BarelyError,
@@ -27,6 +26,7 @@ from ...core.exceptions import (
 from ...utils import improve_title_with_ai
 
 @app.command()
+@catch_barely
 def add(
     title: str = typer.Argument(..., help="Task title"),
     column_id: int = typer.Option(1, "--column", "-c", help="Column ID (default: 1 = Todo)"),
@@ -92,12 +92,10 @@ def add(
     except InvalidInputError as e:
         error_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
 
 
 @app.command()
+@catch_barely
 def ls(
     project_name: Optional[str] = typer.Option(None, "--project", "-p", help="Filter by project name"),
     include_archived: bool = typer.Option(False, "--archived", help="Include archived/completed tasks"),
@@ -131,7 +129,7 @@ def ls(
 
         if json_output:
             # Output as JSON array
-            tasks_data = [
+            stream_json_array(
                 {
                     "id": t.id,
                     "title": t.title,
@@ -143,8 +141,7 @@ def ls(
                     "updated_at": t.updated_at,
                 }
                 for t in tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
+            )
 
         elif raw:
             # Plain text, one per line
@@ -192,12 +189,10 @@ def ls(
     except InvalidInputError as e:
         error_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
 
 
 @app.command()
+@catch_barely
 def done(
     task_ids: str = typer.Argument(..., help="Task ID(s) to complete (comma-separated)"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
@@ -211,56 +206,47 @@ def done(
         barely done 3,5,7
         barely done 3 --json
     """
-    try:
-        # Parse comma-separated IDs
-        ids = [id.strip() for id in task_ids.split(",")]
-        completed_tasks = []
-        errors = []
-
-        for id_str in ids:
-            try:
-                task_id = int(id_str)
-                task = service.complete_task(task_id)
-                completed_tasks.append(task)
-            except ValueError:
-                errors.append(f"Invalid task ID: {id_str}")
-            except TaskNotFoundError as e:
-                errors.append(str(e))
-            except BarelyError as e:
-                errors.append(f"Error with task {id_str}: {e}")
-
-        # Display results
-        if json_output:
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status,
-                    "completed_at": t.completed_at,
-                }
-                for t in completed_tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-        elif raw:
-            for task in completed_tasks:
-                console.print(f"Completed: {task.title}")
-        else:
-            for task in completed_tasks:
-                console.print(f"[green]✓[/green] Completed: {task.title}")
-
-        # Show errors if any
-        if errors:
-            for error in errors:
-                error_console.print(f"[red]Error:[/red] {error}")
-            if not completed_tasks:
-                raise typer.Exit(1)
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    # Parse comma-separated IDs (bad entries become errors, not aborts)
+    valid_ids, errors = parse_id_list(task_ids, "task")
+    completed_tasks = []
+
+    if valid_ids:
+        # One transaction; IDs that don't exist are skipped and reported
+        completed_tasks = service.complete_tasks(valid_ids, skip_missing=True)
+        completed_ids = {t.id for t in completed_tasks}
+        missing = {i: str(TaskNotFoundError(i)) for i in valid_ids if i not in completed_ids}
+        if missing:
+            # Report bad and missing IDs in the order they were given
+            errors = ordered_id_errors(task_ids, missing, "task")
+
+    # Display results
+    if json_output:
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "completed_at": t.completed_at,
+            }
+            for t in completed_tasks
+        )
+    elif raw:
+        for task in completed_tasks:
+            console.print(f"Completed: {task.title}")
+    else:
+        for task in completed_tasks:
+            console.print(f"[green]✓[/green] Completed: {task.title}")
+
+    # Show errors if any
+    if errors:
+        for error in errors:
+            error_console.print(f"[red]Error:[/red] {error}")
+        if not completed_tasks:
+            raise typer.Exit(1)
 
 
 @app.command()
+@catch_barely
 def rm(
     task_ids: str = typer.Argument(..., help="Task ID(s) to delete (comma-separated or '*' for all)"),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
@@ -283,114 +269,110 @@ def rm(
         barely rm '*'
         barely rm 3,5,7 --yes
     """
-    try:
-        # Handle wildcard: delete all tasks
-        if task_ids.strip() == "*":
-            all_tasks = service.list_tasks()
-
-            if not all_tasks:
-                console.print("[yellow]No tasks to delete[/yellow]")
-                raise typer.Exit(0)
-
-            # Confirm deletion unless --yes
-            if not yes and len(all_tasks) > 0:
-                console.print(f"[yellow]About to delete {len(all_tasks)} task(s)[/yellow]")
-                response = typer.confirm("Continue?", default=False)
-                if not response:
-                    console.print("[yellow]Cancelled[/yellow]")
-                    raise typer.Exit(0)
-
-            # Delete all tasks
-            deleted_tasks = []
-            errors = []
-
-            for task in all_tasks:
-                try:
-                    service.delete_task(task.id)
-                    deleted_tasks.append({"id": task.id, "title": task.title})
-                except (TaskNotFoundError, BarelyError) as e:
-                    errors.append(f"Task {task.id}: {e}")
-
-            # Display results
-            if json_output:
-                console.print(json.dumps(deleted_tasks, indent=2))
-            elif raw:
-                for task in deleted_tasks:
-                    console.print(f"Deleted task {task['id']}: {task['title']}")
-            else:
-                console.print(f"[green]✓ Deleted {len(deleted_tasks)} task(s)[/green]")
-                if errors:
-                    for error in errors:
-                        error_console.print(f"[red]Error:[/red] {error}")
-
-            raise typer.Exit(0 if not errors else 1)
-
-        # Parse comma-separated IDs
-        ids = [id.strip() for id in task_ids.split(",")]
-        deleted_tasks = []
-        errors = []
-
-        # Get all tasks once for efficiency
+    # Handle wildcard: delete all tasks
+    if task_ids.strip() == "*":
         all_tasks = service.list_tasks()
-        all_tasks_dict = {t.id: t for t in all_tasks}
 
-        # Validate IDs first
-        valid_ids = []
-        for id_str in ids:
-            try:
-                task_id = int(id_str)
-                if task_id not in all_tasks_dict:
-                    errors.append(f"Task {id_str} not found")
-                else:
-                    valid_ids.append(task_id)
-            except ValueError:
-                errors.append(f"Invalid task ID: {id_str}")
-
-        if not valid_ids:
-            for error in errors:
-                error_console.print(f"[red]Error:[/red] {error}")
-            raise typer.Exit(1)
+        if not all_tasks:
+            console.print("[yellow]No tasks to delete[/yellow]")
+            raise typer.Exit(0)
 
-        # Confirm deletion for multiple tasks unless --yes
-        if not yes and len(valid_ids) > 1:
-            console.print(f"[yellow]About to delete {len(valid_ids)} task(s)[/yellow]")
+        # Confirm deletion unless --yes
+        if not yes and len(all_tasks) > 0:
+            console.print(f"[yellow]About to delete {len(all_tasks)} task(s)[/yellow]")
             response = typer.confirm("Continue?", default=False)
             if not response:
                 console.print("[yellow]Cancelled[/yellow]")
                 raise typer.Exit(0)
 
-        # Delete tasks
-        for task_id in valid_ids:
+        # Delete all tasks
+        deleted_tasks = []
+        errors = []
+
+        for task in all_tasks:
             try:
-                task_to_delete = all_tasks_dict[task_id]
-                service.delete_task(task_id)
-                deleted_tasks.append({"id": task_id, "title": task_to_delete.title})
+                service.delete_task(task.id)
+                deleted_tasks.append({"id": task.id, "title": task.title})
             except (TaskNotFoundError, BarelyError) as e:
-                errors.append(f"Error deleting task {task_id}: {e}")
+                errors.append(f"Task {task.id}: {e}")
 
         # Display results
         if json_output:
-            console.print(json.dumps(deleted_tasks, indent=2))
+            stream_json_array(deleted_tasks)
         elif raw:
             for task in deleted_tasks:
                 console.print(f"Deleted task {task['id']}: {task['title']}")
         else:
-            for task in deleted_tasks:
-                console.print(f"[red]✗[/red] Deleted task {task['id']}: {task['title']}")
+            console.print(f"[green]✓ Deleted {len(deleted_tasks)} task(s)[/green]")
+            if errors:
+                for error in errors:
+                    error_console.print(f"[red]Error:[/red] {error}")
 
-        # Show errors if any
-        if errors:
-            for error in errors:
-                error_console.print(f"[red]Error:[/red] {error}")
-            if not deleted_tasks:
-                raise typer.Exit(1)
+        raise typer.Exit(0 if not errors else 1)
 
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
+    # Parse comma-separated IDs
+    ids = [id.strip() for id in task_ids.split(",")]
+    deleted_tasks = []
+    errors = []
+
+    # Get all tasks once for efficiency
+    all_tasks = service.list_tasks()
+    all_tasks_dict = {t.id: t for t in all_tasks}
+
+    # Validate IDs first
+    valid_ids = []
+    for id_str in ids:
+        try:
+            task_id = int(id_str)
+            if task_id not in all_tasks_dict:
+                errors.append(f"Task {id_str} not found")
+            else:
+                valid_ids.append(task_id)
+        except ValueError:
+            errors.append(f"Invalid task ID: {id_str}")
+
+    if not valid_ids:
+        for error in errors:
+            error_console.print(f"[red]Error:[/red] {error}")
         raise typer.Exit(1)
 
+    # Confirm deletion for multiple tasks unless --yes
+    if not yes and len(valid_ids) > 1:
+        console.print(f"[yellow]About to delete {len(valid_ids)} task(s)[/yellow]")
+        response = typer.confirm("Continue?", default=False)
+        if not response:
+            console.print("[yellow]Cancelled[/yellow]")
+            raise typer.Exit(0)
+
+    # Delete tasks
+    for task_id in valid_ids:
+        try:
+            task_to_delete = all_tasks_dict[task_id]
+            service.delete_task(task_id)
+            deleted_tasks.append({"id": task_id, "title": task_to_delete.title})
+        except (TaskNotFoundError, BarelyError) as e:
+            errors.append(f"Error deleting task {task_id}: {e}")
+
+    # Display results
+    if json_output:
+        stream_json_array(deleted_tasks)
+    elif raw:
+        for task in deleted_tasks:
+            console.print(f"Deleted task {task['id']}: {task['title']}")
+    else:
+        for task in deleted_tasks:
+            console.print(f"[red]✗[/red] Deleted task {task['id']}: {task['title']}")
+
+    # Show errors if any
+    if errors:
+        for error in errors:
+            error_console.print(f"[red]Error:[/red] {error}")
+        if not deleted_tasks:
+            raise typer.Exit(1)
+
 
 @app.command()
+@catch_barely
 def edit(
     task_id: int = typer.Argument(..., help="Task ID to edit"),
     new_title: str = typer.Argument(..., help="New task title"),
@@ -419,9 +401,6 @@ def edit(
     except InvalidInputError as e:
         error_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
 
 
 @app.command()
@@ -574,6 +553,7 @@ def show(
 
 
 @app.command()
+@catch_barely
 def mv(
     task_id: int = typer.Argument(..., help="Task ID to move"),
     column_name: str = typer.Argument(..., help="Target column name (e.g., 'Todo', 'In Progress', 'Done')"),
@@ -611,12 +591,10 @@ def mv(
     except ColumnNotFoundError as e:
         error_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
 
 
 @app.command()
+@catch_barely
 def assign(
     task_id: int = typer.Argument(..., help="Task ID to assign"),
     project_name: str = typer.Argument(..., help="Project name"),
@@ -654,6 +632,3 @@ def assign(
     except ProjectNotFoundError as e:
         error_console.print(f"[red]Error:[/red] {e}")
         raise typer.Exit(1)
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
@@ -3,21 +3,32 @@ FILE: barely/cli/commands/workflow.py
 PURPOSE: Workflow commands (today, week, backlog, archive, pull)
 """
 
-import json
 from typing import Optional
 
 import typer
-from rich.table import Table
 
-from ..main import app, console, error_console
+from ..main import app, catch_barely, console, error_console, make_table, ordered_id_errors, parse_id_list, parse_since, stream_json_array
 from ...core import service
-from ...core.exceptions import (
-    BarelyError,
-    TaskNotFoundError,
-    InvalidInputError,
+from ...core.constants import ACTIVE_SCOPE_SET, ACTIVE_SCOPES_TEXT
+from ...core.exceptions import TaskNotFoundError
+
+# Table schemas: (header, style, no_wrap)
+_TASK_COLUMNS = (
+    ("ID", "cyan", True),
+    ("Status", "magenta", False),
+    ("Title", "white", False),
+    ("Column", "blue", False),
 )
+_ARCHIVE_COLUMNS = (
+    ("ID", "cyan", True),
+    ("Title", "white", False),
+    ("Scope", "blue", False),
+    ("Completed", "dim", False),
+)
+
 
 @app.command()
+@catch_barely
 def today(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     raw: bool = typer.Option(False, "--raw", help="Plain text output (no colors)"),
@@ -31,66 +42,57 @@ def today(
         barely today
         barely today --json
     """
-    try:
-        tasks = service.list_today()
-
-        if json_output:
-            # Output as JSON array
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status,
-                    "scope": t.scope,
-                    "column_id": t.column_id,
-                    "project_id": t.project_id,
-                    "created_at": t.created_at,
-                    "completed_at": t.completed_at,
-                    "updated_at": t.updated_at,
-                }
-                for t in tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-
-        elif raw:
-            # Plain text, one per line
-            for task in tasks:
-                status_marker = "✓" if task.scope == "archived" else " "
-                console.print(f"{task.id}: [{status_marker}] {task.title}")
-
-        else:
-            # Rich table output
-            if not tasks:
-                console.print("[dim]No tasks for today[/dim]")
-                console.print("[dim]Use 'barely pull <task_id> today' to add tasks[/dim]")
-                return
-
-            table = Table(title="Today's Tasks")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Status", style="magenta")
-            table.add_column("Title", style="white")
-            table.add_column("Column", style="blue")
-
-            for task in tasks:
-                status_display = "✓" if task.scope == "archived" else "○"
-                status_style = "green" if task.scope == "archived" else "yellow"
-
-                table.add_row(
-                    str(task.id),
-                    f"[{status_style}]{status_display}[/{status_style}]",
-                    task.title,
-                    str(task.column_id),
-                )
-
-            console.print(table)
-            console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    tasks = service.list_today()
+
+    if json_output:
+        # Output as JSON array
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "scope": t.scope,
+                "column_id": t.column_id,
+                "project_id": t.project_id,
+                "created_at": t.created_at,
+                "completed_at": t.completed_at,
+                "updated_at": t.updated_at,
+            }
+            for t in tasks
+        )
+
+    elif raw:
+        # Plain text, one per line
+        for task in tasks:
+            status_marker = "✓" if task.scope == "archived" else " "
+            console.print(f"{task.id}: [{status_marker}] {task.title}")
+
+    else:
+        # Rich table output
+        if not tasks:
+            console.print("[dim]No tasks for today[/dim]")
+            console.print("[dim]Use 'barely pull <task_id> today' to add tasks[/dim]")
+            return
+
+        table = make_table("Today's Tasks", _TASK_COLUMNS)
+
+        for task in tasks:
+            status_display = "✓" if task.scope == "archived" else "○"
+            status_style = "green" if task.scope == "archived" else "yellow"
+
+            table.add_row(
+                str(task.id),
+                f"[{status_style}]{status_display}[/{status_style}]",
+                task.title,
+                str(task.column_id),
+            )
+
+        console.print(table)
+        console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
 
 
 @app.command()
+@catch_barely
 def week(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     raw: bool = typer.Option(False, "--raw", help="Plain text output (no colors)"),
@@ -104,66 +106,57 @@ def week(
         barely week
         barely week --json
     """
-    try:
-        tasks = service.list_week()
-
-        if json_output:
-            # Output as JSON array
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status,
-                    "scope": t.scope,
-                    "column_id": t.column_id,
-                    "project_id": t.project_id,
-                    "created_at": t.created_at,
-                    "completed_at": t.completed_at,
-                    "updated_at": t.updated_at,
-                }
-                for t in tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-
-        elif raw:
-            # Plain text, one per line
-            for task in tasks:
-                status_marker = "✓" if task.scope == "archived" else " "
-                console.print(f"{task.id}: [{status_marker}] {task.title}")
-
-        else:
-            # Rich table output
-            if not tasks:
-                console.print("[dim]No tasks for this week[/dim]")
-                console.print("[dim]Use 'barely pull <task_id> week' to add tasks[/dim]")
-                return
-
-            table = Table(title="This Week's Tasks")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Status", style="magenta")
-            table.add_column("Title", style="white")
-            table.add_column("Column", style="blue")
-
-            for task in tasks:
-                status_display = "✓" if task.scope == "archived" else "○"
-                status_style = "green" if task.scope == "archived" else "yellow"
-
-                table.add_row(
-                    str(task.id),
-                    f"[{status_style}]{status_display}[/{status_style}]",
-                    task.title,
-                    str(task.column_id),
-                )
-
-            console.print(table)
-            console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    tasks = service.list_week()
+
+    if json_output:
+        # Output as JSON array
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "scope": t.scope,
+                "column_id": t.column_id,
+                "project_id": t.project_id,
+                "created_at": t.created_at,
+                "completed_at": t.completed_at,
+                "updated_at": t.updated_at,
+            }
+            for t in tasks
+        )
+
+    elif raw:
+        # Plain text, one per line
+        for task in tasks:
+            status_marker = "✓" if task.scope == "archived" else " "
+            console.print(f"{task.id}: [{status_marker}] {task.title}")
+
+    else:
+        # Rich table output
+        if not tasks:
+            console.print("[dim]No tasks for this week[/dim]")
+            console.print("[dim]Use 'barely pull <task_id> week' to add tasks[/dim]")
+            return
+
+        table = make_table("This Week's Tasks", _TASK_COLUMNS)
+
+        for task in tasks:
+            status_display = "✓" if task.scope == "archived" else "○"
+            status_style = "green" if task.scope == "archived" else "yellow"
+
+            table.add_row(
+                str(task.id),
+                f"[{status_style}]{status_display}[/{status_style}]",
+                task.title,
+                str(task.column_id),
+            )
+
+        console.print(table)
+        console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
 
 
 @app.command()
+@catch_barely
 def backlog(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     raw: bool = typer.Option(False, "--raw", help="Plain text output (no colors)"),
@@ -177,66 +170,60 @@ def backlog(
         barely backlog
         barely backlog --json
     """
-    try:
-        tasks = service.list_backlog()
-
-        if json_output:
-            # Output as JSON array
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status,
-                    "scope": t.scope,
-                    "column_id": t.column_id,
-                    "project_id": t.project_id,
-                    "created_at": t.created_at,
-                    "completed_at": t.completed_at,
-                    "updated_at": t.updated_at,
-                }
-                for t in tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-
-        elif raw:
-            # Plain text, one per line
-            for task in tasks:
-                status_marker = "✓" if task.scope == "archived" else " "
-                console.print(f"{task.id}: [{status_marker}] {task.title}")
-
-        else:
-            # Rich table output
-            if not tasks:
-                console.print("[dim]Backlog is empty[/dim]")
-                return
-
-            table = Table(title="Backlog")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Status", style="magenta")
-            table.add_column("Title", style="white")
-            table.add_column("Column", style="blue")
-
-            for task in tasks:
-                status_display = "✓" if task.scope == "archived" else "○"
-                status_style = "green" if task.scope == "archived" else "yellow"
-
-                table.add_row(
-                    str(task.id),
-                    f"[{status_style}]{status_display}[/{status_style}]",
-                    task.title,
-                    str(task.column_id),
-                )
-
-            console.print(table)
-            console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    tasks = service.list_backlog()
+
+    if json_output:
+        # Output as JSON array
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "scope": t.scope,
+                "column_id": t.column_id,
+                "project_id": t.project_id,
+                "created_at": t.created_at,
+                "completed_at": t.completed_at,
+                "updated_at": t.updated_at,
+            }
+            for t in tasks
+        )
+
+    elif raw:
+        # Plain text, one per line
+        for task in tasks:
+            status_marker = "✓" if task.scope == "archived" else " "
+            console.print(f"{task.id}: [{status_marker}] {task.title}")
+
+    else:
+        # Rich table output
+        if not tasks:
+            console.print("[dim]Backlog is empty[/dim]")
+            return
+
+        table = make_table("Backlog", _TASK_COLUMNS)
+
+        for task in tasks:
+            status_display = "✓" if task.scope == "archived" else "○"
+            status_style = "green" if task.scope == "archived" else "yellow"
+
+            table.add_row(
+                str(task.id),
+                f"[{status_style}]{status_display}[/{status_style}]",
+                task.title,
+                str(task.column_id),
+            )
+
+        console.print(table)
+        console.print(f"\n[dim]Total: {len(tasks)} task(s)[/dim]")
 
 
 @app.command()
+@catch_barely
 def archive(
+    since: str = typer.Option(
+        "30d", "--since", help="Only tasks completed within this window (30d, 2w, 12h, a date, or 'all')"
+    ),
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
     raw: bool = typer.Option(False, "--raw", help="Plain text output (no colors)"),
 ):
@@ -244,71 +231,64 @@ def archive(
     View archived/completed tasks.
 
     Shows tasks that have been marked as done and moved to archived scope.
+    Defaults to the last 30 days; use --since all for the full history.
     You can reactivate tasks by pulling them back: 'pull <id> backlog'.
 
     Example:
         barely archive
-        barely archive --json
+        barely archive --since 7d
+        barely archive --since all --json
     """
-    try:
-        tasks = service.list_completed()
-
-        if json_output:
-            # Output as JSON array
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "status": t.status,
-                    "scope": t.scope,
-                    "column_id": t.column_id,
-                    "project_id": t.project_id,
-                    "created_at": t.created_at,
-                    "completed_at": t.completed_at,
-                    "updated_at": t.updated_at,
-                }
-                for t in tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-
-        elif raw:
-            # Plain text, one per line
-            for task in tasks:
-                console.print(f"{task.id}: [✓] {task.title}")
-
-        else:
-            # Rich table output
-            if not tasks:
-                console.print("[dim]No archived tasks[/dim]")
-                return
-
-            table = Table(title="Archive")
-            table.add_column("ID", style="cyan", no_wrap=True)
-            table.add_column("Title", style="white")
-            table.add_column("Scope", style="blue")
-            table.add_column("Completed", style="dim")
-
-            for task in tasks:
-                # Get scope color
-                scope_color = "bright_magenta" if task.scope == "today" else "blue" if task.scope == "week" else "dim"
-
-                table.add_row(
-                    str(task.id),
-                    task.title,
-                    f"[{scope_color}]{task.scope}[/{scope_color}]",
-                    task.completed_at or task.updated_at or "",
-                )
-
-            console.print(table)
-            console.print(f"\n[dim]Total: {len(tasks)} completed task(s)[/dim]")
-            console.print(f"[dim]Tip: Use 'barely mv <id> Todo' to reopen a task[/dim]")
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    tasks = service.list_completed(since=parse_since(since))
+
+    if json_output:
+        # Output as JSON array
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "status": t.status,
+                "scope": t.scope,
+                "column_id": t.column_id,
+                "project_id": t.project_id,
+                "created_at": t.created_at,
+                "completed_at": t.completed_at,
+                "updated_at": t.updated_at,
+            }
+            for t in tasks
+        )
+
+    elif raw:
+        # Plain text, one per line
+        for task in tasks:
+            console.print(f"{task.id}: [✓] {task.title}")
+
+    else:
+        # Rich table output
+        if not tasks:
+            console.print("[dim]No archived tasks[/dim]")
+            return
+
+        table = make_table("Archive", _ARCHIVE_COLUMNS)
+
+        for task in tasks:
+            # Get scope color
+            scope_color = "bright_magenta" if task.scope == "today" else "blue" if task.scope == "week" else "dim"
+
+            table.add_row(
+                str(task.id),
+                task.title,
+                f"[{scope_color}]{task.scope}[/{scope_color}]",
+                task.display_time,
+            )
+
+        console.print(table)
+        console.print(f"\n[dim]Total: {len(tasks)} completed task(s)[/dim]")
+        console.print(f"[dim]Tip: Use 'barely mv <id> Todo' to reopen a task[/dim]")
 
 
 @app.command()
+@catch_barely
 def pull(
     task_ids: str = typer.Argument(..., help="Task ID(s) to pull (comma-separated)"),
     scope: str = typer.Argument(..., help="Target scope: 'backlog', 'week', or 'today'"),
@@ -328,66 +308,53 @@ def pull(
         barely pull 3,5,7 week       # Pull multiple tasks into week
         barely pull 10 backlog       # Defer task back to backlog
     """
-    try:
-        # Validate scope
-        valid_scopes = ("backlog", "week", "today")
-        if scope not in valid_scopes:
-            error_console.print(
-                f"[red]Error:[/red] Invalid scope '{scope}'. "
-                f"Must be one of: {', '.join(valid_scopes)}"
+    # Validate scope
+    if scope not in ACTIVE_SCOPE_SET:
+        error_console.print(
+            f"[red]Error:[/red] Invalid scope '{scope}'. "
+            f"Must be one of: {ACTIVE_SCOPES_TEXT}"
+        )
+        raise typer.Exit(1)
+
+    # Parse comma-separated IDs (bad entries become errors, not aborts)
+    valid_ids, errors = parse_id_list(task_ids, "task")
+    pulled_tasks = []
+
+    if valid_ids:
+        # One transaction; IDs that don't exist are skipped and reported
+        pulled_tasks = service.pull_tasks(valid_ids, scope, skip_missing=True)
+        pulled_ids = {t.id for t in pulled_tasks}
+        missing = {i: str(TaskNotFoundError(i)) for i in valid_ids if i not in pulled_ids}
+        if missing:
+            # Report bad and missing IDs in the order they were given
+            errors = ordered_id_errors(task_ids, missing, "task")
+
+    # Display results
+    if json_output:
+        stream_json_array(
+            {
+                "id": t.id,
+                "title": t.title,
+                "scope": t.scope,
+                "status": t.status,
+            }
+            for t in pulled_tasks
+        )
+    elif raw:
+        for task in pulled_tasks:
+            console.print(f"Pulled task {task.id} into {scope}: {task.title}")
+    else:
+        scope_emoji = {"backlog": "📋", "week": "📅", "today": "⭐"}
+        for task in pulled_tasks:
+            console.print(
+                f"[blue]{scope_emoji.get(scope, '→')}[/blue] "
+                f"Pulled task {task.id} into [cyan]{scope}[/cyan]: {task.title}"
             )
-            raise typer.Exit(1)
 
-        # Parse comma-separated IDs
-        ids = [id.strip() for id in task_ids.split(",")]
-        pulled_tasks = []
-        errors = []
-
-        for id_str in ids:
-            try:
-                task_id = int(id_str)
-                task = service.pull_task(task_id, scope)
-                pulled_tasks.append(task)
-            except ValueError:
-                errors.append(f"Invalid task ID: {id_str}")
-            except TaskNotFoundError as e:
-                errors.append(str(e))
-            except InvalidInputError as e:
-                errors.append(str(e))
-            except BarelyError as e:
-                errors.append(f"Error with task {id_str}: {e}")
-
-        # Display results
-        if json_output:
-            tasks_data = [
-                {
-                    "id": t.id,
-                    "title": t.title,
-                    "scope": t.scope,
-                    "status": t.status,
-                }
-                for t in pulled_tasks
-            ]
-            console.print(json.dumps(tasks_data, indent=2))
-        elif raw:
-            for task in pulled_tasks:
-                console.print(f"Pulled task {task.id} into {scope}: {task.title}")
-        else:
-            scope_emoji = {"backlog": "📋", "week": "📅", "today": "⭐"}
-            for task in pulled_tasks:
-                console.print(
-                    f"[blue]{scope_emoji.get(scope, '→')}[/blue] "
-                    f"Pulled task {task.id} into [cyan]{scope}[/cyan]: {task.title}"
-                )
-
-        # Show errors if any
-        if errors:
-            for error in errors:
-                error_console.print(f"[red]Error:[/red] {error}")
-            if not pulled_tasks:
-                raise typer.Exit(1)
-
-    except BarelyError as e:
-        error_console.print(f"[red]Unexpected error:[/red] {e}")
-        raise typer.Exit(1)
+    # Show errors if any
+    if errors:
+        for error in errors:
+            error_console.print(f"[red]Error:[/red] {error}")
+        if not pulled_tasks:
+            raise typer.Exit(1)
 
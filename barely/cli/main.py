@@ -4,6 +4,12 @@ PURPOSE: Typer-based CLI for one-shot task management commands
 EXPORTS:
   - app (Typer application)
   - main() (entry point)
+  - stream_json_array(items) - Write JSON array to stdout without buffering it
+  - make_table(title, columns) - Build Rich Table from a column schema
+  - parse_id_list(id_string, kind) -> (valid_ids, errors)
+  - ordered_id_errors(id_string, failed, kind) -> errors in the order IDs were given
+  - catch_barely(fn) - Decorator turning uncaught BarelyError into exit code 1
+  - parse_since(value) -> Optional[str] - "30d"/"2w"/"12h"/date/"all" to ISO cutoff
   - version() - Show version
   - help() - Show command list and usage
   - repl() - Launch interactive REPL
@@ -35,13 +41,16 @@ DEPENDENCIES:
 NOTES:
   - All commands support --json and --raw flags
   - Error messages go to stderr
-  - Exit codes: 0=success, 1=error
+  - Exit codes: 0=success, 1=error (uncaught BarelyError handled by catch_barely)
+  - JSON list output bypasses Rich (no markup scanning or wrapping)
   - Calls service layer directly (no repository access except column/project name lookup)
 """
 
 import sys
 import json
-from typing import Optional
+import functools
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 # Fix Windows console encoding for Unicode characters
 if sys.platform == "win32":
@@ -85,6 +94,164 @@ error_console = Console(stderr=True)
 __version__ = "0.3.0"
 
 
+def catch_barely(fn):
+    """
+    Report any BarelyError escaping a command and exit with code 1.
+
+    Apply under @app.command() so every command shares one handler instead
+    of repeating the same except block. Commands still catch specific errors
+    themselves when they want a different message.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return fn(*args, **kwargs)
+        except BarelyError as e:
+            error_console.print(f"[red]Unexpected error:[/red] {e}")
+            raise typer.Exit(1)
+
+    return wrapper
+
+
+def stream_json_array(items: Iterable[Dict[str, Any]]) -> None:
+    """
+    Write an iterable of dicts to stdout as a JSON array.
+
+    Args:
+        items: Dicts to serialize (a generator is fine - never materialized)
+
+    Notes:
+        - Byte-for-byte identical to json.dumps(list(items), indent=2)
+        - Writes straight to sys.stdout.buffer, so Rich never scans the JSON
+          for markup or wraps long lines
+        - Flushes once at the end
+    """
+    # Flush any pending text output so bytes don't interleave out of order
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+
+    first = True
+    for item in items:
+        # Indent each element one level to match json.dumps(..., indent=2)
+        chunk = json.dumps(item, indent=2).replace("\n", "\n  ")
+        out.write(("[\n  " if first else ",\n  ").encode("utf-8"))
+        out.write(chunk.encode("utf-8"))
+        first = False
+
+    out.write(b"[]\n" if first else b"\n]\n")
+    out.flush()
+
+
+def make_table(title: str, columns: Sequence[Tuple[str, str, bool]]) -> Table:
+    """
+    Build an empty Rich table from a column schema.
+
+    Args:
+        title: Table title
+        columns: (header, style, no_wrap) tuples, defined once at module scope
+
+    Returns:
+        Rich Table with columns added, ready for add_row()
+    """
+    table = Table(title=title)
+    for header, style, no_wrap in columns:
+        table.add_column(header, style=style, no_wrap=no_wrap)
+    return table
+
+
+def parse_id_list(id_string: str, kind: str = "task") -> Tuple[List[int], List[str]]:
+    """
+    Parse comma-separated IDs in a single pass.
+
+    Args:
+        id_string: Comma-separated IDs (e.g., "3, 5,7")
+        kind: Entity name used in error messages ("task", "project")
+
+    Returns:
+        (valid_ids, errors) - unique ints in first-seen order, plus one
+        message per bad entry
+
+    Notes:
+        - int() tolerates surrounding whitespace, so entries are only
+          stripped when building an error message
+        - Repeated IDs ("1,1,2") are kept once, so bulk commands never
+          act on (or report) the same entity twice
+    """
+    valid_ids = {}
+    errors = []
+    for part in id_string.split(","):
+        try:
+            valid_ids[int(part)] = None
+        except ValueError:
+            errors.append(f"Invalid {kind} ID: {part.strip()}")
+    return list(valid_ids), errors
+
+
+def ordered_id_errors(id_string: str, failed: Dict[int, str], kind: str = "task") -> List[str]:
+    """
+    Merge parse errors and per-ID failures back into input order.
+
+    Args:
+        id_string: Comma-separated IDs, as passed to parse_id_list()
+        failed: Error message per ID that parsed but then failed (e.g. not found)
+        kind: Entity name used in parse error messages ("task", "project")
+
+    Returns:
+        One message per bad entry, in the order the user typed the IDs
+
+    Notes:
+        - Bulk commands act on all valid IDs at once, so failures are only
+          known afterwards; this re-walks the input to report them where
+          the baseline per-ID loop did. Only needed when something failed.
+    """
+    errors = []
+    for part in id_string.split(","):
+        try:
+            entity_id = int(part)
+        except ValueError:
+            errors.append(f"Invalid {kind} ID: {part.strip()}")
+            continue
+        message = failed.pop(entity_id, None)
+        if message is not None:
+            errors.append(message)
+    return errors
+
+
+# Unit suffixes accepted by parse_since()
+_SINCE_UNITS = {"h": "hours", "d": "days", "w": "weeks"}
+
+
+def parse_since(value: str) -> Optional[str]:
+    """
+    Convert a --since option into an ISO-8601 cutoff timestamp.
+
+    Args:
+        value: Relative window ("12h", "30d", "2w"), an ISO date
+            ("2025-01-31"), or "all" for no cutoff
+
+    Returns:
+        ISO-8601 timestamp string, or None for "all"
+
+    Raises:
+        typer.BadParameter: If value can't be parsed
+    """
+    value = value.strip().lower()
+    if value == "all":
+        return None
+
+    unit = _SINCE_UNITS.get(value[-1:])
+    if unit and value[:-1].isdigit():
+        cutoff = datetime.now() - timedelta(**{unit: int(value[:-1])})
+        return cutoff.isoformat()
+
+    try:
+        return datetime.fromisoformat(value).isoformat()
+    except ValueError:
+        raise typer.BadParameter(
+            f"'{value}' is not a window like 30d/2w/12h, a date, or 'all'"
+        )
+
+
 @app.callback(invoke_without_command=True)
 def default_command(ctx: typer.Context):
     """
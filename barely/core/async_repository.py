@@ -0,0 +1,146 @@
+"""
+FILE: barely/core/async_repository.py
+PURPOSE: Async facade over the repository for concurrent callers
+EXPORTS:
+  - get_task(task_id) -> Task | None
+  - list_tasks() -> List[Task]
+  - list_tasks_by_scope(scope) -> List[Task]
+  - list_completed_tasks(since) -> List[Task]
+  - get_project(project_id) -> Project | None
+  - list_projects() -> List[Project]
+  - get_column(column_id) -> Column | None
+  - list_columns() -> List[Column]
+  - create_task(title, column_id, project_id, scope, description) -> Task
+  - update_task(task) -> None
+  - update_task_scope(task_id, scope) -> Task
+  - delete_task(task_id) -> None
+  - move_task(task_id, column_id) -> Task
+  - create_project(name) -> Project
+  - delete_project(project_id) -> None
+DEPENDENCIES:
+  - asyncio (stdlib)
+  - threading (stdlib)
+  - barely.core.repository (sync implementations)
+NOTES:
+  - Every function awaits the sync repository call via asyncio.to_thread
+  - Worker threads each hold their own cached connection (repository is
+    per-thread), so reads run in parallel under WAL
+  - Reads are capped at MAX_READERS concurrent calls; writes go through a
+    single lock so only one writer ever waits on SQLite's write lock
+  - Same exceptions as the sync repository (TaskNotFoundError, etc.)
+"""
+
+import asyncio
+import threading
+from typing import List, Optional
+
+from . import repository
+from .models import Task, Project, Column
+
+
+# Concurrent read calls allowed at once (each on its own thread/connection)
+MAX_READERS = 4
+
+_readers = threading.BoundedSemaphore(MAX_READERS)
+_writer = threading.Lock()
+
+
+def _guarded(lock, fn, *args):
+    """Run fn(*args) while holding lock (called on a worker thread)."""
+    with lock:
+        return fn(*args)
+
+
+async def _read(fn, *args):
+    return await asyncio.to_thread(_guarded, _readers, fn, *args)
+
+
+async def _write(fn, *args):
+    return await asyncio.to_thread(_guarded, _writer, fn, *args)
+
+
+# --- Reads ---
+
+
+async def get_task(task_id: int) -> Optional[Task]:
+    """Fetch single task by ID."""
+    return await _read(repository.get_task, task_id)
+
+
+async def list_tasks() -> List[Task]:
+    """List all tasks, newest first."""
+    return await _read(repository.list_tasks)
+
+
+async def list_tasks_by_scope(scope: str) -> List[Task]:
+    """List tasks in a scope, newest first."""
+    return await _read(repository.list_tasks_by_scope, scope)
+
+
+async def list_completed_tasks(since: Optional[str] = None) -> List[Task]:
+    """List archived tasks, optionally completed at or after since."""
+    return await _read(repository.list_completed_tasks, since)
+
+
+async def get_project(project_id: int) -> Optional[Project]:
+    """Fetch single project by ID."""
+    return await _read(repository.get_project, project_id)
+
+
+async def list_projects() -> List[Project]:
+    """List all projects, newest first."""
+    return await _read(repository.list_projects)
+
+
+async def get_column(column_id: int) -> Optional[Column]:
+    """Fetch single column by ID."""
+    return await _read(repository.get_column, column_id)
+
+
+async def list_columns() -> List[Column]:
+    """List all columns by position."""
+    return await _read(repository.list_columns)
+
+
+# --- Writes ---
+
+
+async def create_task(
+    title: str,
+    column_id: int,
+    project_id: Optional[int] = None,
+    scope: str = "backlog",
+    description: Optional[str] = None,
+) -> Task:
+    """Create a new task."""
+    return await _write(repository.create_task, title, column_id, project_id, scope, description)
+
+
+async def update_task(task: Task) -> None:
+    """Update existing task."""
+    await _write(repository.update_task, task)
+
+
+async def update_task_scope(task_id: int, scope: str) -> Task:
+    """Pull task into a different scope."""
+    return await _write(repository.update_task_scope, task_id, scope)
+
+
+async def delete_task(task_id: int) -> None:
+    """Delete task by ID."""
+    await _write(repository.delete_task, task_id)
+
+
+async def move_task(task_id: int, column_id: int) -> Task:
+    """Move task to a different column."""
+    return await _write(repository.move_task, task_id, column_id)
+
+
+async def create_project(name: str) -> Project:
+    """Create a new project."""
+    return await _write(repository.create_project, name)
+
+
+async def delete_project(project_id: int) -> None:
+    """Delete project by ID."""
+    await _write(repository.delete_project, project_id)
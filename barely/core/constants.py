@@ -4,6 +4,8 @@ PURPOSE: Constants used throughout the application
 EXPORTS:
   - VALID_SCOPES: All valid scope values
   - ACTIVE_SCOPES: Scopes for active (non-archived) tasks
+  - VALID_SCOPE_SET, ACTIVE_SCOPE_SET: The same, as frozensets for membership checks
+  - VALID_SCOPES_TEXT, ACTIVE_SCOPES_TEXT: The same, joined for messages
   - DEFAULT_SCOPE: Default scope for new tasks
   - DEFAULT_COLUMN_ID: Default column ID for new tasks
 DEPENDENCIES:
@@ -22,6 +24,14 @@ SCOPE_WEEK = "week"
 SCOPE_TODAY = "today"
 SCOPE_ARCHIVED = "archived"
 
+# Sets for "scope in ..." validation; the tuples above keep display order
+VALID_SCOPE_SET = frozenset(VALID_SCOPES)
+ACTIVE_SCOPE_SET = frozenset(ACTIVE_SCOPES)
+
+# Scope lists as shown in error/help messages (joined once, not per error)
+VALID_SCOPES_TEXT = ", ".join(VALID_SCOPES)
+ACTIVE_SCOPES_TEXT = ", ".join(ACTIVE_SCOPES)
+
 # Default values
 DEFAULT_COLUMN_ID = 1
 
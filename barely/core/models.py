@@ -10,18 +10,23 @@ DEPENDENCIES:
   - json (stdlib)
   - typing (stdlib)
 NOTES:
-  - All models have from_row() for SQLite row conversion
   - All models have to_json() for serialization
   - Optional fields use None as default
   - Timestamps stored as ISO-8601 strings
+  - Task.display_time is query-derived (history views), never persisted
+  - Field order is load-bearing: the repository builds models positionally
+    from rows selected in this order (repository._TASK_FIELDS etc.); there
+    is no name-based row conversion
+  - slots=True: no per-instance __dict__ (list views build thousands of
+    these), so attributes outside the declared fields can't be set
 """
 
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from typing import Optional
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A task with title, description, and workflow tracking."""
 
@@ -35,35 +40,18 @@ class Task:
     created_at: Optional[str] = None
     completed_at: Optional[str] = None
     updated_at: Optional[str] = None
-
-    @classmethod
-    def from_row(cls, row) -> "Task":
-        """Convert SQLite row to Task object."""
-        # Handle scope field with backwards compatibility
-        try:
-            scope = row["scope"]
-        except (KeyError, IndexError):
-            scope = "backlog"  # Default for old databases without scope field
-
-        return cls(
-            id=row["id"],
-            title=row["title"],
-            description=row["description"],
-            project_id=row["project_id"],
-            column_id=row["column_id"],
-            status=row["status"],
-            scope=scope,
-            created_at=row["created_at"],
-            completed_at=row["completed_at"],
-            updated_at=row["updated_at"],
-        )
+    # Derived in SQL by history queries (completed_at, else updated_at);
+    # not persisted and not part of the JSON form
+    display_time: Optional[str] = field(default=None, repr=False, compare=False)
 
     def to_json(self) -> str:
         """Serialize task to JSON string."""
-        return json.dumps(asdict(self), indent=2)
+        data = asdict(self)
+        del data["display_time"]
+        return json.dumps(data, indent=2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project for organizing related tasks."""
 
@@ -71,21 +59,12 @@ class Project:
     name: str
     created_at: Optional[str] = None
 
-    @classmethod
-    def from_row(cls, row) -> "Project":
-        """Convert SQLite row to Project object."""
-        return cls(
-            id=row["id"],
-            name=row["name"],
-            created_at=row["created_at"],
-        )
-
     def to_json(self) -> str:
         """Serialize project to JSON string."""
         return json.dumps(asdict(self), indent=2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Column:
     """A workflow column (e.g., Todo, In Progress, Done)."""
 
@@ -93,15 +72,6 @@ class Column:
     name: str
     position: int = 0
 
-    @classmethod
-    def from_row(cls, row) -> "Column":
-        """Convert SQLite row to Column object."""
-        return cls(
-            id=row["id"],
-            name=row["name"],
-            position=row["position"],
-        )
-
     def to_json(self) -> str:
         """Serialize column to JSON string."""
         return json.dumps(asdict(self), indent=2)
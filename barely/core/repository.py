@@ -3,16 +3,35 @@ FILE: barely/core/repository.py
 PURPOSE: Database operations and SQLite connection management
 EXPORTS:
   - get_connection() -> Connection
+  - close_connection() -> None
+  - transaction() -> ContextManager[Connection]
+  - operation() -> ContextManager[None]
   - init_database() -> None
+  - data_generation() -> Tuple[Path, int, int]
   - create_task(title, column_id, project_id, scope) -> Task
+  - create_tasks(items) -> List[Task]
   - get_task(task_id) -> Task | None
-  - list_tasks() -> List[Task]
-  - list_tasks_by_scope(scope) -> List[Task]
+  - list_tasks(project_id, column_id, include_archived) -> List[Task]
+  - iter_tasks(project_id, column_id, include_archived) -> Iterator[Task]
+  - list_tasks_full(scope) -> List[Tuple[Task, str | None, str | None]]
+  - list_tasks_by_scope(scope, project_id) -> List[Task]
+  - iter_tasks_by_scope(scope, limit, project_id) -> Iterator[Task]
+  - list_completed_tasks(since, project_id) -> List[Task]
   - update_task(task) -> None
   - update_task_scope(task_id, scope) -> Task
+  - update_tasks_scope(task_ids, scope, skip_missing) -> List[Task]
+  - complete_task(task_id, completed_at) -> Task
+  - complete_tasks(task_ids, completed_at, skip_missing) -> List[Task]
+  - reopen_task(task_id, scope, completed_at) -> Task
+  - update_task_title(task_id, title) -> Task
+  - update_task_description(task_id, description) -> Task
+  - update_task_project(task_id, project_id) -> Task
   - delete_task(task_id) -> None
   - create_project(name) -> Project
+  - create_projects(names) -> List[Project]
   - get_project(project_id) -> Project | None
+  - get_projects_by_ids(project_ids) -> List[Project]
+  - get_project_by_name(name) -> Project | None
   - list_projects() -> List[Project]
   - delete_project(project_id) -> None
   - create_column(name, position) -> Column
@@ -20,24 +39,49 @@ EXPORTS:
   - get_column_by_name(name) -> Column | None
   - list_columns() -> List[Column]
   - move_task(task_id, column_id) -> Task
+  - move_tasks(task_ids, column_id) -> List[Task]
 DEPENDENCIES:
   - sqlite3 (stdlib)
+  - threading (stdlib, per-thread connection cache)
+  - contextlib (stdlib, transaction())
+  - functools (stdlib, schema text and SQL text caches)
+  - operator (stdlib, task cache rows)
+  - os, sys (stdlib, BARELY_PROFILE_SQL query-plan logging)
   - pathlib (stdlib)
-  - datetime (stdlib)
   - barely.core.models (Task, Project, Column)
   - barely.core.exceptions (TaskNotFoundError, ProjectNotFoundError, ColumnNotFoundError)
 NOTES:
   - Database stored at ~/.barely/barely.db
   - Auto-creates directory and initializes schema on first run
+  - One cached connection per thread (WAL, synchronous=NORMAL, 5s busy_timeout)
+  - Each write commits on its own unless wrapped in transaction()
   - Returns domain objects (Task, etc.), never raw dicts
-  - Uses row_factory for dict-like row access
+  - Reads build models positionally via per-cursor row factories
+  - Columns and found projects are cached in-process per database
+    (list_columns, get_column_by_name, get_project)
+  - get_task() is served from a bounded task-row cache that writes keep
+    current and that is dropped when another connection commits
+  - Other connections' commits are checked for (PRAGMA data_version) once
+    per operation() or transaction() block, or per lookup outside one
+  - data_generation() changes on any write (this process or another
+    connection), for callers that cache query results
+  - created_at/updated_at are stamped in SQL (_SQL_NOW), not in Python
+  - BARELY_PROFILE_SQL=1 prints EXPLAIN QUERY PLAN for each distinct query
+    to stderr, flagging full table scans (development aid)
+  - Writes use RETURNING on SQLite 3.35+ to skip the re-fetch SELECT
+  - SQL lives in module-level _SQL_* constants (prepared-statement cache hits)
   - Scope field enables pull-based workflow (backlog -> week -> today)
 """
 
+import functools
+import operator
+import os
 import sqlite3
+import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 from .models import Task, Project, Column
 from .exceptions import TaskNotFoundError, ProjectNotFoundError, ColumnNotFoundError
@@ -50,38 +94,472 @@ DB_PATH = DB_DIR / "barely.db"
 # Schema file location (relative to this file)
 SCHEMA_PATH = Path(__file__).parent.parent.parent / "db" / "schema.sql"
 
+# Indexes added after the original schema, as (name, CREATE statement).
+# Checked once per process by init_database() so existing databases pick
+# them up without a manual migration.
+INDEX_MIGRATIONS = (
+    # Archive view: display_time (the COALESCE expression) >= ? and
+    # ORDER BY display_time read straight off the index, no temp B-tree sort
+    ("idx_tasks_scope_display",
+     "CREATE INDEX IF NOT EXISTS idx_tasks_scope_display "
+     "ON tasks(scope, COALESCE(completed_at, updated_at, '') DESC, created_at DESC)"),
+    # Scope views: scope = ? ORDER BY created_at DESC, id DESC as one
+    # ordered range read (id breaks ties between same-timestamp rows)
+    ("idx_tasks_scope_created_id",
+     "CREATE INDEX IF NOT EXISTS idx_tasks_scope_created_id "
+     "ON tasks(scope, created_at DESC, id DESC)"),
+    # Column-filtered views, same shape
+    ("idx_tasks_column_created_id",
+     "CREATE INDEX IF NOT EXISTS idx_tasks_column_created_id "
+     "ON tasks(column_id, created_at DESC, id DESC)"),
+    # Project-filtered views: project_id = ? ORDER BY created_at DESC, id DESC
+    ("idx_tasks_project_created_id",
+     "CREATE INDEX IF NOT EXISTS idx_tasks_project_created_id "
+     "ON tasks(project_id, created_at DESC, id DESC)"),
+    # list_projects(): ORDER BY created_at DESC, id DESC without a sort
+    ("idx_projects_created_id",
+     "CREATE INDEX IF NOT EXISTS idx_projects_created_id ON projects(created_at DESC, id DESC)"),
+    # Case-insensitive project lookup by name (get_project_by_name)
+    ("idx_projects_name_nocase",
+     "CREATE INDEX IF NOT EXISTS idx_projects_name_nocase ON projects(name COLLATE NOCASE)"),
+)
+
+# Earlier INDEX_MIGRATIONS entries no query uses any more: the archive window
+# moved onto idx_tasks_scope_display, and the *_created indexes were replaced
+# by *_created_id ones carrying the id tiebreak. Dropped by init_database()
+# so existing databases don't keep maintaining them on every write.
+RETIRED_INDEXES = (
+    "idx_tasks_scope_completed",
+    "idx_tasks_scope_created",
+    "idx_tasks_column_created",
+    "idx_tasks_project_created",
+)
+
+# INSERT/UPDATE ... RETURNING (SQLite 3.35+) hands back the written row in the
+# same statement, saving the follow-up get_task() SELECT
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# --- SQL statements ---
+# Hoisted to module scope so every call passes the same string object and
+# hits sqlite3's per-connection prepared-statement cache without re-parsing.
+# Reads list columns explicitly, in model field order, so rows can be handed
+# straight to the dataclass constructor (see _task_row and friends).
+
+# Timestamps are stamped by SQLite in the same ISO-8601 local-time shape
+# Python's isoformat() produced, so old and new rows sort together
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime')"
+
+_TASK_FIELDS = "id, title, column_id, status, scope, description, project_id, created_at, completed_at, updated_at"
+_PROJECT_FIELDS = "id, name, created_at"
+_COLUMN_FIELDS = "id, name, position"
+
+_SQL_INSERT_TASK = f"""
+    INSERT INTO tasks (title, column_id, project_id, status, scope, description, created_at, updated_at)
+    VALUES (?, ?, ?, 'todo', ?, ?, {_SQL_NOW}, {_SQL_NOW})
+"""
+_SQL_INSERT_TASK_BULK = f"""
+    INSERT INTO tasks (title, column_id, project_id, status, scope, created_at, updated_at)
+    VALUES (?, ?, ?, 'todo', ?, {_SQL_NOW}, {_SQL_NOW})
+"""
+_SQL_SELECT_TASK_BY_ID = f"SELECT {_TASK_FIELDS} FROM tasks WHERE id = ?"
+_SQL_SELECT_TASKS_FROM_ID = f"SELECT {_TASK_FIELDS} FROM tasks WHERE id >= ? ORDER BY id"
+_SQL_NEXT_TASK_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM tasks"
+# Task/project lists sort newest first with id as the tiebreak: rows created in
+# one batch share a created_at, and without it their order is whatever the
+# chosen index happens to yield
+_SQL_LIST_TASKS = f"SELECT {_TASK_FIELDS} FROM tasks ORDER BY created_at DESC, id DESC"
+# {where} is filled per filter combination by _list_tasks_sql() (fixed clause text, ? params)
+_SQL_LIST_TASKS_WHERE = f"SELECT {_TASK_FIELDS} FROM tasks WHERE {{where}} ORDER BY created_at DESC, id DESC"
+# Tasks plus their column/project names in one pass (no per-task lookups)
+_SQL_LIST_TASKS_FULL = """
+    SELECT t.id, t.title, t.column_id, t.status, t.scope, t.description, t.project_id,
+           t.created_at, t.completed_at, t.updated_at,
+           c.name AS column_name, p.name AS project_name
+    FROM tasks t
+    LEFT JOIN columns c ON c.id = t.column_id
+    LEFT JOIN projects p ON p.id = t.project_id
+    {where}
+    ORDER BY t.created_at DESC, t.id DESC
+"""
+_SQL_LIST_TASKS_FULL_ALL = _SQL_LIST_TASKS_FULL.format(where="")
+_SQL_LIST_TASKS_FULL_BY_SCOPE = _SQL_LIST_TASKS_FULL.format(where="WHERE t.scope = ?")
+# LIMIT -1 means no limit in SQLite, so one statement serves both cases
+_SQL_LIST_TASKS_BY_SCOPE = (
+    f"SELECT {_TASK_FIELDS} FROM tasks WHERE scope = ? ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+_SQL_LIST_TASKS_BY_SCOPE_PROJECT = (
+    f"SELECT {_TASK_FIELDS} FROM tasks WHERE scope = ? AND project_id = ? ORDER BY created_at DESC, id DESC LIMIT ?"
+)
+# {where} holds the optional since/project filters (see _list_completed_sql())
+_SQL_LIST_COMPLETED = f"""
+    SELECT {_TASK_FIELDS}, COALESCE(completed_at, updated_at, '') AS display_time
+    FROM tasks
+    WHERE scope = 'archived'{{where}}
+    ORDER BY display_time DESC, created_at DESC
+"""
+_SQL_UPDATE_TASK = f"""
+    UPDATE tasks
+    SET title = ?,
+        description = ?,
+        project_id = ?,
+        column_id = ?,
+        status = ?,
+        scope = ?,
+        completed_at = ?,
+        updated_at = {_SQL_NOW}
+    WHERE id = ?
+"""
+_SQL_UPDATE_TASK_SCOPE = f"UPDATE tasks SET scope = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_COMPLETE_TASK = f"UPDATE tasks SET scope = 'archived', completed_at = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_REOPEN_TASK = f"UPDATE tasks SET scope = ?, completed_at = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_UPDATE_TASK_TITLE = f"UPDATE tasks SET title = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+_SQL_UPDATE_TASK_DESCRIPTION = f"UPDATE tasks SET description = ?, updated_at = {_SQL_NOW} WHERE id = ?"
+# As with moves, the project check rides along in the UPDATE (None clears)
+_SQL_UPDATE_TASK_PROJECT = f"""
+    UPDATE tasks SET project_id = ?, updated_at = {_SQL_NOW}
+    WHERE id = ? AND (? IS NULL OR EXISTS (SELECT 1 FROM projects WHERE id = ?))
+"""
+# The column check rides along in the UPDATE, so a successful move is a
+# single statement
+_SQL_MOVE_TASK = f"""
+    UPDATE tasks SET column_id = ?, updated_at = {_SQL_NOW}
+    WHERE id = ? AND EXISTS (SELECT 1 FROM columns WHERE id = ?)
+"""
+_SQL_DELETE_TASK = "DELETE FROM tasks WHERE id = ?"
+# Bulk variants; {ids} is filled with one "?" per id in the batch
+_SQL_MOVE_TASKS = f"UPDATE tasks SET column_id = ?, updated_at = {_SQL_NOW} WHERE id IN ({{ids}})"
+_SQL_UPDATE_TASKS_SCOPE = f"UPDATE tasks SET scope = ?, updated_at = {_SQL_NOW} WHERE id IN ({{ids}})"
+_SQL_COMPLETE_TASKS = (
+    f"UPDATE tasks SET scope = 'archived', completed_at = ?, updated_at = {_SQL_NOW} WHERE id IN ({{ids}})"
+)
+_SQL_SELECT_TASKS_BY_IDS = f"SELECT {_TASK_FIELDS} FROM tasks WHERE id IN ({{ids}})"
+
+# Ids per IN (...) batch; stays under SQLite's historical 999 host-parameter
+# limit (SQLITE_MAX_VARIABLE_NUMBER) with room for the other parameters
+_MAX_BATCH_IDS = 900
+
+_SQL_INSERT_PROJECT = f"INSERT INTO projects (name, created_at) VALUES (?, {_SQL_NOW})"
+_SQL_SELECT_PROJECT_BY_ID = f"SELECT {_PROJECT_FIELDS} FROM projects WHERE id = ?"
+# Names differing only by case can coexist; the newest wins, as in list_projects()
+_SQL_SELECT_PROJECT_BY_NAME = (
+    f"SELECT {_PROJECT_FIELDS} FROM projects WHERE name = ? COLLATE NOCASE "
+    "ORDER BY created_at DESC, id DESC LIMIT 1"
+)
+_SQL_SELECT_PROJECTS_BY_IDS = f"SELECT {_PROJECT_FIELDS} FROM projects WHERE id IN ({{ids}})"
+_SQL_SELECT_PROJECTS_FROM_ID = f"SELECT {_PROJECT_FIELDS} FROM projects WHERE id >= ? ORDER BY id"
+_SQL_NEXT_PROJECT_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM projects"
+_SQL_LIST_PROJECTS = f"SELECT {_PROJECT_FIELDS} FROM projects ORDER BY created_at DESC, id DESC"
+_SQL_DELETE_PROJECT = "DELETE FROM projects WHERE id = ?"
+
+_SQL_INSERT_COLUMN = "INSERT INTO columns (name, position) VALUES (?, ?)"
+_SQL_SELECT_COLUMN_BY_ID = f"SELECT {_COLUMN_FIELDS} FROM columns WHERE id = ?"
+_SQL_LIST_COLUMNS = f"SELECT {_COLUMN_FIELDS} FROM columns ORDER BY position"
+
+_SQL_INSERT_TASK_RETURNING = _SQL_INSERT_TASK + f" RETURNING {_TASK_FIELDS}"
+_SQL_UPDATE_TASK_SCOPE_RETURNING = _SQL_UPDATE_TASK_SCOPE + f" RETURNING {_TASK_FIELDS}"
+_SQL_COMPLETE_TASK_RETURNING = _SQL_COMPLETE_TASK + f" RETURNING {_TASK_FIELDS}"
+_SQL_REOPEN_TASK_RETURNING = _SQL_REOPEN_TASK + f" RETURNING {_TASK_FIELDS}"
+_SQL_UPDATE_TASK_TITLE_RETURNING = _SQL_UPDATE_TASK_TITLE + f" RETURNING {_TASK_FIELDS}"
+_SQL_UPDATE_TASK_DESCRIPTION_RETURNING = _SQL_UPDATE_TASK_DESCRIPTION + f" RETURNING {_TASK_FIELDS}"
+_SQL_UPDATE_TASK_PROJECT_RETURNING = _SQL_UPDATE_TASK_PROJECT + f" RETURNING {_TASK_FIELDS}"
+_SQL_MOVE_TASK_RETURNING = _SQL_MOVE_TASK + f" RETURNING {_TASK_FIELDS}"
+
+# Development aid: BARELY_PROFILE_SQL=1 opens connections through
+# _ProfilingConnection (below). Read once at import; unset means the plain
+# sqlite3.Connection is used and there is no overhead at all.
+PROFILE_SQL = os.environ.get("BARELY_PROFILE_SQL") == "1"
+
+# Per-thread cached connection, opened lazily by get_connection().
+# sqlite3 connections can't be shared across threads by default, so each
+# thread (e.g. blitz helpers) gets its own handle.
+_local = threading.local()
+
+# Databases whose schema has already been checked in this process, so new
+# connections (other threads, reconnects) skip the sqlite_master probe
+_schema_initialized: set = set()
+
+# Writes made through this module in this process (see data_generation()).
+# A fresh connection's data_version starts over, so reconnects bump it too.
+_write_generation = 0
+_SQL_DATA_VERSION = "PRAGMA data_version"
+
+
+# --- Row factories ---
+# Set per cursor (see _cursor). Rows from the _SQL_* reads arrive in model
+# field order, so each model is built with one positional call rather than
+# per-column lookups by name. The connection itself has no row_factory:
+# everything else gets raw tuples.
+
+
+def _task_row(cursor: sqlite3.Cursor, row: tuple) -> Task:
+    return Task(*row)
+
+
+def _project_row(cursor: sqlite3.Cursor, row: tuple) -> Project:
+    return Project(*row)
+
+
+def _column_row(cursor: sqlite3.Cursor, row: tuple) -> Column:
+    return Column(*row)
+
+
+def _task_full_row(cursor: sqlite3.Cursor, row: tuple) -> Tuple[Task, Optional[str], Optional[str]]:
+    # _TASK_FIELDS columns, then column_name, project_name
+    return Task(*row[:10]), row[10], row[11]
+
+
+def _cursor(row_factory) -> sqlite3.Cursor:
+    """Cursor on this thread's connection that yields model objects."""
+    cursor = get_connection().cursor()
+    cursor.row_factory = row_factory
+    return cursor
+
+
+# --- Query plan profiling (BARELY_PROFILE_SQL=1) ---
+
+
+class _ProfilingCursor(sqlite3.Cursor):
+    """Cursor that prints the query plan the first time it sees a statement."""
+
+    _seen: set = set()
+
+    def execute(self, sql, parameters=()):
+        if sql not in self._seen and sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT")):
+            self._seen.add(sql)
+            _print_query_plan(self.connection, sql, parameters)
+        return super().execute(sql, parameters)
+
+
+class _ProfilingConnection(sqlite3.Connection):
+    """Connection whose cursors (and execute shortcut) are _ProfilingCursor."""
+
+    def cursor(self, factory=_ProfilingCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+
+def _print_query_plan(conn: sqlite3.Connection, sql: str, parameters) -> None:
+    """Print EXPLAIN QUERY PLAN for sql to stderr, marking full table scans."""
+    plan = sqlite3.Cursor(conn).execute("EXPLAIN QUERY PLAN " + sql, parameters).fetchall()
+    print(f"[sql] {' '.join(sql.split())}", file=sys.stderr)
+    for row in plan:
+        detail = row[3]
+        # "SCAN tasks" = full table scan; "SCAN ... USING INDEX" is an index walk
+        marker = "!!" if detail.startswith("SCAN") and "INDEX" not in detail else "  "
+        print(f"[sql] {marker} {detail}", file=sys.stderr)
+
 
 def get_connection() -> sqlite3.Connection:
     """
     Get SQLite connection to Barely database.
 
     Creates ~/.barely directory if it doesn't exist.
-    Enables row_factory for dict-like row access.
+    Rows come back as plain tuples; model reads go through _cursor().
     Enables foreign key constraints.
     Initializes database schema on first connection.
-    """
-    # Ensure directory exists
-    DB_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Connect with row factory for named column access
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    Note:
+        The connection is opened once per thread and reused by every
+        repository call. It is reopened if DB_PATH is repointed (tests do this).
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.path == DB_PATH:
+        return conn
+
+    # DB_PATH changed since the cached connection was opened
+    if conn is not None:
+        close_connection()
+
+    # First open of this database in the process: make sure the directory
+    # exists (later reconnects skip the mkdir syscall)
+    first_open = DB_PATH not in _schema_initialized
+    if first_open:
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Pin the prepared-statement cache size so every _SQL_* constant stays
+    # prepared for the life of the connection, whatever the Python default
+    conn = sqlite3.connect(
+        DB_PATH,
+        cached_statements=128,
+        factory=_ProfilingConnection if PROFILE_SQL else sqlite3.Connection,
+    )
 
     # Enable foreign key constraints (required for ON DELETE CASCADE/SET NULL)
     conn.execute("PRAGMA foreign_keys = ON")
 
-    # Initialize schema if needed
-    init_database(conn)
-
+    # WAL + synchronous=NORMAL: commits append to the log instead of fsyncing
+    # the main database file, and readers don't block behind a writer.
+    # In-memory databases have no journal file, so WAL doesn't apply.
+    if str(DB_PATH) != ":memory:":
+        conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+
+    # Wait up to 5s for another process's write lock instead of failing
+    # immediately with "database is locked" (e.g. REPL + one-shot CLI)
+    conn.execute("PRAGMA busy_timeout = 5000")
+
+    # Temp tables in memory, ~20MB page cache, and mmap'd reads keep hot
+    # pages out of read() calls
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -20000")
+    conn.execute("PRAGMA mmap_size = 268435456")
+
+    # Initialize schema once per database per process
+    if first_open:
+        init_database(conn)
+        _schema_initialized.add(DB_PATH)
+
+    _local.conn = conn
+    _local.path = DB_PATH
     return conn
 
 
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Group several repository writes into one transaction (one commit).
+
+    Yields:
+        This thread's cached connection
+
+    Note:
+        Starts with BEGIN IMMEDIATE so the write lock is held up front.
+        Repository functions called inside the block skip their own commit;
+        the whole block commits on exit or rolls back if it raises.
+        Nested transaction() blocks join the outermost one.
+
+    Example:
+        with repository.transaction():
+            for task_id in task_ids:
+                repository.update_task_scope(task_id, "today")
+    """
+    conn = get_connection()
+
+    if getattr(_local, "in_txn", False):
+        try:
+            yield conn
+        finally:
+            _bump_generation()
+        return
+
+    conn.execute("BEGIN IMMEDIATE")
+    _local.in_txn = True
+    # Holding the write lock, no other connection can commit until we do
+    checked = _enter_cache_check(conn)
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        # Rolled-back rows may have been read into the in-process caches
+        _clear_caches()
+        raise
+    else:
+        conn.commit()
+    finally:
+        _local.in_txn = False
+        _local.cache_checked = checked
+        _bump_generation()
+
+
+@contextmanager
+def operation() -> Iterator[None]:
+    """
+    Treat the block as one operation for the in-process lookup caches.
+
+    Note:
+        Other connections' commits are checked for once, on entry, instead
+        of on every get_task()/get_project() call inside the block, so
+        cache hits cost no SQLite round trip. A commit made elsewhere while
+        the block runs is picked up by the next operation. Nested blocks,
+        including transaction(), check again on entry.
+
+    Example:
+        with repository.operation():
+            tasks = [repository.get_task(task_id) for task_id in task_ids]
+    """
+    checked = _enter_cache_check(get_connection())
+    try:
+        yield
+    finally:
+        _local.cache_checked = checked
+
+
+def _enter_cache_check(conn: sqlite3.Connection) -> bool:
+    """
+    Run the cache check now and skip it until the caller restores the flag.
+
+    Returns:
+        The previous flag, for the caller to put back on exit
+    """
+    checked = getattr(_local, "cache_checked", False)
+    _local.cache_checked = False
+    _check_task_cache(conn)
+    _local.cache_checked = True
+    return checked
+
+
+def _commit(conn: sqlite3.Connection) -> None:
+    """Commit, unless a transaction() block will commit for us."""
+    _bump_generation()
+    if not getattr(_local, "in_txn", False):
+        conn.commit()
+
+
+def _bump_generation() -> None:
+    """Record that this process wrote to the database (see data_generation)."""
+    global _write_generation
+    _write_generation += 1
+
+
+def data_generation() -> Tuple[Path, int, int]:
+    """
+    Token that changes whenever the database contents may have changed.
+
+    Returns:
+        (database path, in-process write counter, PRAGMA data_version)
+
+    Note:
+        Every repository write bumps the counter; data_version catches
+        commits from other connections (other threads, or a CLI run while
+        the REPL is open). Callers cache derived results against the token
+        and recompute when it differs.
+    """
+    conn = get_connection()
+    return DB_PATH, _write_generation, conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+
+
+def close_connection() -> None:
+    """
+    Close this thread's cached connection, if any.
+
+    The next get_connection() call opens a fresh one and re-checks the
+    schema. Used by tests that delete or replace the database file.
+    """
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        return
+
+    _schema_initialized.discard(_local.path)
+    _clear_caches()
+    _bump_generation()
+    conn.close()
+    _local.conn = None
+    _local.path = None
+    _local.in_txn = False
+    _local.data_version = None
+    _local.cache_checked = False
+
+
 def init_database(conn: sqlite3.Connection) -> None:
     """
     Initialize database schema if tables don't exist.
 
-    Executes schema.sql to create tables and default data.
-    Safe to call multiple times (uses CREATE TABLE IF NOT EXISTS).
+    Executes schema.sql to create tables and default data, then applies
+    any missing INDEX_MIGRATIONS (followed by ANALYZE) so older databases
+    gain newer indexes.
+    Safe to call multiple times (uses CREATE ... IF NOT EXISTS).
     """
     # Check if tables exist by querying sqlite_master
     cursor = conn.execute(
@@ -90,14 +568,31 @@ def init_database(conn: sqlite3.Connection) -> None:
     tables_exist = cursor.fetchone() is not None
 
     if not tables_exist:
-        # Read and execute schema file
-        with open(SCHEMA_PATH, "r") as f:
-            schema_sql = f.read()
+        conn.executescript(_read_schema())
+        conn.commit()
 
-        conn.executescript(schema_sql)
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+    }
+    missing = [sql for name, sql in INDEX_MIGRATIONS if name not in existing]
+    retired = [name for name in RETIRED_INDEXES if name in existing]
+
+    if missing or retired:
+        for name in retired:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+        for statement in missing:
+            conn.execute(statement)
+        # Refresh planner statistics so the new indexes actually get picked
+        conn.execute("ANALYZE")
         conn.commit()
 
 
+@functools.lru_cache(maxsize=None)
+def _read_schema() -> str:
+    """schema.sql contents, read from disk once per process."""
+    return SCHEMA_PATH.read_text()
+
+
 def create_task(
     title: str,
     column_id: int,
@@ -123,18 +618,18 @@ def create_task(
         Task starts with status='todo' and scope='backlog' (unless specified).
     """
     conn = get_connection()
-    now = datetime.now().isoformat()
+    params = (title, column_id, project_id, scope, description)
 
-    cursor = conn.execute(
-        """
-        INSERT INTO tasks (title, column_id, project_id, status, scope, description, created_at, updated_at)
-        VALUES (?, ?, ?, 'todo', ?, ?, ?, ?)
-        """,
-        (title, column_id, project_id, scope, description, now, now),
-    )
-    conn.commit()
+    if _HAS_RETURNING:
+        task = _cursor(_task_row).execute(_SQL_INSERT_TASK_RETURNING, params).fetchone()
+        _commit(conn)
+        _cache_task(task)
+        return task
+
+    # Older SQLite: no RETURNING, so fetch the inserted row
+    cursor = conn.execute(_SQL_INSERT_TASK, params)
+    _commit(conn)
 
-    # SQLite doesn't support RETURNING, so fetch the inserted row
     task_id = cursor.lastrowid
     task = get_task(task_id)
 
@@ -145,32 +640,157 @@ def create_task(
     return task
 
 
+def create_tasks(items: Iterable[Tuple[str, int, Optional[int], str]]) -> List[Task]:
+    """
+    Create many tasks in a single transaction.
+
+    Args:
+        items: (title, column_id, project_id, scope) tuples
+
+    Returns:
+        Newly created Task objects, in the same order as items
+
+    Note:
+        Bulk counterpart to create_task() for import/sync paths: one
+        executemany + one commit + one hydration SELECT, instead of an
+        INSERT/commit/get_task round trip per task.
+    """
+    rows = [(title, column_id, project_id, scope) for title, column_id, project_id, scope in items]
+
+    if not rows:
+        return []
+
+    # transaction() holds the write lock (BEGIN IMMEDIATE) before MAX(id) is
+    # read, so the new rows are guaranteed to be the contiguous ids after it
+    with transaction() as conn:
+        first_id = conn.execute(_SQL_NEXT_TASK_ID).fetchone()[0]
+        conn.executemany(_SQL_INSERT_TASK_BULK, rows)
+        return _cursor(_task_row).execute(_SQL_SELECT_TASKS_FROM_ID, (first_id,)).fetchall()
+
+
 def get_task(task_id: int) -> Optional[Task]:
     """
     Fetch single task by ID.
 
     Returns:
         Task object if found, None otherwise
+
+    Note:
+        Served from the in-process task cache when possible (see
+        _task_cache); each call still returns a new Task object. Inside
+        operation() or transaction() a hit needs no SQLite round trip.
     """
     conn = get_connection()
-    row = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+    _check_task_cache(conn)
+
+    row = _task_cache.get((DB_PATH, task_id))
+    if row is not None:
+        return Task(*row)
+
+    task = _cursor(_task_row).execute(_SQL_SELECT_TASK_BY_ID, (task_id,)).fetchone()
+    if task is not None:
+        _cache_task(task)
+    return task
+
+
+@functools.lru_cache(maxsize=None)
+def _list_tasks_sql(by_project: bool, by_column: bool, active_only: bool) -> str:
+    """
+    SELECT text for one list_tasks() filter combination.
+
+    Built once per combination, so every call passes the identical string
+    and hits the connection's statement cache without re-joining clauses.
+    Parameters go project_id, then column_id.
+
+    The active-only filter names the active scopes (IN) rather than
+    "!= 'archived'", so SQLite can range-read a scope index for
+    just the active rows instead of walking every task ever archived.
+    """
+    clauses = []
+    if by_project:
+        clauses.append("project_id = ?")
+    if by_column:
+        clauses.append("column_id = ?")
+    if active_only:
+        clauses.append("scope IN ('backlog', 'week', 'today')")
+
+    if not clauses:
+        return _SQL_LIST_TASKS
+    return _SQL_LIST_TASKS_WHERE.format(where=" AND ".join(clauses))
+
+
+def list_tasks(
+    project_id: Optional[int] = None,
+    column_id: Optional[int] = None,
+    include_archived: bool = True,
+) -> List[Task]:
+    """
+    List tasks, optionally filtered.
+
+    Args:
+        project_id: Only tasks in this project (None = any project)
+        column_id: Only tasks in this column (None = any column)
+        include_archived: Include scope='archived' tasks (default True)
+
+    Returns:
+        List of matching tasks, ordered by creation date (newest first)
+
+    Note:
+        Materializing wrapper around iter_tasks(); see there for filtering.
+    """
+    return list(iter_tasks(project_id, column_id, include_archived))
+
+
+def iter_tasks(
+    project_id: Optional[int] = None,
+    column_id: Optional[int] = None,
+    include_archived: bool = True,
+) -> Iterator[Task]:
+    """
+    Stream tasks, optionally filtered, without materializing the whole list.
 
-    return Task.from_row(row) if row else None
+    Args:
+        project_id: Only tasks in this project (None = any project)
+        column_id: Only tasks in this column (None = any column)
+        include_archived: Include scope='archived' tasks (default True)
+
+    Yields:
+        Matching tasks, ordered by creation date (newest first)
+
+    Note:
+        Filters become a parameterized WHERE clause, so SQLite skips
+        non-matching rows (using idx_tasks_project_created_id /
+        idx_tasks_column_created_id) instead of every row being built into
+        a Task and filtered in Python.
+        Rows are read from the cursor as the caller advances, so any()/next()
+        stop the scan early.
+    """
+    params = [value for value in (project_id, column_id) if value is not None]
+    sql = _list_tasks_sql(project_id is not None, column_id is not None, not include_archived)
+
+    yield from _cursor(_task_row).execute(sql, params)
 
 
-def list_tasks() -> List[Task]:
+def list_tasks_full(scope: Optional[str] = None) -> List[Tuple[Task, Optional[str], Optional[str]]]:
     """
-    List all tasks.
+    List tasks together with their column and project names.
+
+    Args:
+        scope: Only tasks in this scope (None = all tasks)
 
     Returns:
-        List of all tasks in database, ordered by creation date (newest first)
+        (task, column_name, project_name) tuples, newest task first.
+        project_name is None for tasks without a project.
+
+    Note:
+        One JOIN query, for views that show names alongside tasks instead
+        of calling get_column/get_project per task.
     """
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM tasks ORDER BY created_at DESC"
-    ).fetchall()
+    cursor = _cursor(_task_full_row)
 
-    return [Task.from_row(row) for row in rows]
+    if scope is None:
+        return cursor.execute(_SQL_LIST_TASKS_FULL_ALL).fetchall()
+    return cursor.execute(_SQL_LIST_TASKS_FULL_BY_SCOPE, (scope,)).fetchall()
 
 
 def update_task(task: Task) -> None:
@@ -185,21 +805,10 @@ def update_task(task: Task) -> None:
         Updates all fields (title, description, status, scope, completed_at, etc.)
     """
     conn = get_connection()
-    now = datetime.now().isoformat()
+    _forget_task(task.id)
 
     conn.execute(
-        """
-        UPDATE tasks
-        SET title = ?,
-            description = ?,
-            project_id = ?,
-            column_id = ?,
-            status = ?,
-            scope = ?,
-            completed_at = ?,
-            updated_at = ?
-        WHERE id = ?
-        """,
+        _SQL_UPDATE_TASK,
         (
             task.title,
             task.description,
@@ -208,11 +817,10 @@ def update_task(task: Task) -> None:
             task.status,
             task.scope,
             task.completed_at,
-            now,
             task.id,
         ),
     )
-    conn.commit()
+    _commit(conn)
 
 
 def delete_task(task_id: int) -> None:
@@ -229,25 +837,26 @@ def delete_task(task_id: int) -> None:
         Permanent deletion. No soft-delete or archiving (yet).
     """
     conn = get_connection()
+    _forget_task(task_id)
 
-    # Verify task exists before deleting
-    task = get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
+    cursor = conn.execute(_SQL_DELETE_TASK, (task_id,))
+    _commit(conn)
 
-    conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-    conn.commit()
+    # Nothing deleted means the task didn't exist
+    if cursor.rowcount == 0:
+        raise TaskNotFoundError(task_id)
 
 
 # --- Scope Operations (Pull-Based Workflow) ---
 
 
-def list_tasks_by_scope(scope: str) -> List[Task]:
+def list_tasks_by_scope(scope: str, project_id: Optional[int] = None) -> List[Task]:
     """
     List all tasks in a specific scope.
 
     Args:
         scope: Task scope ('backlog', 'week', 'today')
+        project_id: Only tasks in this project (None = any project)
 
     Returns:
         List of tasks in the scope, ordered by creation date (newest first)
@@ -255,13 +864,81 @@ def list_tasks_by_scope(scope: str) -> List[Task]:
     Note:
         This is the core function for pull-based workflow views.
     """
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM tasks WHERE scope = ? ORDER BY created_at DESC",
-        (scope,)
-    ).fetchall()
+    return list(iter_tasks_by_scope(scope, project_id=project_id))
+
+
+def iter_tasks_by_scope(
+    scope: str,
+    limit: Optional[int] = None,
+    project_id: Optional[int] = None,
+) -> Iterator[Task]:
+    """
+    Stream tasks in a specific scope without materializing the whole list.
+
+    Args:
+        scope: Task scope ('backlog', 'week', 'today')
+        limit: Maximum number of tasks to yield (None = all)
+        project_id: Only tasks in this project (None = any project)
+
+    Yields:
+        Tasks in the scope, newest first
 
-    return [Task.from_row(row) for row in rows]
+    Note:
+        LIMIT and the project filter are applied in SQL, so views that only
+        show the first page (or one project) never read the rest of the scope.
+    """
+    limit = -1 if limit is None else limit
+
+    if project_id is None:
+        cursor = _cursor(_task_row).execute(_SQL_LIST_TASKS_BY_SCOPE, (scope, limit))
+    else:
+        cursor = _cursor(_task_row).execute(_SQL_LIST_TASKS_BY_SCOPE_PROJECT, (scope, project_id, limit))
+    yield from cursor
+
+
+@functools.lru_cache(maxsize=None)
+def _list_completed_sql(with_since: bool, by_project: bool) -> str:
+    """
+    SELECT text for one list_completed_tasks() filter combination.
+
+    since filters on display time (completed_at, falling back to
+    updated_at) rather than completed_at alone, so tasks archived by a pull
+    (no completed_at) still show up; filter and sort both use the
+    expression idx_tasks_scope_display indexes. Parameters go since, then
+    project_id.
+    """
+    where = ""
+    if with_since:
+        where += " AND COALESCE(completed_at, updated_at, '') >= ?"
+    if by_project:
+        where += " AND project_id = ?"
+    return _SQL_LIST_COMPLETED.format(where=where)
+
+
+def list_completed_tasks(since: Optional[str] = None, project_id: Optional[int] = None) -> List[Task]:
+    """
+    List archived (completed) tasks, optionally only recent ones.
+
+    Args:
+        since: ISO-8601 timestamp; only tasks whose display_time is at or
+            after it are returned (None = all completed tasks)
+        project_id: Only tasks in this project (None = any project)
+
+    Returns:
+        List of archived tasks, ordered by display_time (newest first).
+        Each task has display_time set to completed_at, falling back to
+        updated_at (or "" if neither is set).
+
+    Note:
+        Filter and sort run in SQL against idx_tasks_scope_display, so
+        history views stay proportional to the window, not the account's
+        lifetime. Tasks archived by a pull have no completed_at and are
+        windowed by updated_at instead.
+    """
+    params = [value for value in (since, project_id) if value is not None]
+    sql = _list_completed_sql(since is not None, project_id is not None)
+
+    return _cursor(_task_row).execute(sql, params).fetchall()
 
 
 def update_task_scope(task_id: int, scope: str) -> Task:
@@ -282,22 +959,124 @@ def update_task_scope(task_id: int, scope: str) -> Task:
         This is the core "pull" operation.
         Automatically updates updated_at timestamp.
     """
-    conn = get_connection()
+    return _update_one_task(
+        task_id, _SQL_UPDATE_TASK_SCOPE, _SQL_UPDATE_TASK_SCOPE_RETURNING, (scope, task_id)
+    )
 
-    # Verify task exists
-    task = get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
 
-    # Update scope
-    now = datetime.now().isoformat()
-    conn.execute(
-        "UPDATE tasks SET scope = ?, updated_at = ? WHERE id = ?",
-        (scope, now, task_id),
+def complete_task(task_id: int, completed_at: str) -> Task:
+    """
+    Archive a task and stamp its completion time.
+
+    Args:
+        task_id: ID of task to complete
+        completed_at: ISO-8601 completion timestamp
+
+    Returns:
+        Updated Task object
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
+    """
+    return _update_one_task(
+        task_id, _SQL_COMPLETE_TASK, _SQL_COMPLETE_TASK_RETURNING, (completed_at, task_id)
     )
-    conn.commit()
 
-    # Return updated task
+
+def reopen_task(task_id: int, scope: str, completed_at: Optional[str] = None) -> Task:
+    """
+    Move a task into scope and reset its completion time (undo of complete_task).
+
+    completed_at is None to clear it, or the timestamp to restore (undo of a
+    re-completed task). Scope and completion change in one statement.
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
+    """
+    return _update_one_task(
+        task_id, _SQL_REOPEN_TASK, _SQL_REOPEN_TASK_RETURNING, (scope, completed_at, task_id)
+    )
+
+
+def update_task_title(task_id: int, title: str) -> Task:
+    """
+    Set a task's title.
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
+    """
+    return _update_one_task(
+        task_id, _SQL_UPDATE_TASK_TITLE, _SQL_UPDATE_TASK_TITLE_RETURNING, (title, task_id)
+    )
+
+
+def update_task_description(task_id: int, description: Optional[str]) -> Task:
+    """
+    Set (or clear, with None) a task's description.
+
+    Raises:
+        TaskNotFoundError: If task doesn't exist
+    """
+    return _update_one_task(
+        task_id, _SQL_UPDATE_TASK_DESCRIPTION, _SQL_UPDATE_TASK_DESCRIPTION_RETURNING, (description, task_id)
+    )
+
+
+def update_task_project(task_id: int, project_id: Optional[int]) -> Task:
+    """
+    Set (or clear, with None) a task's project.
+
+    One statement: the project's existence is checked inside the UPDATE,
+    and only a no-op update looks up which side was missing.
+
+    Raises:
+        ProjectNotFoundError: If project_id doesn't exist
+        TaskNotFoundError: If task doesn't exist
+    """
+    return _update_one_task(
+        task_id,
+        _SQL_UPDATE_TASK_PROJECT,
+        _SQL_UPDATE_TASK_PROJECT_RETURNING,
+        (project_id, task_id, project_id, project_id),
+        on_missing=lambda: _raise_assign_failure(task_id, project_id),
+    )
+
+
+def _update_one_task(
+    task_id: int,
+    sql: str,
+    returning_sql: str,
+    params: tuple,
+    on_missing: Optional[Callable[[], None]] = None,
+) -> Task:
+    """
+    Run a single-task UPDATE and return the updated task.
+
+    Uses returning_sql (one statement) when SQLite supports RETURNING,
+    otherwise sql + a get_task() re-fetch. No row updated means no task
+    with that id, which raises TaskNotFoundError - or, for statements with
+    extra WHERE conditions, whatever on_missing raises.
+    """
+    if on_missing is None:
+        def on_missing():
+            raise TaskNotFoundError(task_id)
+
+    conn = get_connection()
+    _forget_task(task_id)
+
+    if _HAS_RETURNING:
+        task = _cursor(_task_row).execute(returning_sql, params).fetchone()
+        _commit(conn)
+        if task is None:
+            on_missing()
+        _cache_task(task)
+        return task
+
+    cursor = conn.execute(sql, params)
+    _commit(conn)
+    if cursor.rowcount == 0:
+        on_missing()
+
     updated_task = get_task(task_id)
     if not updated_task:
         raise TaskNotFoundError(task_id)
@@ -305,6 +1084,62 @@ def update_task_scope(task_id: int, scope: str) -> Task:
     return updated_task
 
 
+def update_tasks_scope(task_ids: Iterable[int], scope: str, skip_missing: bool = False) -> List[Task]:
+    """
+    Update several tasks' scope in one transaction (bulk pull).
+
+    Args:
+        task_ids: IDs of tasks to update (duplicates are ignored)
+        scope: Target scope ('backlog', 'week', 'today', 'archived')
+        skip_missing: Update the tasks that exist and leave out missing
+            IDs instead of raising
+
+    Returns:
+        Updated Task objects, in the order of task_ids
+
+    Raises:
+        TaskNotFoundError: If any task doesn't exist and skip_missing is
+            False (nothing is updated)
+
+    Note:
+        One UPDATE ... WHERE id IN (...) per batch instead of a statement
+        per task.
+    """
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return []
+
+    return _update_tasks_in_batches(ids, _SQL_UPDATE_TASKS_SCOPE, (scope,), skip_missing)
+
+
+def complete_tasks(task_ids: Iterable[int], completed_at: str, skip_missing: bool = False) -> List[Task]:
+    """
+    Archive several tasks in one transaction (bulk completion).
+
+    Args:
+        task_ids: IDs of tasks to complete (duplicates are ignored)
+        completed_at: ISO-8601 timestamp stamped on every task
+        skip_missing: Complete the tasks that exist and leave out missing
+            IDs instead of raising
+
+    Returns:
+        Updated Task objects, in the order of task_ids
+
+    Raises:
+        TaskNotFoundError: If any task doesn't exist and skip_missing is
+            False (nothing is updated)
+
+    Note:
+        The caller computes completed_at once for the whole batch, so all
+        tasks share one completion time.
+    """
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return []
+
+    return _update_tasks_in_batches(ids, _SQL_COMPLETE_TASKS, (completed_at,), skip_missing)
+
+
 # --- Project Operations ---
 
 
@@ -325,13 +1160,8 @@ def create_project(name: str) -> Project:
         Sets created_at automatically.
     """
     conn = get_connection()
-    now = datetime.now().isoformat()
-
-    cursor = conn.execute(
-        "INSERT INTO projects (name, created_at) VALUES (?, ?)",
-        (name, now),
-    )
-    conn.commit()
+    cursor = conn.execute(_SQL_INSERT_PROJECT, (name,))
+    _commit(conn)
 
     # Fetch the inserted project
     project_id = cursor.lastrowid
@@ -343,19 +1173,110 @@ def create_project(name: str) -> Project:
     return project
 
 
+def create_projects(names: Iterable[str]) -> List[Project]:
+    """
+    Create many projects in a single transaction.
+
+    Args:
+        names: Project names (each must be unique)
+
+    Returns:
+        Newly created Project objects, in the same order as names
+
+    Raises:
+        sqlite3.IntegrityError: If any name already exists (nothing is created)
+    """
+    rows = [(name,) for name in names]
+
+    if not rows:
+        return []
+
+    with transaction() as conn:
+        first_id = conn.execute(_SQL_NEXT_PROJECT_ID).fetchone()[0]
+        conn.executemany(_SQL_INSERT_PROJECT, rows)
+        return _cursor(_project_row).execute(_SQL_SELECT_PROJECTS_FROM_ID, (first_id,)).fetchall()
+
+
 def get_project(project_id: int) -> Optional[Project]:
     """
     Fetch single project by ID.
 
     Returns:
         Project object if found, None otherwise
+
+    Note:
+        Found projects are cached in-process, so display code can call this
+        per task. The cache is dropped when another connection commits
+        (project ids are reused after a delete), as with the task cache.
     """
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT * FROM projects WHERE id = ?", (project_id,)
-    ).fetchone()
+    _check_task_cache(get_connection())
+    key = (DB_PATH, project_id)
+    project = _project_cache.get(key)
+
+    if project is None:
+        project = _cursor(_project_row).execute(_SQL_SELECT_PROJECT_BY_ID, (project_id,)).fetchone()
+        if project is not None:
+            _project_cache[key] = project
+
+    return project
+
+
+def get_project_by_name(name: str) -> Optional[Project]:
+    """
+    Fetch single project by name, ignoring ASCII case.
 
-    return Project.from_row(row) if row else None
+    Returns:
+        Project object if found, None otherwise
+
+    Note:
+        One lookup on idx_projects_name_nocase. If several names match
+        (differing only by case), the newest project is returned, the
+        same one a scan of list_projects() finds first. SQLite's NOCASE
+        only folds ASCII letters; callers needing full Unicode case
+        folding handle that themselves (see service.find_project_by_name).
+    """
+    _check_task_cache(get_connection())
+    project = _cursor(_project_row).execute(_SQL_SELECT_PROJECT_BY_NAME, (name,)).fetchone()
+    if project is not None:
+        _project_cache[(DB_PATH, project.id)] = project
+    return project
+
+
+def get_projects_by_ids(project_ids: Iterable[int]) -> List[Project]:
+    """
+    Fetch several projects by ID at once.
+
+    Args:
+        project_ids: IDs to look up (duplicates are ignored)
+
+    Returns:
+        Found projects, in the order of project_ids (missing IDs are left out)
+
+    Note:
+        IDs already in the project cache are served from it; the rest are
+        read with one SELECT ... WHERE id IN (...) per _MAX_BATCH_IDS batch
+        instead of a query per project.
+    """
+    _check_task_cache(get_connection())
+    ids = list(dict.fromkeys(project_ids))
+    found = {}
+    missing = []
+
+    for project_id in ids:
+        project = _project_cache.get((DB_PATH, project_id))
+        if project is None:
+            missing.append(project_id)
+        else:
+            found[project_id] = project
+
+    for start in range(0, len(missing), _MAX_BATCH_IDS):
+        batch = missing[start:start + _MAX_BATCH_IDS]
+        sql = _in_list_sql(_SQL_SELECT_PROJECTS_BY_IDS, len(batch))
+        for project in _cursor(_project_row).execute(sql, batch):
+            found[project.id] = project
+            _project_cache[(DB_PATH, project.id)] = project
+
+    return [found[project_id] for project_id in ids if project_id in found]
 
 
 def list_projects() -> List[Project]:
@@ -365,12 +1286,7 @@ def list_projects() -> List[Project]:
     Returns:
         List of all projects in database, ordered by creation date (newest first)
     """
-    conn = get_connection()
-    rows = conn.execute(
-        "SELECT * FROM projects ORDER BY created_at DESC"
-    ).fetchall()
-
-    return [Project.from_row(row) for row in rows]
+    return _cursor(_project_row).execute(_SQL_LIST_PROJECTS).fetchall()
 
 
 def delete_project(project_id: int) -> None:
@@ -389,13 +1305,15 @@ def delete_project(project_id: int) -> None:
     """
     conn = get_connection()
 
-    # Verify project exists before deleting
-    project = get_project(project_id)
-    if not project:
-        raise ProjectNotFoundError(project_id)
+    cursor = conn.execute(_SQL_DELETE_PROJECT, (project_id,))
+    _commit(conn)
+    _project_cache.pop((DB_PATH, project_id), None)
+    # ON DELETE SET NULL rewrote project_id on the project's tasks
+    _forget_all_tasks()
 
-    conn.execute("DELETE FROM projects WHERE id = ?", (project_id,))
-    conn.commit()
+    # Nothing deleted means the project didn't exist
+    if cursor.rowcount == 0:
+        raise ProjectNotFoundError(project_id)
 
 
 # --- Column Operations ---
@@ -417,11 +1335,9 @@ def create_column(name: str, position: int = 0) -> Column:
     """
     conn = get_connection()
 
-    cursor = conn.execute(
-        "INSERT INTO columns (name, position) VALUES (?, ?)",
-        (name, position),
-    )
-    conn.commit()
+    cursor = conn.execute(_SQL_INSERT_COLUMN, (name, position))
+    _commit(conn)
+    _cached_columns.cache_clear()
 
     # Fetch the inserted column
     column_id = cursor.lastrowid
@@ -440,12 +1356,7 @@ def get_column(column_id: int) -> Optional[Column]:
     Returns:
         Column object if found, None otherwise
     """
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT * FROM columns WHERE id = ?", (column_id,)
-    ).fetchone()
-
-    return Column.from_row(row) if row else None
+    return _cursor(_column_row).execute(_SQL_SELECT_COLUMN_BY_ID, (column_id,)).fetchone()
 
 
 def get_column_by_name(name: str) -> Optional[Column]:
@@ -456,14 +1367,13 @@ def get_column_by_name(name: str) -> Optional[Column]:
         Column object if found, None otherwise
 
     Note:
-        Useful for CLI/REPL commands where users specify column by name
+        Useful for CLI/REPL commands where users specify column by name.
+        Served from the in-process column cache (see _cached_columns).
     """
-    conn = get_connection()
-    row = conn.execute(
-        "SELECT * FROM columns WHERE name = ?", (name,)
-    ).fetchone()
-
-    return Column.from_row(row) if row else None
+    for column in _cached_columns(DB_PATH):
+        if column.name == name:
+            return column
+    return None
 
 
 def list_columns() -> List[Column]:
@@ -472,11 +1382,89 @@ def list_columns() -> List[Column]:
 
     Returns:
         List of all columns in database, ordered by position
+
+    Note:
+        Served from the in-process column cache (see _cached_columns).
     """
-    conn = get_connection()
-    rows = conn.execute("SELECT * FROM columns ORDER BY position").fetchall()
+    return list(_cached_columns(DB_PATH))
+
+
+# Found projects by (DB_PATH, project_id); see get_project(). Dropped with
+# the task cache whenever another connection commits (_check_task_cache)
+_project_cache: dict = {}
+
+# Task rows by (DB_PATH, task_id), filled by get_task() and written through
+# by single- and bulk-task writes. Rows (not Task objects) are kept so
+# callers can mutate what they get back. Evicted oldest-first past
+# _TASK_CACHE_SIZE; dropped whenever another connection commits. Shared by
+# every thread (async_repository readers, the blitz writer), so all changes
+# go through _cache_task/_forget_task/_forget_all_tasks under the lock.
+_TASK_CACHE_SIZE = 1024
+_task_cache: dict = {}
+_task_cache_lock = threading.Lock()
+_task_values = operator.attrgetter(*_TASK_FIELDS.split(", "))
+
+
+def _cache_task(task: Task) -> None:
+    """Store task's current row in the task cache."""
+    with _task_cache_lock:
+        _task_cache[(DB_PATH, task.id)] = _task_values(task)
+        if len(_task_cache) > _TASK_CACHE_SIZE:
+            oldest = next(iter(_task_cache), None)
+            if oldest is not None:
+                del _task_cache[oldest]
+
+
+def _forget_task(task_id: int) -> None:
+    """Drop one task's cached row (before a write that changes it)."""
+    with _task_cache_lock:
+        _task_cache.pop((DB_PATH, task_id), None)
+
+
+def _forget_all_tasks() -> None:
+    """Drop every cached task row."""
+    with _task_cache_lock:
+        _task_cache.clear()
+
+
+def _check_task_cache(conn: sqlite3.Connection) -> None:
+    """
+    Drop cached task rows and projects if another connection has committed
+    since this thread last looked.
+
+    PRAGMA data_version only changes for other connections' commits (a CLI
+    run while the REPL is open, another thread), never for our own writes,
+    which keep the cache current themselves. Skipped inside operation() and
+    transaction() blocks, which check once on entry.
+    """
+    if getattr(_local, "cache_checked", False):
+        return
+    version = conn.execute(_SQL_DATA_VERSION).fetchone()[0]
+    if getattr(_local, "data_version", None) != version:
+        _local.data_version = version
+        _forget_all_tasks()
+        _project_cache.clear()
 
-    return [Column.from_row(row) for row in rows]
+
+def _clear_caches() -> None:
+    """Drop every in-process lookup cache (columns, projects, tasks)."""
+    _cached_columns.cache_clear()
+    _project_cache.clear()
+    _forget_all_tasks()
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_columns(db_path: Path) -> Tuple[Column, ...]:
+    """
+    All columns of the database at db_path, ordered by position.
+
+    Columns are static configuration (a handful of rows only changed by
+    create_column), so they're read once per database and kept in memory.
+    Keyed by path so repointing DB_PATH (tests) never serves stale rows.
+    Cleared by create_column, and with the project cache by _clear_caches()
+    (close_connection, transaction rollback).
+    """
+    return tuple(_cursor(_column_row).execute(_SQL_LIST_COLUMNS).fetchall())
 
 
 def move_task(task_id: int, column_id: int) -> Task:
@@ -498,24 +1486,22 @@ def move_task(task_id: int, column_id: int) -> Task:
         Automatically updates updated_at timestamp.
     """
     conn = get_connection()
+    params = (column_id, task_id, column_id)
+    _forget_task(task_id)
 
-    # Verify task exists
-    task = get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
-
-    # Verify column exists
-    column = get_column(column_id)
-    if not column:
-        raise ColumnNotFoundError(column_id)
+    if _HAS_RETURNING:
+        task = _cursor(_task_row).execute(_SQL_MOVE_TASK_RETURNING, params).fetchone()
+        _commit(conn)
+        if task is None:
+            _raise_move_failure(task_id, column_id)
+        _cache_task(task)
+        return task
 
     # Update task's column
-    now = datetime.now().isoformat()
-    conn.execute(
-        "UPDATE tasks SET column_id = ?, updated_at = ? WHERE id = ?",
-        (column_id, now, task_id),
-    )
-    conn.commit()
+    cursor = conn.execute(_SQL_MOVE_TASK, params)
+    _commit(conn)
+    if cursor.rowcount == 0:
+        _raise_move_failure(task_id, column_id)
 
     # Return updated task
     updated_task = get_task(task_id)
@@ -523,3 +1509,83 @@ def move_task(task_id: int, column_id: int) -> Task:
         raise TaskNotFoundError(task_id)
 
     return updated_task
+
+
+def move_tasks(task_ids: Iterable[int], column_id: int) -> List[Task]:
+    """
+    Move several tasks to a column in one transaction.
+
+    Args:
+        task_ids: IDs of tasks to move (duplicates are ignored)
+        column_id: ID of target column
+
+    Returns:
+        Updated Task objects, in the order of task_ids
+
+    Raises:
+        ColumnNotFoundError: If column doesn't exist
+        TaskNotFoundError: If any task doesn't exist (nothing is moved)
+
+    Note:
+        One UPDATE and one SELECT per batch of up to _MAX_BATCH_IDS ids,
+        instead of a round trip per task.
+    """
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return []
+
+    # Validate column once for the whole batch
+    if get_column(column_id) is None:
+        raise ColumnNotFoundError(column_id)
+
+    return _update_tasks_in_batches(ids, _SQL_MOVE_TASKS, (column_id,))
+
+
+def _update_tasks_in_batches(
+    ids: List[int], update_sql: str, params: tuple, skip_missing: bool = False
+) -> List[Task]:
+    """
+    Apply update_sql to every task in ids inside one transaction.
+
+    update_sql has an {ids} placeholder for the IN (...) list and takes
+    params before the ids. Runs one UPDATE + one hydrating SELECT per batch
+    of _MAX_BATCH_IDS. Returns the updated tasks in ids order; if any id is
+    missing, raises TaskNotFoundError for the first one and nothing changes,
+    unless skip_missing is set (then missing ids are just left out).
+    """
+    updated = {}
+    with transaction() as conn:
+        for start in range(0, len(ids), _MAX_BATCH_IDS):
+            batch = ids[start:start + _MAX_BATCH_IDS]
+            conn.execute(_in_list_sql(update_sql, len(batch)), (*params, *batch))
+            for task in _cursor(_task_row).execute(_in_list_sql(_SQL_SELECT_TASKS_BY_IDS, len(batch)), batch):
+                updated[task.id] = task
+                _cache_task(task)
+
+        # Raising inside the block rolls the whole batch back
+        if not skip_missing:
+            for task_id in ids:
+                if task_id not in updated:
+                    raise TaskNotFoundError(task_id)
+
+    return [updated[task_id] for task_id in ids if task_id in updated]
+
+
+@functools.lru_cache(maxsize=64)
+def _in_list_sql(template: str, count: int) -> str:
+    """Fill a template's {ids} placeholder with count ? markers (built once per size)."""
+    return template.format(ids=",".join("?" * count))
+
+
+def _raise_assign_failure(task_id: int, project_id: Optional[int]) -> None:
+    """Work out whether a no-op update_task_project() was a missing project or task."""
+    if project_id is not None and get_project(project_id) is None:
+        raise ProjectNotFoundError(project_id)
+    raise TaskNotFoundError(task_id)
+
+
+def _raise_move_failure(task_id: int, column_id: int) -> None:
+    """Work out whether a no-op move_task() UPDATE was a missing task or column."""
+    if get_task(task_id) is None:
+        raise TaskNotFoundError(task_id)
+    raise ColumnNotFoundError(column_id)
@@ -4,6 +4,7 @@ PURPOSE: Business logic layer for task operations
 EXPORTS:
   - create_task(title, project_id, column_id, scope) -> Task
   - complete_task(task_id) -> Task
+  - complete_tasks(task_ids, skip_missing) -> List[Task]
   - uncomplete_task(task_id) -> Task
   - list_tasks(project_id, status) -> List[Task]
   - update_task_title(task_id, new_title) -> Task
@@ -12,23 +13,31 @@ EXPORTS:
   - create_project(name) -> Project
   - list_projects() -> List[Project]
   - get_project(project_id) -> Optional[Project]
+  - get_projects_by_ids(project_ids) -> List[Project]
   - delete_project(project_id) -> None
   - list_columns() -> List[Column]
   - move_task(task_id, column_id) -> Task
+  - move_tasks(task_ids, column_id) -> List[Task]
   - assign_task_to_project(task_id, project_id) -> Task
   - list_tasks_by_project(project_id) -> List[Task]
   - list_tasks_by_column(column_id) -> List[Task]
-  - list_backlog() -> List[Task]
-  - list_week() -> List[Task]
-  - list_today() -> List[Task]
-  - list_completed() -> List[Task]
+  - iter_tasks_by_project(project_id) -> Iterator[Task]
+  - iter_tasks_by_column(column_id) -> Iterator[Task]
+  - iter_tasks_by_scope(scope, project_id) -> Iterator[Task]
+  - list_backlog(project_id) -> List[Task]
+  - list_week(project_id) -> List[Task]
+  - list_today(project_id) -> List[Task]
+  - list_completed(since, project_id) -> List[Task]
+  - list_view(view, project_id, since) -> List[Task]
+  - list_tasks_full(scope) -> List[Tuple[Task, str | None, str | None]]
   - pull_task(task_id, target_scope) -> Task
-  - pull_tasks(task_ids, target_scope) -> List[Task]
+  - pull_tasks(task_ids, target_scope, skip_missing) -> List[Task]
 DEPENDENCIES:
   - barely.core.models (Task, Project, Column)
   - barely.core.repository (all CRUD functions)
   - barely.core.exceptions (TaskNotFoundError, ProjectNotFoundError, ColumnNotFoundError, InvalidInputError)
-  - datetime (for timestamps)
+  - datetime, time (for timestamps)
+  - functools, collections (list query cache)
   - typing (type hints)
 NOTES:
   - All functions validate input and raise descriptive errors
@@ -36,16 +45,24 @@ NOTES:
   - Returns domain objects, never dicts or raw SQL results
   - Business rules enforced here (e.g., validation, status transitions)
   - Pull-based workflow: backlog -> week -> today
+  - list_view() (backlog/week/today/completed), list_tasks(),
+    list_tasks_by_project/column() and list_projects() results are cached
+    until the next database write (repository.data_generation())
 """
 
+import functools
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from . import repository
 from .models import Task, Project, Column
 from .constants import (
-    VALID_SCOPES,
-    ACTIVE_SCOPES,
+    VALID_SCOPE_SET,
+    ACTIVE_SCOPE_SET,
+    VALID_SCOPES_TEXT,
+    ACTIVE_SCOPES_TEXT,
     DEFAULT_SCOPE,
     DEFAULT_COLUMN_ID,
     SCOPE_BACKLOG,
@@ -61,6 +78,80 @@ from .exceptions import (
 )
 
 
+# Scope validation messages, built once
+_INVALID_SCOPE_MSG = "Invalid scope '{}'. Must be one of: " + VALID_SCOPES_TEXT
+_INVALID_ACTIVE_SCOPE_MSG = "Invalid scope '{}'. Must be one of: " + ACTIVE_SCOPES_TEXT
+
+# (millisecond tick, ISO string) of the last timestamp handed out by _now_iso()
+_last_now = (-1, "")
+
+
+def _now_iso() -> str:
+    """
+    Current local time as ISO-8601 with millisecond precision.
+
+    Matches the shape the repository stamps in SQL, and reuses the string
+    for calls within the same millisecond (e.g. rapid completions).
+    """
+    global _last_now
+    tick = time.monotonic_ns() // 1_000_000
+    if tick != _last_now[0]:
+        _last_now = (tick, datetime.now().isoformat(timespec="milliseconds"))
+    return _last_now[1]
+
+
+# List query results keyed by (function, args), each stored with the
+# repository.data_generation() token it was read under (LRU-bounded)
+_LIST_CACHE_SIZE = 32
+_list_cache: "OrderedDict[tuple, Tuple[tuple, list]]" = OrderedDict()
+
+
+def _cached_by_generation(fn):
+    """
+    Serve repeat calls of a list query from memory until the data changes.
+
+    Any write (through this process's repository or another connection)
+    changes repository.data_generation(), so a hit is never stale. Callers
+    get a fresh list each time; the model objects inside are shared.
+    """
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        generation = repository.data_generation()
+
+        cached = _list_cache.get(key)
+        if cached is not None and cached[0] == generation:
+            _list_cache.move_to_end(key)
+            return list(cached[1])
+
+        items = fn(*args, **kwargs)
+        _list_cache[key] = (generation, items)
+        _list_cache.move_to_end(key)
+        if len(_list_cache) > _LIST_CACHE_SIZE:
+            _list_cache.popitem(last=False)
+        return list(items)
+
+    return wrapper
+
+
+def _required_text(value: str, label: str) -> str:
+    """
+    Strip value and reject it if nothing is left.
+
+    str.strip() hands back the same object when there is no surrounding
+    whitespace, so clean input costs no copy.
+    """
+    value = value.strip()
+    if not value:
+        raise InvalidInputError(f"{label} cannot be empty")
+    return value
+
+
+def _optional_text(value: Optional[str]) -> Optional[str]:
+    """Strip value; None, empty, or whitespace-only becomes None."""
+    return (value and value.strip()) or None
+
+
 def create_task(
     title: str,
     column_id: int = DEFAULT_COLUMN_ID,  # Default to "Todo" column
@@ -92,20 +183,14 @@ def create_task(
         - Task starts with status='todo' and scope='backlog' (unless specified)
     """
     # Validate and sanitize title
-    title = title.strip()
-    if not title:
-        raise InvalidInputError("Task title cannot be empty")
+    title = _required_text(title, "Task title")
 
     # Validate scope (archived not allowed for new tasks)
-    if scope not in ACTIVE_SCOPES:
-        raise InvalidInputError(
-            f"Invalid scope '{scope}'. Must be one of: {', '.join(ACTIVE_SCOPES)}"
-        )
+    if scope not in ACTIVE_SCOPE_SET:
+        raise InvalidInputError(_INVALID_ACTIVE_SCOPE_MSG.format(scope))
 
-    # Sanitize description if provided
-    description_value = description.strip() if description else None
-    if description_value and not description_value:
-        description_value = None
+    # Sanitize description if provided (whitespace-only means none)
+    description_value = _optional_text(description)
 
     # Create task via repository layer
     task = repository.create_task(
@@ -139,19 +224,33 @@ def complete_task(task_id: int) -> Task:
         - Idempotent: completing an already-archived task is safe
         - To reactivate, use pull_task() to move back to backlog/week/today
     """
-    # Fetch task (raises TaskNotFoundError if not found)
-    task = repository.get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
+    # Single UPDATE (raises TaskNotFoundError if not found)
+    return repository.complete_task(task_id, _now_iso())
 
-    # Update task fields for completion
-    task.scope = SCOPE_ARCHIVED
-    task.completed_at = datetime.now().isoformat()
 
-    # Persist changes
-    repository.update_task(task)
+def complete_tasks(task_ids: List[int], skip_missing: bool = False) -> List[Task]:
+    """
+    Mark multiple tasks as complete (bulk operation).
 
-    return task
+    Args:
+        task_ids: List of task IDs to complete
+        skip_missing: Complete the tasks that exist and leave missing IDs
+            out of the result instead of raising
+
+    Returns:
+        List of updated Task objects, in the order of task_ids
+
+    Raises:
+        TaskNotFoundError: If any task_id doesn't exist and skip_missing is
+            False (raised for first failure)
+
+    Notes:
+        - One timestamp is computed for the whole batch and shared by
+          every task's completed_at
+        - Batched UPDATEs in one transaction; if a task is missing (and
+          skip_missing is False), no task is completed
+    """
+    return repository.complete_tasks(task_ids, _now_iso(), skip_missing)
 
 
 def uncomplete_task(task_id: int, target_scope: str = DEFAULT_SCOPE) -> Task:
@@ -170,21 +269,20 @@ def uncomplete_task(task_id: int, target_scope: str = DEFAULT_SCOPE) -> Task:
         InvalidInputError: If target_scope is invalid
 
     Notes:
-        - Moves task from 'archived' scope back to active scope using pull_task()
-        - Clears completed_at timestamp
+        - Moves task from 'archived' scope back to target_scope and clears
+          completed_at in a single UPDATE
         - Automatically updates updated_at timestamp
         - Idempotent: un-completing a non-archived task is safe (just moves it)
     """
-    # Use pull_task to reactivate (it handles validation and updates)
-    task = pull_task(task_id, target_scope)
-    
-    # Clear completed_at timestamp
-    task.completed_at = None
-    repository.update_task(task)
-    
-    return task
+    # Validate scope (same rule as pull_task)
+    if target_scope not in VALID_SCOPE_SET:
+        raise InvalidInputError(_INVALID_SCOPE_MSG.format(target_scope))
+
+    # Single UPDATE (raises TaskNotFoundError if not found)
+    return repository.reopen_task(task_id, target_scope)
 
 
+@_cached_by_generation
 def list_tasks(
     project_id: Optional[int] = None,
     include_archived: bool = False,
@@ -201,22 +299,10 @@ def list_tasks(
 
     Notes:
         - By default, excludes archived tasks (scope='archived')
-        - Filtering happens in Python (repository returns all tasks)
-        - Future: push filtering to repository layer for performance
+        - Filtering happens in SQL (repository WHERE clause)
+        - Results are cached until the next database write
     """
-    # Get all tasks from repository
-    tasks = repository.list_tasks()
-
-    # Exclude archived tasks by default
-    if not include_archived:
-        tasks = [t for t in tasks if t.scope != SCOPE_ARCHIVED]
-
-    # Apply filters in Python
-    # Filter by project if specified
-    if project_id is not None:
-        tasks = [t for t in tasks if t.project_id == project_id]
-
-    return tasks
+    return repository.list_tasks(project_id=project_id, include_archived=include_archived)
 
 
 def update_task_title(task_id: int, new_title: str) -> Task:
@@ -240,22 +326,10 @@ def update_task_title(task_id: int, new_title: str) -> Task:
         - Automatically updates updated_at timestamp
     """
     # Validate new title
-    new_title = new_title.strip()
-    if not new_title:
-        raise InvalidInputError("Task title cannot be empty")
-
-    # Fetch task (raises TaskNotFoundError if not found)
-    task = repository.get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
-
-    # Update title
-    task.title = new_title
-
-    # Persist changes
-    repository.update_task(task)
+    new_title = _required_text(new_title, "Task title")
 
-    return task
+    # Single UPDATE (raises TaskNotFoundError if not found)
+    return repository.update_task_title(task_id, new_title)
 
 
 def update_task_description(task_id: int, new_description: str) -> Task:
@@ -278,20 +352,10 @@ def update_task_description(task_id: int, new_description: str) -> Task:
         - Automatically updates updated_at timestamp
     """
     # Strip outer whitespace but keep internal formatting
-    new_description = new_description.strip() if new_description else None
-
-    # Fetch task (raises TaskNotFoundError if not found)
-    task = repository.get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
-
-    # Update description (can be None/empty to clear)
-    task.description = new_description
+    new_description = _optional_text(new_description)
 
-    # Persist changes
-    repository.update_task(task)
-
-    return task
+    # Single UPDATE; None clears (raises TaskNotFoundError if not found)
+    return repository.update_task_description(task_id, new_description)
 
 
 def delete_task(task_id: int) -> None:
@@ -335,9 +399,7 @@ def create_project(name: str) -> Project:
         - Project names must be unique (enforced by database)
     """
     # Validate and sanitize name
-    name = name.strip()
-    if not name:
-        raise InvalidInputError("Project name cannot be empty")
+    name = _required_text(name, "Project name")
 
     # Create project via repository layer
     project = repository.create_project(name)
@@ -345,12 +407,17 @@ def create_project(name: str) -> Project:
     return project
 
 
+@_cached_by_generation
 def list_projects() -> List[Project]:
     """
     List all projects.
 
     Returns:
         List of all projects, ordered by creation date (newest first)
+
+    Notes:
+        - Results are cached until the next database write, so per-keystroke
+          completion and error messages don't re-query
     """
     return repository.list_projects()
 
@@ -372,6 +439,23 @@ def get_project(project_id: int) -> Optional[Project]:
     return repository.get_project(project_id)
 
 
+def get_projects_by_ids(project_ids: List[int]) -> List[Project]:
+    """
+    Get several projects by ID in one lookup.
+
+    Args:
+        project_ids: IDs of projects to retrieve
+
+    Returns:
+        Found projects, in the order of project_ids (missing IDs are skipped)
+
+    Notes:
+        - Use when rendering project names for a task list, instead of
+          calling get_project() per project
+    """
+    return repository.get_projects_by_ids(project_ids)
+
+
 def find_project_by_name(name: str) -> Optional[Project]:
     """
     Find project by name (case-insensitive).
@@ -386,9 +470,14 @@ def find_project_by_name(name: str) -> Optional[Project]:
         - Case-insensitive matching
         - Returns None if not found (use when existence is optional)
         - For errors, use find_project_by_name_or_raise() instead
+        - Indexed lookup in SQL; only a non-ASCII name that misses there
+          falls back to scanning all projects (SQLite folds ASCII case only)
     """
-    projects = list_projects()
-    return next((p for p in projects if p.name.lower() == name.lower()), None)
+    project = repository.get_project_by_name(name)
+    if project is None and not name.isascii():
+        folded = name.lower()
+        project = next((p for p in list_projects() if p.name.lower() == folded), None)
+    return project
 
 
 def find_project_by_name_or_raise(name: str) -> Project:
@@ -514,6 +603,27 @@ def move_task(task_id: int, column_id: int) -> Task:
     return repository.move_task(task_id, column_id)
 
 
+def move_tasks(task_ids: List[int], column_id: int) -> List[Task]:
+    """
+    Move multiple tasks to a different column (bulk operation).
+
+    Args:
+        task_ids: List of task IDs to move
+        column_id: ID of target column
+
+    Returns:
+        List of updated Task objects
+
+    Raises:
+        TaskNotFoundError: If any task_id doesn't exist (nothing is moved)
+        ColumnNotFoundError: If column_id doesn't exist
+
+    Notes:
+        - Batched UPDATE in one transaction, not a move_task() per ID
+    """
+    return repository.move_tasks(task_ids, column_id)
+
+
 def assign_task_to_project(task_id: int, project_id: int) -> Task:
     """
     Assign task to a project.
@@ -531,30 +641,17 @@ def assign_task_to_project(task_id: int, project_id: int) -> Task:
 
     Notes:
         - Automatically updates updated_at timestamp
-        - Repository validates both task and project exist
+        - Repository validates both task and project exist, inside the
+          single UPDATE
     """
-    # Fetch task (raises TaskNotFoundError if not found)
-    task = repository.get_task(task_id)
-    if not task:
-        raise TaskNotFoundError(task_id)
-
-    # Validate project exists (raises ProjectNotFoundError if not found)
-    project = repository.get_project(project_id)
-    if not project:
-        raise ProjectNotFoundError(project_id)
-
-    # Update task's project_id
-    task.project_id = project_id
-
-    # Persist changes
-    repository.update_task(task)
-
-    return task
+    # Single UPDATE (raises ProjectNotFoundError / TaskNotFoundError)
+    return repository.update_task_project(task_id, project_id)
 
 
 # --- Task Filtering ---
 
 
+@_cached_by_generation
 def list_tasks_by_project(project_id: int) -> List[Task]:
     """
     List all tasks for a specific project.
@@ -568,11 +665,12 @@ def list_tasks_by_project(project_id: int) -> List[Task]:
     Notes:
         - Returns empty list if project doesn't exist or has no tasks
         - Does not validate that project exists (allows querying non-existent projects)
+        - Results are cached until the next database write
     """
-    tasks = repository.list_tasks()
-    return [t for t in tasks if t.project_id == project_id]
+    return repository.list_tasks(project_id=project_id)
 
 
+@_cached_by_generation
 def list_tasks_by_column(column_id: int) -> List[Task]:
     """
     List all tasks in a specific column.
@@ -586,18 +684,104 @@ def list_tasks_by_column(column_id: int) -> List[Task]:
     Notes:
         - Returns empty list if column doesn't exist or has no tasks
         - Does not validate that column exists (allows querying non-existent columns)
+        - Results are cached until the next database write
+    """
+    return repository.list_tasks(column_id=column_id)
+
+
+def iter_tasks_by_project(project_id: int) -> Iterator[Task]:
+    """
+    Stream tasks for a specific project (newest first).
+
+    Generator counterpart of list_tasks_by_project(); rows are read as the
+    caller advances, so any()/next() stop without loading the rest.
+    """
+    return repository.iter_tasks(project_id=project_id)
+
+
+def iter_tasks_by_column(column_id: int) -> Iterator[Task]:
+    """
+    Stream tasks in a specific column (newest first).
+
+    Generator counterpart of list_tasks_by_column().
+    """
+    return repository.iter_tasks(column_id=column_id)
+
+
+def iter_tasks_by_scope(scope: str, project_id: Optional[int] = None) -> Iterator[Task]:
+    """
+    Stream tasks in a scope, optionally for one project (newest first).
+
+    Args:
+        scope: Task scope ('backlog', 'week', 'today', 'archived')
+        project_id: Only tasks in this project (None = all projects)
+
+    Raises:
+        InvalidInputError: If scope is invalid (raised on call, not on
+            first iteration)
     """
-    tasks = repository.list_tasks()
-    return [t for t in tasks if t.column_id == column_id]
+    if scope not in VALID_SCOPE_SET:
+        raise InvalidInputError(_INVALID_SCOPE_MSG.format(scope))
+
+    return repository.iter_tasks_by_scope(scope, project_id=project_id)
 
 
 # --- Pull-Based Workflow (Scope Management) ---
 
 
-def list_backlog() -> List[Task]:
+# View name -> scope it lists ("completed" is the archive, newest first)
+_VIEW_SCOPES = {
+    "backlog": SCOPE_BACKLOG,
+    "week": SCOPE_WEEK,
+    "today": SCOPE_TODAY,
+    "completed": SCOPE_ARCHIVED,
+}
+_INVALID_VIEW_MSG = "Invalid view '{}'. Must be one of: " + ", ".join(_VIEW_SCOPES)
+
+
+@_cached_by_generation
+def list_view(view: str, project_id: Optional[int] = None, since: Optional[str] = None) -> List[Task]:
+    """
+    List the tasks of a named view.
+
+    Args:
+        view: 'backlog', 'week', 'today', or 'completed'
+        project_id: Only tasks in this project (None = all projects)
+        since: ISO-8601 timestamp; 'completed' view only, limits it to tasks
+            completed (or, with no completed_at, archived) at or after it
+            (None = all)
+
+    Returns:
+        Scope views ordered by creation date, the completed view by
+        completion date (newest first)
+
+    Raises:
+        InvalidInputError: If view is unknown, or since is given for a
+            scope view
+
+    Notes:
+        - Results are cached until the next database write
+        - list_backlog/week/today/completed are thin wrappers over this
+    """
+    scope = _VIEW_SCOPES.get(view)
+    if scope is None:
+        raise InvalidInputError(_INVALID_VIEW_MSG.format(view))
+
+    if scope == SCOPE_ARCHIVED:
+        return repository.list_completed_tasks(since, project_id)
+
+    if since is not None:
+        raise InvalidInputError(f"'since' only applies to the completed view, not '{view}'")
+    return repository.list_tasks_by_scope(scope, project_id)
+
+
+def list_backlog(project_id: Optional[int] = None) -> List[Task]:
     """
     List all tasks in the backlog scope.
 
+    Args:
+        project_id: Only tasks in this project (None = all projects)
+
     Returns:
         List of tasks with scope='backlog', ordered by creation date (newest first)
 
@@ -606,13 +790,16 @@ def list_backlog() -> List[Task]:
         - This is where tasks live until pulled into week or today
         - Already filtered by scope, so no need to exclude archived
     """
-    return repository.list_tasks_by_scope(SCOPE_BACKLOG)
+    return list_view("backlog", project_id)
 
 
-def list_week() -> List[Task]:
+def list_week(project_id: Optional[int] = None) -> List[Task]:
     """
     List all tasks in the week scope.
 
+    Args:
+        project_id: Only tasks in this project (None = all projects)
+
     Returns:
         List of tasks with scope='week', ordered by creation date (newest first)
 
@@ -621,13 +808,16 @@ def list_week() -> List[Task]:
         - Tasks are manually pulled here from backlog (typically Monday planning)
         - Already filtered by scope, so no need to exclude archived
     """
-    return repository.list_tasks_by_scope(SCOPE_WEEK)
+    return list_view("week", project_id)
 
 
-def list_today() -> List[Task]:
+def list_today(project_id: Optional[int] = None) -> List[Task]:
     """
     List all tasks in the today scope.
 
+    Args:
+        project_id: Only tasks in this project (None = all projects)
+
     Returns:
         List of tasks with scope='today', ordered by creation date (newest first)
 
@@ -637,13 +827,19 @@ def list_today() -> List[Task]:
         - This is the primary view for "blitz mode"
         - Already filtered by scope, so no need to exclude archived
     """
-    return repository.list_tasks_by_scope(SCOPE_TODAY)
+    return list_view("today", project_id)
 
 
-def list_completed() -> List[Task]:
+def list_completed(since: Optional[str] = None, project_id: Optional[int] = None) -> List[Task]:
     """
     List all completed tasks (those in archived scope).
 
+    Args:
+        since: Optional ISO-8601 timestamp; only tasks completed at or after
+            it are returned, going by updated_at for tasks archived without
+            a completed_at (None = all completed tasks)
+        project_id: Only tasks in this project (None = all projects)
+
     Returns:
         List of completed tasks, ordered by completion date (newest first)
 
@@ -651,11 +847,32 @@ def list_completed() -> List[Task]:
         - Returns tasks with scope='archived'
         - Useful for reviewing completed work
         - Can be reactivated by pulling back to backlog/week/today
+        - The filters and the ordering are applied in SQL, not here
     """
-    tasks = repository.list_tasks_by_scope(SCOPE_ARCHIVED)
-    # Sort by completed_at if available, otherwise by updated_at
-    tasks.sort(key=lambda t: t.completed_at or t.updated_at or "", reverse=True)
-    return tasks
+    return list_view("completed", project_id, since)
+
+
+def list_tasks_full(scope: Optional[str] = None) -> List[Tuple[Task, Optional[str], Optional[str]]]:
+    """
+    List tasks with their column and project names resolved.
+
+    Args:
+        scope: Optional scope filter ('backlog', 'week', 'today', 'archived')
+
+    Returns:
+        (task, column_name, project_name) tuples, newest first
+
+    Raises:
+        InvalidInputError: If scope is invalid
+
+    Notes:
+        - Single JOIN in the repository; use instead of per-task
+          get_project()/list_columns() lookups when rendering names
+    """
+    if scope is not None and scope not in VALID_SCOPE_SET:
+        raise InvalidInputError(_INVALID_SCOPE_MSG.format(scope))
+
+    return repository.list_tasks_full(scope)
 
 
 def pull_task(task_id: int, target_scope: str) -> Task:
@@ -680,45 +897,45 @@ def pull_task(task_id: int, target_scope: str) -> Task:
         - Automatically updates updated_at timestamp
     """
     # Validate target scope (now includes archived)
-    if target_scope not in VALID_SCOPES:
-        raise InvalidInputError(
-            f"Invalid scope '{target_scope}'. Must be one of: {', '.join(VALID_SCOPES)}"
-        )
+    if target_scope not in VALID_SCOPE_SET:
+        raise InvalidInputError(_INVALID_SCOPE_MSG.format(target_scope))
 
     # Repository handles existence check and update
     return repository.update_task_scope(task_id, target_scope)
 
 
-def pull_tasks(task_ids: List[int], target_scope: str) -> List[Task]:
+def pull_tasks(task_ids: List[int], target_scope: str, skip_missing: bool = False) -> List[Task]:
     """
     Pull multiple tasks into a different scope (bulk operation).
 
     Args:
         task_ids: List of task IDs to pull
         target_scope: Target scope ('backlog', 'week', or 'today')
+        skip_missing: Pull the tasks that exist and leave missing IDs out
+            of the result instead of raising
 
     Returns:
         List of successfully updated Task objects
 
     Raises:
         InvalidInputError: If target_scope is invalid
-        TaskNotFoundError: If any task_id doesn't exist (raised for first failure)
+        TaskNotFoundError: If any task_id doesn't exist and skip_missing is
+            False (raised for first failure)
 
     Notes:
-        - Validates scope once, then pulls each task individually
-        - If a task fails, the error bubbles up (not caught here)
+        - Validates scope once, then pulls every task with batched UPDATEs
+          in one transaction
+        - If a task fails (and skip_missing is False), the error bubbles up
+          and no task is moved
+        - Duplicate IDs are pulled (and returned) once
         - Use this for bulk pulls like "pull 1,2,3 into week"
     """
     # Validate target scope once (now includes archived)
-    if target_scope not in VALID_SCOPES:
-        raise InvalidInputError(
-            f"Invalid scope '{target_scope}'. Must be one of: {', '.join(VALID_SCOPES)}"
-        )
+    if target_scope not in VALID_SCOPE_SET:
+        raise InvalidInputError(_INVALID_SCOPE_MSG.format(target_scope))
 
-    # Pull each task (let errors bubble up for CLI/REPL to handle)
-    updated_tasks = []
-    for task_id in task_ids:
-        task = repository.update_task_scope(task_id, target_scope)
-        updated_tasks.append(task)
+    if not task_ids:
+        return []
 
-    return updated_tasks
+    # Let errors bubble up for CLI/REPL to handle
+    return repository.update_tasks_scope(task_ids, target_scope, skip_missing)
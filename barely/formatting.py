@@ -3,12 +3,16 @@ FILE: barely/formatting.py
 PURPOSE: Shared formatting utilities for CLI and REPL output
 EXPORTS:
   - TaskFormatter: Class for formatting tasks
-  - format_task_ids: Parse comma-separated task IDs
+  - parse_task_ids, parse_project_ids: Parse comma-separated IDs
+  - SCOPE_STYLES, SCOPE_CELLS, NO_PROJECT_CELL: Table cell styling shared
+    with barely.repl.display
 DEPENDENCIES:
   - rich (for table formatting)
   - json (for JSON serialization)
+  - operator (attrgetter/itemgetter for per-row field extraction)
   - typing (type hints)
   - barely.core.models (Task, Project)
+  - barely.core.constants (VALID_SCOPES)
 NOTES:
   - Centralized formatting logic for consistency
   - Used by both CLI and REPL
@@ -16,12 +20,47 @@ NOTES:
 """
 
 import json
+from operator import attrgetter, itemgetter
 from typing import List, Optional, Dict, Any
 from rich.table import Table
 from rich.text import Text
 
+from .core.constants import VALID_SCOPES
 from .core.models import Task, Project
 
+# Scope column colors (unknown scopes render white)
+SCOPE_STYLES = {
+    "backlog": "dim",
+    "week": "blue",
+    "today": "bright_magenta",
+    "archived": "green",
+}
+
+# Pre-rendered Scope cells, so rows do a dict lookup instead of formatting
+SCOPE_CELLS = {
+    scope: "[{0}]{1}[/{0}]".format(SCOPE_STYLES.get(scope, "white"), scope)
+    for scope in VALID_SCOPES
+}
+NO_PROJECT_CELL = "-"
+
+# Task fields in to_json_array output, in order, and one getter for them all
+_TASK_JSON_FIELDS = (
+    "id",
+    "title",
+    "status",
+    "scope",
+    "column_id",
+    "project_id",
+    "created_at",
+    "completed_at",
+    "updated_at",
+)
+_task_json_values = attrgetter(*_TASK_JSON_FIELDS)
+
+# Fields read per row by create_table() / to_raw_lines(), fetched in one call
+_task_row_values = attrgetter("id", "title", "scope", "project_id", "column_id")
+_task_line_values = attrgetter("id", "title", "scope")
+
 
 class TaskFormatter:
     """Centralized task display formatting."""
@@ -60,45 +99,35 @@ class TaskFormatter:
         if show_column:
             table.add_column("Column", style="blue")
 
-        # Build project name cache for efficient lookups
-        project_cache = {}
+        # Build project cells once per project with one batched lookup;
+        # tasks without a project fall through to NO_PROJECT_CELL
+        project_cells = {}
         if show_project:
             project_ids = {task.project_id for task in tasks if task.project_id}
-            for proj_id in project_ids:
+            if project_ids:
                 # Import here to avoid circular dependency
                 from .core import service
-                project = service.get_project(proj_id)
-                if project:
-                    project_cache[proj_id] = project.name
-
-        # Add rows
-        for task in tasks:
-            row_data = [str(task.id), task.title]
-
-            if show_scope:
-                # Color code scope
-                scope_style_map = {
-                    "backlog": "dim",
-                    "week": "blue",
-                    "today": "bright_magenta",
-                    "archived": "green",
+                names = {p.id: p.name for p in service.get_projects_by_ids(list(project_ids))}
+                project_cells = {
+                    pid: names.get(pid, f"[dim]ID:{pid}[/dim]") for pid in project_ids
                 }
-                scope_style = scope_style_map.get(task.scope, "white")
-                row_data.append(f"[{scope_style}]{task.scope}[/{scope_style}]")
-
-            if show_project:
-                if task.project_id:
-                    project_name = project_cache.get(
-                        task.project_id, f"[dim]ID:{task.project_id}[/dim]"
-                    )
-                else:
-                    project_name = "-"
-                row_data.append(project_name)
 
-            if show_column:
-                row_data.append(str(task.column_id))
+        # Pick the shown cells out of (ID, Title, Scope, Project, Column),
+        # decided once here rather than branching on every row
+        optional_cells = ((2, show_scope), (3, show_project), (4, show_column))
+        pick_cells = itemgetter(0, 1, *[index for index, shown in optional_cells if shown])
 
-            table.add_row(*row_data)
+        # Add rows
+        for task in tasks:
+            task_id, task_title, scope, project_id, column_id = _task_row_values(task)
+            table.add_row(*pick_cells((
+                str(task_id),
+                task_title,
+                # Color-coded scope (schema only allows VALID_SCOPES)
+                SCOPE_CELLS.get(scope) or f"[white]{scope}[/white]",
+                project_cells.get(project_id, NO_PROJECT_CELL),
+                str(column_id),
+            )))
 
         return table
 
@@ -112,22 +141,20 @@ class TaskFormatter:
 
         Returns:
             JSON string with array of task objects
+
+        Notes:
+            - Identical to json.dumps(list_of_dicts, indent=2), but each task
+              is encoded as it is visited, so the list of dicts is never built
         """
-        tasks_data = [
-            {
-                "id": t.id,
-                "title": t.title,
-                "status": t.status,
-                "scope": t.scope,
-                "column_id": t.column_id,
-                "project_id": t.project_id,
-                "created_at": t.created_at,
-                "completed_at": t.completed_at,
-                "updated_at": t.updated_at,
-            }
+        encode = json.JSONEncoder(indent=2).encode
+        # Indent each element one level, as the enclosing array would
+        items = [
+            encode(dict(zip(_TASK_JSON_FIELDS, _task_json_values(t)))).replace("\n", "\n  ")
             for t in tasks
         ]
-        return json.dumps(tasks_data, indent=2)
+        if not items:
+            return "[]"
+        return "[\n  " + ",\n  ".join(items) + "\n]"
 
     @staticmethod
     def to_json_dict(task: Task) -> Dict[str, Any]:
@@ -166,8 +193,9 @@ class TaskFormatter:
         """
         lines = []
         for task in tasks:
-            status_marker = "✓" if task.scope == "archived" else " "
-            lines.append(f"{task.id}: [{status_marker}] {task.title}")
+            task_id, task_title, scope = _task_line_values(task)
+            status_marker = "✓" if scope == "archived" else " "
+            lines.append(f"{task_id}: [{status_marker}] {task_title}")
         return lines
 
 
@@ -184,23 +212,11 @@ def parse_task_ids(id_string: str) -> List[int]:
     Raises:
         ValueError: If any ID is not a valid integer
     """
-    ids = [id.strip() for id in id_string.split(",")]
-    return [int(id) for id in ids if id]
+    # Single pass (int() ignores surrounding whitespace); blank entries such
+    # as "1,,2" or a trailing comma are skipped
+    return [int(part) for part in id_string.split(",") if part.strip()]
 
 
-def parse_project_ids(id_string: str) -> List[int]:
-    """
-    Parse comma-separated project IDs.
-
-    Args:
-        id_string: Comma-separated string of IDs (e.g., "1,2,3")
-
-    Returns:
-        List of integers
-
-    Raises:
-        ValueError: If any ID is not a valid integer
-    """
-    ids = [id.strip() for id in id_string.split(",")]
-    return [int(id) for id in ids if id]
+# Project IDs parse exactly like task IDs
+parse_project_ids = parse_task_ids
 
@@ -5,15 +5,21 @@ EXPORTS:
   - run_blitz_mode() -> None
 DEPENDENCIES:
   - core.service (list_today, complete_task, uncomplete_task)
+    (writes applied in order on a background thread)
   - rich (Console, Layout, Panel, Text, Live)
   - numpy (audio processing)
   - pyaudiowpatch (audio capture)
   - keyboard input handling
 NOTES:
   - Displays tasks from 'today' scope one at a time
-  - Live audio waveform visualization
+  - Live audio waveform visualization (int16 frames straight from the
+    stream; only the drawn columns are converted and mixed to mono)
+  - Audio is captured on a background thread into a lock-free AudioRing;
+    the render loop copies out the newest complete chunk and never blocks
+    on the device
   - Shows upcoming tasks in list below current task
   - Keyboard controls: d=done, u=un-complete, ↑/↓=navigate, q=quit, ?=details
+    (read on a background thread into a queue the render loop drains)
   - Completed tasks show with different styling when navigated to
   - Returns to REPL when user quits
 """
@@ -29,6 +35,7 @@ import time
 import sys
 import msvcrt  # For Windows keyboard input
 import threading
+import queue
 
 from ..core import service
 from ..core.models import Task
@@ -43,9 +50,16 @@ WAVEFORM_WIDTH = 76
 UPDATE_FPS = 30
 AMPLITUDE_SCALE = 0.8
 NUM_ROWS = 5
+RING_CHUNKS = 8  # Captured chunks kept in the audio ring buffer
+KEY_POLL_INTERVAL = 1.0 / UPDATE_FPS  # Key thread checks once per frame, like the old loop
 
 # Sub-pixel character set for waveform
 SUBPIXEL_CHARS = ['‾', '¯', '˗', '-', '─', '-', 'ˍ', '_', '‗']
+# Same characters as an array, so a whole frame is picked with one fancy index
+_SUBPIXEL_ARRAY = np.array(SUBPIXEL_CHARS, dtype='<U1')
+_SUBPIXEL_LAST = len(SUBPIXEL_CHARS) - 1
+# Waveform character grid, one contiguous block filled in place each frame
+_WAVE_GRID = np.empty((NUM_ROWS, WAVEFORM_WIDTH), dtype='<U1')
 
 # Audio state
 audio_stream = None
@@ -56,73 +70,131 @@ audio_lock = threading.Lock()  # Protect audio state access
 audio_init_timeout = 5.0  # Maximum time to wait for audio initialization
 
 
-def render_waveform(audio_data, width=WAVEFORM_WIDTH, height=NUM_ROWS):
+def waveform_cells(audio_data, width=WAVEFORM_WIDTH, height=NUM_ROWS, channels=1):
+    """
+    Map audio samples to waveform cells: one (row, sub-pixel char index) per column.
+
+    audio_data may be raw interleaved int16 frames. Each column is the mean
+    of a block of `step` frames across all channels (a box filter, so loud
+    transients don't alias into noise), reduced in one pass straight into
+    float32. Normalize, scale and flip then fold into one multiply-add and
+    a single clip, all in place on that one small buffer.
+    """
+    # Downsample to fit width: one contiguous block of frames per column
+    frame_count = len(audio_data) // channels
+    step = max(frame_count // width, 1)
+    columns = min(width, frame_count // step)
+    blocks = audio_data[:columns * step * channels].reshape(columns, step * channels)
+    # Block sum, not mean: peak normalization below cancels the 1/(step*channels)
+    positions = blocks.sum(axis=1, dtype=np.result_type(audio_data.dtype, np.float32))
+
+    # Normalize, scale and flip into row space as one affine map
+    # (max of both extremes is abs-max without np.abs)
+    center = (height - 1) / 2.0
+    gain = center
+    if len(positions) > 0:
+        max_val = max(positions.max(), -positions.min())
+        if max_val > 0:
+            gain = center * AMPLITUDE_SCALE / max_val
+    positions *= -gain
+    positions += center
+    # Same as clipping the normalized samples to [-1, 1] before mapping
+    np.clip(positions, 0, height - 1, out=positions)
+
+    # Integer part picks the row, fractional part the character (positions
+    # are clipped non-negative, so truncating is floor without the extra pass)
+    rows = positions.astype(np.intp)
+    positions -= rows
+    positions *= _SUBPIXEL_LAST
+    char_indices = np.minimum(positions.astype(np.intp), _SUBPIXEL_LAST)
+    return rows, char_indices
+
+
+# Most recent rendered waveform and the cells it was drawn from
+_last_waveform = (None, None)
+
+
+def render_waveform(audio_data, width=WAVEFORM_WIDTH, height=NUM_ROWS, channels=1):
     """
     Render waveform with sub-pixel resolution.
     Each row shows fractional positions using different characters.
     """
     if len(audio_data) == 0:
         # Draw center line when no audio
-        center_row = height // 2
-        grid = [[' ' for _ in range(width)] for _ in range(height)]
-        for x in range(width):
-            grid[center_row][x] = '─'
-        return grid_to_text(grid, height)
-
-    # Downsample to fit width
-    step = len(audio_data) // width
-    if step < 1:
-        step = 1
-    samples = audio_data[::step][:width]
-
-    # Normalize and scale
-    if len(samples) > 0:
-        max_val = np.abs(samples).max()
-        if max_val > 0:
-            samples = samples / max_val * AMPLITUDE_SCALE
-            samples = np.clip(samples, -1, 1)
+        if width == WAVEFORM_WIDTH and height == NUM_ROWS:
+            return _NO_AUDIO_TEXT
+        return _center_line_text(width, height)
 
-    # Map to vertical positions with sub-pixel precision
-    center = (height - 1) / 2.0
-    positions = ((-samples) * center + center)
-    positions = np.clip(positions, 0, height - 0.001)
+    global _last_waveform
+
+    rows, char_indices = waveform_cells(audio_data, width, height, channels)
+
+    # Same cells as last frame (e.g. steady silence): hand back the same Text
+    signature = (width, height, rows.tobytes(), char_indices.tobytes())
+    if _last_waveform[0] == signature:
+        return _last_waveform[1]
+
+    # Contiguous character grid; the default-size one is reused every frame
+    if (height, width) == _WAVE_GRID.shape:
+        grid = _WAVE_GRID
+    else:
+        grid = np.empty((height, width), dtype='<U1')
+    grid.fill(' ')
+    grid[rows, np.arange(len(rows))] = _SUBPIXEL_ARRAY[char_indices]
+
+    # View each row's characters as one string (no per-character join)
+    lines = grid.view(f'<U{width}').ravel().tolist()
+    wave_text = grid_to_text(lines, height)
+    _last_waveform = (signature, wave_text)
+    return wave_text
 
-    # Create character grid
-    grid = [[' ' for _ in range(width)] for _ in range(height)]
 
-    # Draw waveform with sub-pixel resolution
-    for x, pos in enumerate(positions):
-        if x < width:
-            row = int(pos)
-            fraction = pos - row
-            char_index = int(fraction * (len(SUBPIXEL_CHARS) - 1))
-            char_index = min(char_index, len(SUBPIXEL_CHARS) - 1)
-            grid[row][x] = SUBPIXEL_CHARS[char_index]
+def _row_style(row_idx, height):
+    """Waveform row color: brightest on the center row, fading outward."""
+    distance = abs(row_idx - height // 2)
 
-    return grid_to_text(grid, height)
+    if distance == 0:
+        return "bright_cyan"
+    elif distance == 1:
+        return "cyan"
+    return "blue"
+
+
+# Row colors for the default waveform height, computed once
+_ROW_STYLES = tuple(_row_style(row_idx, NUM_ROWS) for row_idx in range(NUM_ROWS))
 
 
 def grid_to_text(grid, height):
-    """Convert character grid to Rich Text with colors."""
-    result = Text()
-    center = height // 2
-
-    for row_idx, row in enumerate(grid):
-        line = ''.join(row)
-        distance = abs(row_idx - center)
-
-        if distance == 0:
-            color = "bright_cyan"
-        elif distance == 1:
-            color = "cyan"
-        else:
-            color = "blue"
+    """Convert character grid (rows of characters, or row strings) to Rich Text with colors."""
+    if height == NUM_ROWS:
+        styles = _ROW_STYLES
+    else:
+        styles = [_row_style(row_idx, height) for row_idx in range(height)]
 
-        result.append(line, style=color)
-        if row_idx < height - 1:
-            result.append("\n")
+    # One styled run per row, newline-separated, assembled in a single call
+    parts = []
+    for row, style in zip(grid, styles):
+        parts += ((''.join(row), style), "\n")
+    return Text.assemble(*parts[:-1])
 
-    return result
+
+def _center_line_text(width, height):
+    """Flat line on the center row, shown when there is no audio."""
+    lines = [' ' * width] * height
+    lines[height // 2] = '─' * width
+    return grid_to_text(lines, height)
+
+
+# Waveform-panel contents that never change, built once rather than per frame
+# (reusing the same Text also lets create_wave_panel reuse its Panel)
+_NO_AUDIO_TEXT = _center_line_text(WAVEFORM_WIDTH, NUM_ROWS)
+_CONNECTING_TEXT = Text("Connecting to audio...", style="dim yellow")
+_WAITING_TEXT = Text("Waiting for audio...", style="dim")
+_DISCONNECTED_TEXT = Text("Audio disconnected", style="dim")
+_NO_DEVICE_TEXT = Text("No audio device", style="dim")
+_AUDIO_ERROR_TEXT = Text("Audio error", style="dim red")
+_AUDIO_DISABLED_TEXT = Text("Audio disabled (errors)", style="dim red")
+_PLACEHOLDER_TEXT = Text("Connecting to audio...", style="dim")
 
 
 def create_upcoming_list(tasks, current_index, completed_ids):
@@ -139,7 +211,8 @@ def create_upcoming_list(tasks, current_index, completed_ids):
     Returns:
         Rich Text with scrolling task list window
     """
-    upcoming = Text()
+    # (text, style) runs, assembled into one Text at the end
+    parts = []
     total_tasks = len(tasks)
     window_size = 8  # How many tasks to show
 
@@ -154,7 +227,7 @@ def create_upcoming_list(tasks, current_index, completed_ids):
 
     # Show indicator if there are tasks before
     if start_idx > 0:
-        upcoming.append(f"  ↑ {start_idx} more above...\n", style="dim italic")
+        parts.append((f"  ↑ {start_idx} more above...\n", "dim italic"))
 
     # Show tasks in window
     for i in range(start_idx, end_idx):
@@ -165,41 +238,67 @@ def create_upcoming_list(tasks, current_index, completed_ids):
         # Determine style based on state
         if i == current_index:
             # Current task - highlighted
-            upcoming.append(f"→ {position}. ", style="bold cyan")
-            upcoming.append(task.title[:48], style="bold white")
-            if len(task.title) > 48:
-                upcoming.append("...", style="bold white")
+            prefix = (f"→ {position}. ", "bold cyan")
+            title_style = "bold white"
         elif task.id in completed_ids:
             # Completed task - strikethrough
-            upcoming.append(f"  {position}. ", style="dim")
-            upcoming.append(task.title[:48], style="dim strike")
-            if len(task.title) > 48:
-                upcoming.append("...", style="dim strike")
+            prefix = (f"  {position}. ", "dim")
+            title_style = "dim strike"
         else:
             # Future task - normal
-            upcoming.append(f"  {position}. ", style="dim")
-            upcoming.append(task.title[:48], style="dim white")
-            if len(task.title) > 48:
-                upcoming.append("...", style="dim white")
+            prefix = (f"  {position}. ", "dim")
+            title_style = "dim white"
 
-        upcoming.append("\n")
+        title = task.title if len(task.title) <= 48 else task.title[:48] + "..."
+        parts += (prefix, (title, title_style), "\n")
 
     # Show indicator if there are tasks after
     if end_idx < total_tasks:
         remaining = total_tasks - end_idx
-        upcoming.append(f"  ↓ {remaining} more below...\n", style="dim italic")
+        parts.append((f"  ↓ {remaining} more below...\n", "dim italic"))
 
     # Show total count at bottom
     completed_count = len(completed_ids)
-    upcoming.append(f"\n  [{completed_count}/{total_tasks} completed]", style="dim cyan")
+    parts.append((f"\n  [{completed_count}/{total_tasks} completed]", "dim cyan"))
 
-    return upcoming
+    return Text.assemble(*parts)
 
 
-def create_blitz_layout(task, tasks, task_index, progress_text, completed_ids, wave_text=None, show_completion=False):
-    """Create the blitz mode layout with task, upcoming tasks, and waveform."""
+def _build_controls_panel():
+    """Build the controls footer (it never changes, so this runs once at import)."""
+    controls = Text()
+    controls.append("d", style="bold green")
+    controls.append("=done  ", style="dim")
+    controls.append("u", style="bold yellow")
+    controls.append("=un-complete  ", style="dim")
+    controls.append("↑/↓", style="bold yellow")
+    controls.append("=navigate  ", style="dim")
+    controls.append("?", style="bold blue")
+    controls.append("=details  ", style="dim")
+    controls.append("q", style="bold red")
+    controls.append("=quit", style="dim")
 
-    is_completed = task.id in completed_ids or task.scope == "archived"
+    return Panel(
+        controls,
+        border_style="dim",
+        padding=(0, 1),
+        width=80
+    )
+
+
+_CONTROLS_PANEL = _build_controls_panel()
+
+# Most recent task panel and the state it was built from
+_last_task_panel = (None, None)
+
+
+def create_task_panel(task, progress_text, is_completed, show_completion=False):
+    """Create the current-task panel, reusing the last one if nothing changed."""
+    global _last_task_panel
+
+    key = (task.id, task.title, task.description, progress_text, is_completed, show_completion)
+    if _last_task_panel[0] == key:
+        return _last_task_panel[1]
 
     if show_completion:
         # Show completion state
@@ -264,19 +363,49 @@ def create_blitz_layout(task, tasks, task_index, progress_text, completed_ids, w
             width=80
         )
 
-    # Full task list
-    task_list = create_upcoming_list(tasks, task_index, completed_ids)
+    _last_task_panel = (key, task_panel)
+    return task_panel
+
+
+# Most recent task list panel, the task list it shows, and its state
+_last_task_list_panel = (None, None, None)
+
+
+def create_task_list_panel(tasks, current_index, completed_ids):
+    """
+    Create the task list panel, reusing the last one until something changes.
+
+    The list only changes on a keypress (navigate, done, un-complete), so
+    most frames hit the cache and skip create_upcoming_list entirely.
+    """
+    global _last_task_list_panel
+
+    state = (len(tasks), current_index, frozenset(completed_ids))
+    cached_tasks, cached_state, cached_panel = _last_task_list_panel
+    if cached_tasks is tasks and cached_state == state:
+        return cached_panel
+
     task_list_panel = Panel(
-        task_list,
+        create_upcoming_list(tasks, current_index, completed_ids),
         title="[bold]Today's Tasks[/bold]",
         border_style="dim blue",
         padding=(0, 1),
         width=80
     )
+    _last_task_list_panel = (tasks, state, task_list_panel)
+    return task_list_panel
+
+
+# Most recent waveform panel and the Text it wraps
+_last_wave_panel = (None, None)
 
-    # Waveform display
-    if wave_text is None:
-        wave_text = Text("Connecting to audio...", style="dim")
+
+def create_wave_panel(wave_text):
+    """Create the waveform panel, reusing the last one while the Text is the same object."""
+    global _last_wave_panel
+
+    if _last_wave_panel[0] is wave_text:
+        return _last_wave_panel[1]
 
     wave_panel = Panel(
         wave_text,
@@ -285,36 +414,60 @@ def create_blitz_layout(task, tasks, task_index, progress_text, completed_ids, w
         padding=(0, 1),
         width=80
     )
+    _last_wave_panel = (wave_text, wave_panel)
+    return wave_panel
 
-    # Controls
-    controls = Text()
-    controls.append("d", style="bold green")
-    controls.append("=done  ", style="dim")
-    controls.append("u", style="bold yellow")
-    controls.append("=un-complete  ", style="dim")
-    controls.append("↑/↓", style="bold yellow")
-    controls.append("=navigate  ", style="dim")
-    controls.append("?", style="bold blue")
-    controls.append("=details  ", style="dim")
-    controls.append("q", style="bold red")
-    controls.append("=quit", style="dim")
-
-    controls_panel = Panel(
-        controls,
-        border_style="dim",
-        padding=(0, 1),
-        width=80
-    )
 
+def build_blitz_layout():
+    """Create the blitz layout skeleton; update_blitz_layout fills in the panels."""
     # Stack vertically
     layout = Layout()
     layout.split_column(
-        Layout(task_panel, size=12),  # Fixed size with room for description
-        Layout(task_list_panel, size=10),  # Larger to fit all tasks
-        Layout(wave_panel, size=7),
-        Layout(controls_panel, size=3)
+        Layout(name="task", size=12),  # Fixed size with room for description
+        Layout(name="tasks", size=10),  # Larger to fit all tasks
+        Layout(name="wave", size=7),
+        Layout(_CONTROLS_PANEL, name="controls", size=3)
     )
+    return layout
+
 
+def update_blitz_layout(layout, task, tasks, task_index, progress_text, completed_ids, wave_text=None, show_completion=False):
+    """
+    Swap changed panels into a layout from build_blitz_layout, in place.
+
+    Returns True if any panel was replaced (i.e. the screen needs a refresh).
+    """
+
+    is_completed = task.id in completed_ids or task.scope == "archived"
+
+    # Waveform display
+    if wave_text is None:
+        wave_text = _PLACEHOLDER_TEXT
+
+    changed = _swap_panel(layout, "task", create_task_panel(task, progress_text, is_completed, show_completion))
+    changed |= _swap_panel(layout, "tasks", create_task_list_panel(tasks, task_index, completed_ids))
+    changed |= update_wave_panel(layout, wave_text)
+    return changed
+
+
+def update_wave_panel(layout, wave_text):
+    """Swap only the waveform panel (the per-frame case); True if it changed."""
+    return _swap_panel(layout, "wave", create_wave_panel(wave_text))
+
+
+def _swap_panel(layout, name, panel):
+    """Put panel in the named region unless it is already there; True if swapped."""
+    region = layout[name]
+    if region.renderable is panel:
+        return False
+    region.update(panel)
+    return True
+
+
+def create_blitz_layout(task, tasks, task_index, progress_text, completed_ids, wave_text=None, show_completion=False):
+    """Create the blitz mode layout with task, upcoming tasks, and waveform."""
+    layout = build_blitz_layout()
+    update_blitz_layout(layout, task, tasks, task_index, progress_text, completed_ids, wave_text, show_completion)
     return layout
 
 
@@ -429,6 +582,88 @@ def init_audio_background():
             pass
 
 
+class AudioRing:
+    """
+    Ring buffer of interleaved int16 samples, filled by the capture thread.
+
+    Single producer (capture_audio) and single consumer (the render loop),
+    without locks: the producer copies a chunk in before publishing it by
+    bumping `written` (a single attribute store), and overwrites the oldest
+    samples first. The consumer's copy of the newest chunk is therefore a
+    complete frame that the producer won't touch for several more reads;
+    in the rare case it might have, latest() copies again. The copy acts
+    as the back buffer of a double-buffered pipeline.
+    """
+
+    def __init__(self, capacity):
+        self.buffer = np.zeros(capacity, dtype=np.int16)
+        self._scratch = np.empty(capacity, dtype=np.int16)  # Reused by latest()
+        self.written = 0  # Total samples written since creation
+        self.error = None  # Last capture error, if any
+
+    def write(self, data):
+        """Append raw int16 bytes, overwriting the oldest samples."""
+        capacity = len(self.buffer)
+        samples = np.frombuffer(data, dtype=np.int16)[-capacity:]
+        start = self.written % capacity
+        first = min(len(samples), capacity - start)
+        self.buffer[start:start + first] = samples[:first]
+        self.buffer[:len(samples) - first] = samples[first:]
+        # Publish only after the samples are in place
+        self.written += len(samples)
+
+    def latest(self, count):
+        """
+        Return (newest `count` samples, up to half the ring, total written so far).
+
+        The samples are copied into a buffer owned by the ring, so no array is
+        allocated per frame; they stay valid until the next call.
+        """
+        while True:
+            written = self.written  # One read: a consistent snapshot point
+            count = min(count, written, len(self.buffer) // 2)
+            end = written % len(self.buffer)
+            out = self._scratch[:count]
+            if end >= count:
+                out[:] = self.buffer[end - count:end]
+            else:
+                # Wrapped: tail of the buffer, then its head
+                wrapped = count - end
+                out[:wrapped] = self.buffer[-wrapped:]
+                out[wrapped:] = self.buffer[:end]
+            # Keep the copy unless the producer (allowing one write in
+            # flight) could have lapped into it meanwhile
+            if self.written - written <= len(self.buffer) - 2 * count:
+                return out, written
+
+
+def capture_audio(stream, ring, stop, max_errors):
+    """
+    Read the stream into ring until stop is set (runs on its own thread).
+
+    Blocking reads pace the thread at the device rate, so the render loop
+    never waits on PortAudio. Gives up after max_errors failed reads in a row.
+    """
+    errors = 0
+    while not stop.is_set():
+        try:
+            ring.write(stream.read(CHUNK, exception_on_overflow=False))
+            errors = 0
+        except (OSError, IOError, ValueError, AttributeError) as e:
+            ring.error = e
+            errors += 1
+            if errors >= max_errors:
+                return
+            time.sleep(1.0 / UPDATE_FPS)
+
+
+def stop_capture(thread, stop):
+    """Signal the capture thread to finish and wait for its last read."""
+    if thread is not None:
+        stop.set()
+        thread.join(timeout=1.0)
+
+
 def check_keypress():
     """Check if a key has been pressed (non-blocking, Windows)."""
     if msvcrt.kbhit():
@@ -458,6 +693,41 @@ def check_keypress():
     return None
 
 
+def read_keys(key_queue, stop):
+    """
+    Push keypresses onto key_queue until stop is set (runs on its own thread).
+
+    Polls kbhit instead of blocking in getch so the thread can exit when
+    blitz mode ends, rather than swallowing the REPL's next keystroke.
+    """
+    while not stop.is_set():
+        key = check_keypress()
+        if key is not None:
+            key_queue.put(key)
+        else:
+            stop.wait(KEY_POLL_INTERVAL)
+
+
+def apply_writes(write_queue, errors):
+    """
+    Run queued (function, args) service calls in order until a None arrives.
+
+    Runs on its own thread (with its own database connection), so the
+    render loop never waits on a write. Failures are collected in errors.
+    """
+    while True:
+        item = write_queue.get()
+        try:
+            if item is None:
+                return
+            fn, args = item
+            fn(*args)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            write_queue.task_done()
+
+
 def run_blitz_mode(project_id=None, scope=None):
     """
     Run blitz mode: focused task completion with audio visualization.
@@ -528,9 +798,35 @@ def run_blitz_mode(project_id=None, scope=None):
     completed_ids = set()  # Track completed task IDs for strikethrough
     audio_error_count = 0  # Track consecutive audio errors
     max_audio_errors = 5  # Disable audio after this many errors
+    audio_ring = None  # Filled by the capture thread once the stream is up
+    capture_thread = None
+    capture_stop = None
+    channels = 1
+    rendered_written = 0  # Ring write count behind the last rendered waveform
+    audio_wave_text = None
+
+    # Keyboard is read on its own thread; the loop just drains the queue
+    key_queue = queue.SimpleQueue()
+    key_stop = threading.Event()
+    key_thread = threading.Thread(target=read_keys, args=(key_queue, key_stop), daemon=True)
+    key_thread.start()
+
+    # Task writes are applied in order on a background thread
+    write_queue = queue.Queue()
+    write_errors = []
+    write_thread = threading.Thread(target=apply_writes, args=(write_queue, write_errors), daemon=True)
+    write_thread.start()
+
+    # Built once; panels are swapped in place as state changes
+    layout = build_blitz_layout()
 
     try:
-        with Live(console=console, refresh_per_second=UPDATE_FPS) as live:
+        # Refreshed by hand, and only on frames where a panel changed
+        with Live(console=console, auto_refresh=False) as live:
+            live.update(layout)  # Drawn on the first refresh, once panels are filled
+            ui_dirty = True  # Task and list panels need building for the first frame
+            frame_time = 1.0 / UPDATE_FPS
+            next_frame = time.monotonic()
             while True:
                 # Clamp task_index to valid range
                 task_index = max(0, min(task_index, len(tasks) - 1))
@@ -550,59 +846,45 @@ def run_blitz_mode(project_id=None, scope=None):
                             device_ref = audio_device
 
                         if stream_ref is None:
-                            wave_text = Text("Audio disconnected", style="dim")
+                            wave_text = _DISCONNECTED_TEXT
                             audio_error_count += 1
                         else:
-                            # Check if stream is active (protected)
-                            try:
-                                is_active = stream_ref.is_active()
-                            except (OSError, AttributeError):
-                                # Stream is in bad state
-                                is_active = False
-
-                            if is_active:
-                                try:
-                                    # Check if any data is available before reading (non-blocking)
-                                    # get_read_available() returns number of frames available
-                                    frames_available = stream_ref.get_read_available()
-                                    if frames_available > 0:
-                                        # Read available data (up to CHUNK size) - non-blocking
-                                        read_size = min(CHUNK, frames_available)
-                                        data = stream_ref.read(read_size, exception_on_overflow=False)
-                                        
-                                        if len(data) > 0:
-                                            audio_array = np.frombuffer(data, dtype=np.int16).astype(np.float32)
-
-                                            if device_ref and device_ref.get("maxInputChannels", 1) > 1:
-                                                audio_array = audio_array.reshape(-1, device_ref["maxInputChannels"])
-                                                audio_array = np.mean(audio_array, axis=1)
-
-                                            audio_array = audio_array / 32768.0
-                                            wave_text = render_waveform(audio_array)
-                                            audio_error_count = 0  # Reset error count on success
-                                        else:
-                                            # No data available - skip this frame
-                                            wave_text = Text("Waiting for audio...", style="dim")
-                                    else:
-                                        # No data available yet - skip this frame
-                                        wave_text = Text("Waiting for audio...", style="dim")
-                                except (OSError, IOError, ValueError, AttributeError) as e:
-                                    # Stream read error - increment counter
-                                    # AttributeError can occur if get_read_available() doesn't exist
-                                    audio_error_count += 1
-                                    if audio_error_count >= max_audio_errors:
-                                        raise
-                                    wave_text = Text(f"Audio error ({audio_error_count}/{max_audio_errors})", style="dim yellow")
+                            if capture_thread is None:
+                                # Capture runs on its own thread; this loop only
+                                # copies out the newest chunk
+                                channels = max(device_ref.get("maxInputChannels", 1), 1) if device_ref else 1
+                                audio_ring = AudioRing(CHUNK * channels * RING_CHUNKS)
+                                capture_stop = threading.Event()
+                                capture_thread = threading.Thread(
+                                    target=capture_audio,
+                                    args=(stream_ref, audio_ring, capture_stop, max_audio_errors),
+                                    daemon=True,
+                                )
+                                capture_thread.start()
+
+                            if not capture_thread.is_alive():
+                                # Capture gave up after repeated read errors
+                                raise audio_ring.error or OSError("audio capture stopped")
+
+                            if audio_ring.written == 0:
+                                # Nothing captured yet
+                                wave_text = _WAITING_TEXT
+                            elif audio_ring.written != rendered_written:
+                                # New audio since the last frame: redraw the waveform
+                                audio_array, rendered_written = audio_ring.latest(CHUNK * channels)
+                                audio_wave_text = render_waveform(audio_array, channels=channels)
+                                wave_text = audio_wave_text
+                                audio_error_count = 0  # Reset error count on success
                             else:
-                                # Stream not active
-                                wave_text = Text("Audio inactive", style="dim")
-                                audio_error_count += 1
+                                # No new chunk yet (capture ~21 Hz, display 30 FPS)
+                                wave_text = audio_wave_text
                     except (OSError, IOError, ValueError) as e:
                         # Audio read error - increment counter
                         audio_error_count += 1
                         if audio_error_count >= max_audio_errors:
-                            wave_text = Text("Audio disabled (errors)", style="dim red")
+                            wave_text = _AUDIO_DISABLED_TEXT
                             # Disable audio stream
+                            stop_capture(capture_thread, capture_stop)
                             with audio_lock:
                                 if audio_stream:
                                     try:
@@ -617,8 +899,9 @@ def run_blitz_mode(project_id=None, scope=None):
                     except Exception as e:
                         # Unexpected error - disable audio
                         audio_error_count = max_audio_errors
-                        wave_text = Text("Audio error", style="dim red")
+                        wave_text = _AUDIO_ERROR_TEXT
                         # Try to clean up stream
+                        stop_capture(capture_thread, capture_stop)
                         with audio_lock:
                             if audio_stream:
                                 try:
@@ -629,26 +912,40 @@ def run_blitz_mode(project_id=None, scope=None):
                                     pass
                                 audio_stream = None
                 elif not audio_ready:
-                    wave_text = Text("Connecting to audio...", style="dim yellow")
+                    wave_text = _CONNECTING_TEXT
                 else:
-                    wave_text = Text("No audio device", style="dim")
+                    wave_text = _NO_DEVICE_TEXT
 
-                # Update display
-                live.update(create_blitz_layout(current_task, tasks, task_index, progress_text, completed_ids, wave_text))
+                # Update display (task panels only after a key; the wave every frame)
+                if ui_dirty:
+                    changed = update_blitz_layout(
+                        layout, current_task, tasks, task_index, progress_text, completed_ids, wave_text
+                    )
+                    ui_dirty = False
+                else:
+                    changed = update_wave_panel(layout, wave_text)
+                if changed:
+                    live.refresh()
 
                 # Check for keypress
-                key = check_keypress()
+                try:
+                    key = key_queue.get_nowait()
+                except queue.Empty:
+                    key = None
+                if key is not None:
+                    ui_dirty = True  # Any key may change the task or list
 
                 if key == 'd':
-                    # Mark done
-                    service.complete_task(current_task.id)
+                    # Mark done (written in the background; the list updates now)
+                    write_queue.put((service.complete_task, (current_task.id,)))
                     completed_count += 1
                     completed_ids.add(current_task.id)  # Track completion
 
                     # Show completion state momentarily
-                    live.update(create_blitz_layout(
-                        current_task, tasks, task_index, progress_text, completed_ids, wave_text, show_completion=True
-                    ))
+                    update_blitz_layout(
+                        layout, current_task, tasks, task_index, progress_text, completed_ids, wave_text, show_completion=True
+                    )
+                    live.refresh()
                     time.sleep(0.4)
 
                     # Move to next task (if available)
@@ -659,7 +956,8 @@ def run_blitz_mode(project_id=None, scope=None):
                     # Un-complete task
                     if current_task.id in completed_ids or current_task.status == "done":
                         uncompleted_task_id = current_task.id
-                        service.uncomplete_task(uncompleted_task_id)
+                        write_queue.put((service.uncomplete_task, (uncompleted_task_id,)))
+                        write_queue.join()  # The refresh below must see every write
                         completed_count -= 1
                         completed_ids.discard(uncompleted_task_id)  # Remove from completed set
                         # Refresh task list to get updated status
@@ -700,6 +998,7 @@ def run_blitz_mode(project_id=None, scope=None):
 
                 elif key == '?':
                     # Show full details using view command for consistency
+                    write_queue.join()  # Details should reflect pending completions
                     live.stop()
                     console.print()  # Add spacing
                     # Import here to avoid circular import with main.py
@@ -713,14 +1012,22 @@ def run_blitz_mode(project_id=None, scope=None):
                     )
                     handle_show_command(parse_result)
                     console.print("\n[dim]Press any key to continue...[/dim]")
-                    msvcrt.getch()
-                    live.start()
+                    key_queue.get()
+                    live.start(refresh=True)
 
                 elif key == 'q':
                     # Quit blitz mode
                     break
 
-                time.sleep(1.0 / UPDATE_FPS)
+                # Sleep to the next tick, not a fixed interval, so frame work
+                # doesn't stretch the frame; after an overrun (completion
+                # flash, details view) start counting from now again
+                next_frame += frame_time
+                remaining = next_frame - time.monotonic()
+                if remaining > 0:
+                    time.sleep(remaining)
+                else:
+                    next_frame = time.monotonic()
 
         # Summary
         console.print(f"\n[bold green]Blitz Mode Complete![/bold green]")
@@ -736,7 +1043,18 @@ def run_blitz_mode(project_id=None, scope=None):
         import traceback
         console.print("[dim]" + traceback.format_exc() + "[/dim]")
     finally:
+        # Let queued completions land before returning to the REPL
+        write_queue.put(None)
+        write_thread.join()
+        for error in write_errors:
+            console.print(f"[red]Error: {error}[/red]")
+
+        # Stop the key reader before handing the keyboard back to the REPL
+        key_stop.set()
+        key_thread.join(timeout=1.0)
+
         # Cleanup audio resources (with protection)
+        stop_capture(capture_thread, capture_stop)
         with audio_lock:
             if audio_stream:
                 try:
@@ -10,6 +10,7 @@ from ..parser import ParseResult
 from .. import blitz
 from .. import undo
 from ...core import service
+from ...core.constants import VALID_SCOPE_SET, VALID_SCOPES_TEXT
 
 def handle_scope_command(result: ParseResult) -> None:
     """
@@ -43,10 +44,9 @@ def handle_scope_command(result: ParseResult) -> None:
         return
 
     # Validate scope
-    valid_scopes = ("today", "week", "backlog", "archived")
-    if scope_name not in valid_scopes:
+    if scope_name not in VALID_SCOPE_SET:
         console.print(f"[red]Error:[/red] Invalid scope '{scope_name}'")
-        console.print(f"[dim]Valid scopes: {', '.join(valid_scopes)}, all[/dim]")
+        console.print(f"[dim]Valid scopes: {VALID_SCOPES_TEXT}, all[/dim]")
         return
 
     repl_context.current_scope = scope_name
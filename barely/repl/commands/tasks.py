@@ -12,6 +12,7 @@ from typing import Optional, List
 from ..main import console, repl_context
 from ..parser import ParseResult
 from ...core import service, repository
+from ...core.constants import SCOPE_ARCHIVED
 from ...core.exceptions import (
     BarelyError,
     TaskNotFoundError,
@@ -166,80 +167,64 @@ def handle_done_command(result: ParseResult) -> None:
             return  # User cancelled
 
         # Process tasks from picker (supports bulk selection)
-        completed_count = 0
-        for task_id in task_ids:
-            try:
-                # Get original task data before completion
-                original_task = repository.get_task(task_id)
-                if original_task:
-                    original_scope = original_task.scope
-                    original_completed_at = original_task.completed_at
-                    original_column_id = original_task.column_id
-                else:
-                    original_scope = "backlog"
-                    original_completed_at = None
-                    original_column_id = 1
-                
-                task = service.complete_task(task_id)
-                
-                # Record for undo (only track last operation)
-                record_complete(task_id, original_scope, original_completed_at, original_column_id)
-                
-                celebrate_done()
-                display_task(task, "✓ Completed:", console)
-                completed_count += 1
-            except TaskNotFoundError as e:
-                console.print(f"[red]Error:[/red] {e}")
-            except BarelyError as e:
-                console.print(f"[red]Error:[/red] {e}")
-
-        if completed_count > 1:
-            bulk_msg = celebrate_bulk(completed_count, "completed")
-            console.print(f"[green]{bulk_msg}[/green]")
+        _complete_task_ids(task_ids)
         return
 
     try:
         # Parse comma-separated IDs
         ids = [id.strip() for id in result.args[0].split(",")]
-        completed_count = 0
+        task_ids = []
 
         for id_str in ids:
             try:
-                task_id = int(id_str)
-                
-                # Get original task data before completion
-                original_task = repository.get_task(task_id)
-                if original_task:
-                    original_scope = original_task.scope
-                    original_completed_at = original_task.completed_at
-                    original_column_id = original_task.column_id
-                else:
-                    original_scope = "backlog"
-                    original_completed_at = None
-                    original_column_id = 1
-                
-                task = service.complete_task(task_id)
-                
-                # Record for undo (only track last operation)
-                record_complete(task_id, original_scope, original_completed_at, original_column_id)
-                
-                celebrate_done()
-                display_task(task, "✓ Completed:", console)
-                completed_count += 1
+                task_ids.append(int(id_str))
             except ValueError:
                 console.print(f"[red]Error:[/red] Invalid task ID: {id_str}")
-            except TaskNotFoundError as e:
-                console.print(f"[red]Error:[/red] {e}")
-            except BarelyError as e:
-                console.print(f"[red]Error:[/red] {e}")
 
-        if completed_count > 1:
-            bulk_msg = celebrate_bulk(completed_count, "completed")
-            console.print(f"[green]{bulk_msg}[/green]")
+        if task_ids:
+            _complete_task_ids(task_ids)
     except Exception as e:
         console.print(f"[red]Unexpected error:[/red] {e}")
 
 
+def _complete_task_ids(task_ids: List[int]) -> None:
+    """
+    Complete tasks in one batched transaction and report each one.
+
+    Missing IDs are reported as errors; the rest are still completed.
+    """
+    # Get original task data before completion (for undo)
+    original_tasks = {task_id: repository.get_task(task_id) for task_id in task_ids}
+
+    try:
+        completed_tasks = service.complete_tasks(task_ids, skip_missing=True)
+    except BarelyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    completed_by_id = {task.id: task for task in completed_tasks}
+    completed_count = 0
+
+    for task_id, original_task in original_tasks.items():
+        task = completed_by_id.get(task_id)
+        if task is None:
+            console.print(f"[red]Error:[/red] {TaskNotFoundError(task_id)}")
+            continue
+
+        # Record for undo (only track last operation)
+        record_complete(
+            task_id, original_task.scope, original_task.completed_at, original_task.column_id
+        )
+
+        celebrate_done()
+        display_task(task, "✓ Completed:", console)
+        completed_count += 1
+
+    if completed_count > 1:
+        bulk_msg = celebrate_bulk(completed_count, "completed")
+        console.print(f"[green]{bulk_msg}[/green]")
+
+
 # Helper function
 def ask_confirmation(message: str) -> bool:
     """
@@ -331,9 +316,8 @@ def handle_rm_command(result: ParseResult) -> None:
 
         # Handle wildcard: delete all tasks in current context
         if arg == "*":
-            all_tasks = service.list_tasks()
-            # Filter by current context (project/scope)
-            tasks_to_delete = repl_context.filter_tasks(all_tasks)
+            # Tasks in current context (project/scope filtered in SQL)
+            tasks_to_delete = repl_context.list_context_tasks()
 
             if not tasks_to_delete:
                 console.print("[yellow]No tasks to delete in current context[/yellow]")
@@ -374,8 +358,7 @@ def handle_rm_command(result: ParseResult) -> None:
         ids = [id.strip() for id in arg.split(",")]
 
         # Collect valid task IDs (respect context)
-        all_tasks = service.list_tasks()
-        context_tasks = {t.id: t for t in repl_context.filter_tasks(all_tasks)}
+        context_tasks = {t.id: t for t in repl_context.list_context_tasks()}
 
         tasks_to_delete = []
         invalid_ids = []
@@ -386,9 +369,10 @@ def handle_rm_command(result: ParseResult) -> None:
 
                 # Check if task exists in current context
                 if task_id not in context_tasks:
-                    # Task doesn't exist or not in current context
-                    all_tasks_dict = {t.id: t for t in all_tasks}
-                    if task_id not in all_tasks_dict:
+                    # Task doesn't exist (archived counts as gone here)
+                    # or not in current context
+                    existing = repository.get_task(task_id)
+                    if existing is None or existing.scope == SCOPE_ARCHIVED:
                         invalid_ids.append((id_str, "not found"))
                     else:
                         invalid_ids.append((id_str, "not in current context"))
@@ -6,10 +6,10 @@ PURPOSE: Workflow command handlers for REPL
 from ..main import console, repl_context
 from ..parser import ParseResult
 from ...core import service, repository
+from ...core.constants import DEFAULT_SCOPE, VALID_SCOPE_SET, VALID_SCOPES_TEXT
 from ...core.exceptions import (
     BarelyError,
     TaskNotFoundError,
-    InvalidInputError,
 )
 from ..style import celebrate_pull, celebrate_bulk
 from ..undo import record_pull
@@ -33,11 +33,9 @@ def handle_today_command(result: ParseResult) -> None:
         today
     """
     try:
-        tasks = service.list_today()
-
-        # Filter by context project if set
-        if repl_context.current_project:
-            tasks = [t for t in tasks if t.project_id == repl_context.current_project.id]
+        # Filter by context project if set (applied in SQL)
+        project = repl_context.current_project
+        tasks = service.list_today(project.id if project else None)
 
         if not tasks:
             console.print("[dim]No tasks for today[/dim]")
@@ -61,11 +59,9 @@ def handle_week_command(result: ParseResult) -> None:
         week
     """
     try:
-        tasks = service.list_week()
-
-        # Filter by context project if set
-        if repl_context.current_project:
-            tasks = [t for t in tasks if t.project_id == repl_context.current_project.id]
+        # Filter by context project if set (applied in SQL)
+        project = repl_context.current_project
+        tasks = service.list_week(project.id if project else None)
 
         if not tasks:
             console.print("[dim]No tasks for this week[/dim]")
@@ -89,11 +85,9 @@ def handle_backlog_command(result: ParseResult) -> None:
         backlog
     """
     try:
-        tasks = service.list_backlog()
-
-        # Filter by context project if set
-        if repl_context.current_project:
-            tasks = [t for t in tasks if t.project_id == repl_context.current_project.id]
+        # Filter by context project if set (applied in SQL)
+        project = repl_context.current_project
+        tasks = service.list_backlog(project.id if project else None)
 
         if not tasks:
             console.print("[dim]Backlog is empty[/dim]")
@@ -116,11 +110,9 @@ def handle_archive_command(result: ParseResult) -> None:
         archive
     """
     try:
-        tasks = service.list_completed()
-
-        # Filter by context project if set
-        if repl_context.current_project:
-            tasks = [t for t in tasks if t.project_id == repl_context.current_project.id]
+        # Context project is filtered in SQL
+        project = repl_context.current_project
+        tasks = service.list_completed(project_id=project.id if project else None)
 
         if not tasks:
             console.print("[dim]No archived tasks[/dim]")
@@ -148,7 +140,6 @@ def handle_pull_command(result: ParseResult) -> None:
         pull *             (pull all tasks in current context to today)
         pull * week        (pull all tasks in current context to week)
     """
-    valid_scopes = ("backlog", "week", "today", "archived")
 
     # No args: show picker, default to today
     if not result.args:
@@ -165,8 +156,7 @@ def handle_pull_command(result: ParseResult) -> None:
         if arg == "*":
             # Pull all tasks in current context to today
             scope = "today"
-            all_tasks = service.list_tasks()
-            tasks_to_pull = repl_context.filter_tasks(all_tasks)
+            tasks_to_pull = repl_context.list_context_tasks()
 
             # Exclude tasks already in the target scope
             tasks_to_pull = [t for t in tasks_to_pull if t.scope != scope and t.status == "todo"]
@@ -195,7 +185,7 @@ def handle_pull_command(result: ParseResult) -> None:
             task_ids = [t.id for t in tasks_to_pull]
 
         # Check if it's a valid scope
-        elif arg.lower() in valid_scopes:
+        elif arg.lower() in VALID_SCOPE_SET:
             # It's a scope - show picker
             scope = arg.lower()
             task_ids = pick_task(title=f"Pull task(s) into '{scope}'")
@@ -211,7 +201,7 @@ def handle_pull_command(result: ParseResult) -> None:
             except ValueError:
                 console.print(f"[red]Error:[/red] Invalid task ID(s) or scope: '{arg}'")
                 console.print("[dim]Usage: pull <task_id>[,<task_id>...] [scope][/dim]")
-                console.print(f"[dim]Valid scopes: {', '.join(valid_scopes)} (defaults to 'today')[/dim]")
+                console.print(f"[dim]Valid scopes: {VALID_SCOPES_TEXT} (defaults to 'today')[/dim]")
                 return
 
     # Two args: pull <ids|*> <scope>
@@ -222,16 +212,15 @@ def handle_pull_command(result: ParseResult) -> None:
         scope = result.args[1].lower()
 
         # Validate scope
-        if scope not in valid_scopes:
+        if scope not in VALID_SCOPE_SET:
             console.print(f"[red]Error:[/red] Invalid scope '{scope}'")
-            console.print(f"[dim]Valid scopes: {', '.join(valid_scopes)}[/dim]")
+            console.print(f"[dim]Valid scopes: {VALID_SCOPES_TEXT}[/dim]")
             return
 
         # Check for wildcard
         if arg == "*":
             # Pull all tasks in current context to specified scope
-            all_tasks = service.list_tasks()
-            tasks_to_pull = repl_context.filter_tasks(all_tasks)
+            tasks_to_pull = repl_context.list_context_tasks()
 
             # Exclude tasks already in the target scope
             tasks_to_pull = [t for t in tasks_to_pull if t.scope != scope and t.status == "todo"]
@@ -271,29 +260,36 @@ def handle_pull_command(result: ParseResult) -> None:
     pulled_count = 0
     scope_emoji = {"backlog": "📋", "week": "📅", "today": "⭐", "archived": "✓"}
 
-    for task_id in task_ids:
-        try:
-            # Get original scope before pull (for undo)
-            original_task = repository.get_task(task_id)
-            original_scope = original_task.scope if original_task else "backlog"
-            
-            task = service.pull_task(task_id, scope)
-            
-            # Record for undo (only track last operation)
-            record_pull(task_id, original_scope, scope)
-            
-            celebrate_pull()
-            console.print(
-                f"[blue]{scope_emoji.get(scope, '→')}[/blue] "
-                f"Pulled task {task.id} into [cyan]{scope}[/cyan]: {task.title}"
-            )
-            pulled_count += 1
-        except TaskNotFoundError as e:
-            console.print(f"[red]Error:[/red] {e}")
-        except InvalidInputError as e:
-            console.print(f"[red]Error:[/red] {e}")
-        except BarelyError as e:
-            console.print(f"[red]Error:[/red] {e}")
+    # Get original scopes before pull (for undo)
+    original_scopes = {}
+    for task_id in dict.fromkeys(task_ids):
+        original_task = repository.get_task(task_id)
+        original_scopes[task_id] = original_task.scope if original_task else DEFAULT_SCOPE
+
+    try:
+        # One batched transaction; missing IDs are skipped and reported below
+        pulled_tasks = service.pull_tasks(task_ids, scope, skip_missing=True)
+    except BarelyError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        return
+
+    pulled_by_id = {task.id: task for task in pulled_tasks}
+
+    for task_id in original_scopes:
+        task = pulled_by_id.get(task_id)
+        if task is None:
+            console.print(f"[red]Error:[/red] {TaskNotFoundError(task_id)}")
+            continue
+
+        # Record for undo (only track last operation)
+        record_pull(task_id, original_scopes[task_id], scope)
+
+        celebrate_pull()
+        console.print(
+            f"[blue]{scope_emoji.get(scope, '→')}[/blue] "
+            f"Pulled task {task.id} into [cyan]{scope}[/cyan]: {task.title}"
+        )
+        pulled_count += 1
 
     if pulled_count > 1:
         bulk_msg = celebrate_bulk(pulled_count, f"pulled into {scope}")
@@ -8,6 +8,7 @@ DEPENDENCIES:
   - prompt_toolkit.completion (Completer, Completion)
   - typing (type hints)
   - barely.core.service (for dynamic project name completion)
+  - barely.core.constants (scope values)
 NOTES:
   - Suggests command names when at start of line
   - Suggests project subcommands after "project" command
@@ -25,6 +26,8 @@ from typing import Iterable
 from prompt_toolkit.completion import Completer, Completion
 from prompt_toolkit.document import Document
 
+from ..core.constants import VALID_SCOPES
+
 
 class BarelyCompleter(Completer):
     """
@@ -47,7 +50,7 @@ class BarelyCompleter(Completer):
     PROJECT_SUBCOMMANDS = ["add", "ls", "rm"]
 
     # Pull scopes (includes archived for reactivating tasks)
-    PULL_SCOPES = ["backlog", "week", "today", "archived"]
+    PULL_SCOPES = VALID_SCOPES
 
     # Common flags for all commands (none in REPL - it's interactive, not for scripting)
     COMMON_FLAGS = []
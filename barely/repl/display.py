@@ -8,6 +8,7 @@ DEPENDENCIES:
   - rich (formatted output)
   - barely.core.service (business logic)
   - barely.core.models (Task model)
+  - barely.formatting (SCOPE_CELLS, NO_PROJECT_CELL)
 NOTES:
   - Avoids circular imports by accepting console and repl_context as parameters
   - Or importing them lazily after module initialization
@@ -16,6 +17,7 @@ NOTES:
 from rich.console import Console
 from rich.table import Table
 from ..core.models import Task
+from ..formatting import SCOPE_CELLS, NO_PROJECT_CELL
 
 # Create console instance here to avoid circular import
 console = Console()
@@ -81,14 +83,15 @@ def display_tasks_table(tasks: list[Task], repl_context=None, console_instance:
     if in_project_context and project_header_name:
         console_instance.print(f"[bold cyan]Project:[/bold cyan] [cyan]{project_header_name}[/cyan]\n")
 
-    # Build project name cache for efficient lookups (only if showing Project column)
-    project_cache = {}
+    # Build project cells once per project with one batched lookup (only if
+    # showing Project column); tasks without a project fall through to
+    # NO_PROJECT_CELL
+    project_cells = {}
     if not in_project_context:
         project_ids = {task.project_id for task in tasks if task.project_id}
-        for proj_id in project_ids:
-            project = service.get_project(proj_id)
-            if project:
-                project_cache[proj_id] = project.name
+        if project_ids:
+            names = {p.id: p.name for p in service.get_projects_by_ids(list(project_ids))}
+            project_cells = {pid: names.get(pid, f"[dim]ID:{pid}[/dim]") for pid in project_ids}
 
     # Create table with columns
     table = Table(show_header=True, header_style="bold cyan")
@@ -102,29 +105,16 @@ def display_tasks_table(tasks: list[Task], repl_context=None, console_instance:
 
     # Add rows for each task
     for task in tasks:
-        # Resolve project name from cache (only if showing Project column)
-        if not in_project_context:
-            if task.project_id:
-                project_name = project_cache.get(task.project_id, f"[dim]ID:{task.project_id}[/dim]")
-            else:
-                project_name = "-"
-
-        # Color code scope: backlog=dim, week=blue, today=bright_magenta
-        scope_style_map = {
-            "backlog": "dim",
-            "week": "blue",
-            "today": "bright_magenta",
-        }
-        scope_style = scope_style_map.get(task.scope, "white")
+        scope_cell = SCOPE_CELLS.get(task.scope) or f"[white]{task.scope}[/white]"
 
         # Build row - conditionally include project column
         row_data = [
             str(task.id),
             task.title,
-            f"[{scope_style}]{task.scope}[/{scope_style}]",
+            scope_cell,
         ]
         if not in_project_context:
-            row_data.append(project_name)
+            row_data.append(project_cells.get(task.project_id, NO_PROJECT_CELL))
         
         table.add_row(*row_data)
 
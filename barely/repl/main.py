@@ -58,6 +58,7 @@ from ..core.exceptions import (
     InvalidInputError,
 )
 from ..core.models import Task, Project
+from ..core.constants import SCOPE_ARCHIVED
 from ..utils import improve_title_with_ai
 from .parser import parse_command, ParseResult
 from .completer import create_completer
@@ -119,17 +120,36 @@ class REPLContext:
         Returns:
             Filtered task list based on current project and scope
         """
-        filtered = tasks
+        project_id = self.current_project.id if self.current_project else None
+        scope = self.current_scope
 
-        # Filter by project if set
-        if self.current_project:
-            filtered = [t for t in filtered if t.project_id == self.current_project.id]
+        if project_id is None and not scope:
+            return tasks
 
-        # Filter by scope if set
-        if self.current_scope:
-            filtered = [t for t in filtered if t.scope == self.current_scope]
+        # One pass with the combined predicate (no intermediate lists)
+        return [
+            t for t in tasks
+            if (project_id is None or t.project_id == project_id)
+            and (not scope or t.scope == scope)
+        ]
+
+    def list_context_tasks(self) -> List[Task]:
+        """
+        List active (non-archived) tasks in the current context.
+
+        Returns:
+            Same tasks as filter_tasks(service.list_tasks()), but the
+            project and scope filters run in SQL instead of over every task
+        """
+        project_id = self.current_project.id if self.current_project else None
+        scope = self.current_scope
 
-        return filtered
+        if not scope:
+            return service.list_tasks(project_id=project_id)
+        if scope == SCOPE_ARCHIVED:
+            # list_tasks() never includes archived tasks
+            return []
+        return service.list_view(scope, project_id)
 
 
 # Global REPL context (persists during session, resets on restart)
@@ -215,17 +235,14 @@ def get_right_prompt() -> HTML:
         HTML formatted right prompt with filtered task count
     """
     try:
-        # Get all tasks and filter by context
-        tasks = service.list_tasks()
-        filtered = repl_context.filter_tasks(tasks)
+        # Context filters run in SQL
+        count = len(repl_context.list_context_tasks())
 
         if repl_context.current_project or repl_context.current_scope:
-            count = len(filtered)
             return HTML(f"<style fg='#888888'>[{count} in view]</style>")
         else:
             # If no filter, show total
-            total = len(tasks)
-            return HTML(f"<style fg='#888888'>[{total} total]</style>")
+            return HTML(f"<style fg='#888888'>[{count} total]</style>")
     except Exception:
         return HTML("")
 
@@ -331,7 +348,10 @@ def execute_command(result: ParseResult) -> bool:
 
     handler = handlers.get(command)
     if handler:
-        handler(result)
+        # One operation per command: cached task/project lookups check for
+        # other connections' commits once, not on every get_task()
+        with repository.operation():
+            handler(result)
         # Add whitespace after command output for readability
         console.print()
     else:
@@ -93,18 +93,15 @@ def pick_task(title: str = "Select a task", filter_scope: Optional[str] = None)
     from .main import repl_context, console
     
     try:
-        # Get all tasks
-        tasks = service.list_tasks()
+        # Project filter runs in SQL; list_tasks() already excludes archived
+        # tasks, which the picker never offers (they're completed)
+        project = repl_context.current_project
+        tasks = service.list_tasks(project_id=project.id if project else None)
 
-        # Apply context filtering
-        if repl_context.current_project:
-            tasks = [t for t in tasks if t.project_id == repl_context.current_project.id]
+        # Apply scope context in the same list
         if repl_context.current_scope:
             tasks = [t for t in tasks if t.scope == repl_context.current_scope]
 
-        # Exclude archived tasks by default for picker (they're completed)
-        tasks = [t for t in tasks if t.scope != "archived"]
-
         if not tasks:
             console.print("[yellow]No tasks available in current context[/yellow]")
             console.print("[dim]Tip: Use 'use' or 'scope' to change context, or specify task ID directly[/dim]")
@@ -216,15 +216,12 @@ def undo_last_operation() -> tuple[bool, Optional[str]]:
                 return True, f"Undid: Deleted task (restored as task {task.id})"
         
         elif op.operation == "complete":
-            # Undo complete = restore original scope using pull_task
+            # Undo complete = restore original scope and completed_at
             if op.task_id:
                 original_scope = op.original_data.get("scope", "backlog")
                 original_completed_at = op.original_data.get("completed_at")
-                # Use pull_task to restore scope (more elegant than manual update)
-                task = service.pull_task(op.task_id, original_scope)
-                # Clear completed_at timestamp
-                task.completed_at = original_completed_at
-                repository.update_task(task)
+                # One UPDATE for both (scope came from the task, so it's valid)
+                repository.reopen_task(op.task_id, original_scope, original_completed_at)
                 undo_history.clear()
                 return True, f"Undid: Completed task {op.task_id} (restored to '{original_scope}')"
         
@@ -0,0 +1,9 @@
+-- Migration: Index archived tasks by display time
+-- The archive view filters (--since) and sorts on
+-- COALESCE(completed_at, updated_at, ''), so tasks archived without a
+-- completed_at still show up. This expression index serves both as one
+-- ordered range read instead of reading every archived task and sorting.
+-- Also applied automatically by repository.init_database() (INDEX_MIGRATIONS).
+
+CREATE INDEX IF NOT EXISTS idx_tasks_scope_display
+    ON tasks(scope, COALESCE(completed_at, updated_at, '') DESC, created_at DESC);
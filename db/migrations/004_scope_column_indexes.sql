@@ -0,0 +1,14 @@
+-- Migration: Composite indexes for the task and project list views
+-- Turns "WHERE scope = ? ORDER BY created_at DESC, id DESC" (and the
+-- column_id / project_id equivalents, and the unfiltered project list) into
+-- a single ordered index range read instead of a scan plus sort. id breaks
+-- ties between rows created in the same batch. ANALYZE refreshes planner
+-- statistics so they get used.
+-- Also applied automatically by repository.init_database() (INDEX_MIGRATIONS).
+
+CREATE INDEX IF NOT EXISTS idx_tasks_scope_created_id ON tasks(scope, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_column_created_id ON tasks(column_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_created_id ON tasks(project_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_created_id ON projects(created_at DESC, id DESC);
+
+ANALYZE;
@@ -36,6 +36,12 @@ CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_column ON tasks(column_id);
 CREATE INDEX IF NOT EXISTS idx_tasks_scope ON tasks(scope);
 CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_scope_display ON tasks(scope, COALESCE(completed_at, updated_at, '') DESC, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_scope_created_id ON tasks(scope, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_column_created_id ON tasks(column_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_created_id ON tasks(project_id, created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_created_id ON projects(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_projects_name_nocase ON projects(name COLLATE NOCASE);
 
 -- Default columns for initial setup
 -- Only insert if columns table is empty (first run)
@@ -0,0 +1,61 @@
+"""
+Test suite for the async repository facade.
+
+Checks that async calls reach the same database as the sync repository
+and that concurrent reads/writes don't step on each other.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+# Path setup handled by conftest.py for pytest runs
+# For direct execution, add project root to path
+if __name__ == "__main__":
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from barely.core import async_repository, repository, exceptions
+
+
+@pytest.fixture(autouse=True)
+def temp_db(monkeypatch, tmp_path):
+    """Use temporary database for all tests."""
+    db_path = tmp_path / "test_barely.db"
+    monkeypatch.setattr(repository, "DB_PATH", db_path)
+    monkeypatch.setattr(repository, "DB_DIR", tmp_path)
+    yield db_path
+
+
+def test_async_create_and_read():
+    """Test async writes are visible to async and sync reads."""
+    async def scenario():
+        task = await async_repository.create_task("Async task", 1, scope="week")
+        fetched = await async_repository.get_task(task.id)
+        week = await async_repository.list_tasks_by_scope("week")
+        return task, fetched, week
+
+    task, fetched, week = asyncio.run(scenario())
+
+    assert fetched == task
+    assert [t.id for t in week] == [task.id]
+    assert repository.get_task(task.id).title == "Async task"
+
+
+def test_async_concurrent_reads_and_writes():
+    """Test gathered reads and writes all complete."""
+    async def scenario():
+        await asyncio.gather(
+            *(async_repository.create_task(f"Task {i}", 1) for i in range(10)),
+            *(async_repository.list_tasks() for _ in range(10)),
+        )
+        return await async_repository.list_tasks()
+
+    assert len(asyncio.run(scenario())) == 10
+
+
+def test_async_errors_propagate():
+    """Test repository exceptions surface from awaited calls."""
+    with pytest.raises(exceptions.TaskNotFoundError):
+        asyncio.run(async_repository.delete_task(99999))
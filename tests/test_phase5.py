@@ -81,6 +81,35 @@ def test_get_project_nonexistent():
     assert result is None
 
 
+def test_get_projects_by_ids():
+    """Test batched project lookup keeps input order and skips missing IDs."""
+    work = repository.create_project("Work")
+    home = repository.create_project("Home")
+
+    projects = repository.get_projects_by_ids([home.id, 999, work.id, home.id])
+
+    assert [p.name for p in projects] == ["Home", "Work"]
+
+
+def test_find_project_by_name_ignores_case():
+    """Test project name lookup is case-insensitive, including non-ASCII names."""
+    work = repository.create_project("Work")
+    cafe = repository.create_project("Éclair")
+
+    assert service.find_project_by_name("WORK").id == work.id
+    assert service.find_project_by_name("éclair").id == cafe.id
+    assert service.find_project_by_name("Missing") is None
+
+
+def test_find_project_by_name_prefers_newest_case_variant():
+    """Test names differing only by case resolve to the newest project."""
+    repository.create_project("work")
+    newer = repository.create_project("Work")
+
+    assert repository.get_project_by_name("WORK").id == newer.id
+    assert service.find_project_by_name("wOrK").id == newer.id
+
+
 def test_list_projects():
     """Test listing all projects."""
     repository.create_project("Work")
@@ -96,12 +125,35 @@ def test_list_projects():
     assert "Hobbies" in names
 
 
+def test_list_projects_cache_refreshes_after_writes():
+    """Test cached service.list_projects() follows creates and deletes."""
+    work = service.create_project("Work")
+    assert [p.name for p in service.list_projects()] == ["Work"]
+
+    service.create_project("Home")
+    assert len(service.list_projects()) == 2
+
+    service.delete_project(work.id)
+    assert [p.name for p in service.list_projects()] == ["Home"]
+
+
 def test_list_projects_empty():
     """Test listing projects when none exist."""
     projects = repository.list_projects()
     assert projects == []
 
 
+def test_list_projects_same_created_at_newest_id_first(temp_db):
+    """Test projects sharing a created_at list newest id first."""
+    ids = [repository.create_project(name).id for name in ("Work", "Home", "Hobbies")]
+    other = sqlite3.connect(temp_db)
+    other.execute("UPDATE projects SET created_at = '2024-01-01T09:00:00.000'")
+    other.commit()
+    other.close()
+
+    assert [p.id for p in repository.list_projects()] == ids[::-1]
+
+
 def test_delete_project():
     """Test deleting a project."""
     project = repository.create_project("ToDelete")
@@ -119,6 +171,24 @@ def test_delete_project_nonexistent():
         repository.delete_project(999)
 
 
+def test_assign_task_to_project_errors():
+    """Test assigning reports a missing project before a missing task."""
+    project = repository.create_project("Work")
+    task = repository.create_task("Task", column_id=1)
+
+    assert service.assign_task_to_project(task.id, project.id).project_id == project.id
+
+    with pytest.raises(exceptions.ProjectNotFoundError):
+        service.assign_task_to_project(task.id, 999)
+    with pytest.raises(exceptions.ProjectNotFoundError):
+        service.assign_task_to_project(998, 999)
+    with pytest.raises(exceptions.TaskNotFoundError):
+        service.assign_task_to_project(998, project.id)
+
+    # A failed assignment leaves the task as it was
+    assert repository.get_task(task.id).project_id == project.id
+
+
 def test_delete_project_sets_tasks_to_null():
     """Test that deleting a project sets task project_ids to NULL."""
     project = repository.create_project("Work")
@@ -342,6 +412,18 @@ def test_list_tasks_by_column():
         assert task.column_id == 1
 
 
+def test_list_tasks_combined_filters():
+    """Test project and archived filters combine in one query."""
+    project = service.create_project("Filters")
+    active = service.create_task("Active", project_id=project.id)
+    done = service.create_task("Done", project_id=project.id)
+    service.complete_task(done.id)
+    service.create_task("Elsewhere")
+
+    assert [t.id for t in service.list_tasks(project_id=project.id)] == [active.id]
+    assert {t.id for t in service.list_tasks(project_id=project.id, include_archived=True)} == {active.id, done.id}
+
+
 def test_list_tasks_by_nonexistent_project():
     """Test filtering by nonexistent project returns empty list."""
     tasks = service.list_tasks_by_project(999)
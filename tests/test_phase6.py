@@ -110,6 +110,107 @@ def test_list_tasks_by_scope_empty():
     assert today_tasks == []
 
 
+def test_iter_tasks_by_scope_limit():
+    """Test streaming a scope with a SQL-side limit."""
+    for i in range(5):
+        repository.create_task(f"Week task {i}", column_id=1, scope="week")
+    repository.create_task("Backlog task", column_id=1, scope="backlog")
+
+    first_two = list(repository.iter_tasks_by_scope("week", limit=2))
+    everything = list(repository.iter_tasks_by_scope("week"))
+
+    assert len(first_two) == 2
+    assert len(everything) == 5
+    assert [t.id for t in first_two] == [t.id for t in everything[:2]]
+
+
+def test_iter_tasks_filters_lazily():
+    """Test iter_tasks streams the same rows list_tasks returns."""
+    project = repository.create_project("Streamed")
+    for i in range(3):
+        repository.create_task(f"Project task {i}", column_id=1, project_id=project.id)
+    repository.create_task("Loose task", column_id=1)
+
+    stream = repository.iter_tasks(project_id=project.id)
+
+    assert next(stream).project_id == project.id
+    stream.close()
+    assert [t.id for t in repository.iter_tasks(project_id=project.id)] == [
+        t.id for t in repository.list_tasks(project_id=project.id)
+    ]
+
+
+def test_move_tasks_bulk():
+    """Test moving many tasks in batches, and rollback on a missing ID."""
+    tasks = repository.create_tasks([(f"Task {i}", 1, None, "backlog") for i in range(1000)])
+    ids = [t.id for t in tasks]
+
+    moved = repository.move_tasks(ids, 2)
+
+    assert [t.id for t in moved] == ids
+    assert all(t.column_id == 2 for t in moved)
+
+    with pytest.raises(exceptions.TaskNotFoundError):
+        repository.move_tasks([ids[0], 99999], 3)
+    assert repository.get_task(ids[0]).column_id == 2
+
+    with pytest.raises(exceptions.ColumnNotFoundError):
+        repository.move_tasks(ids[:1], 999)
+
+
+def test_list_tasks_full_resolves_names():
+    """Test JOINed listing returns column and project names."""
+    project = repository.create_project("Website")
+    with_project = repository.create_task("Has project", column_id=2, project_id=project.id, scope="week")
+    repository.create_task("No project", column_id=1, scope="backlog")
+
+    rows = repository.list_tasks_full("week")
+
+    assert rows == [(with_project, "In Progress", "Website")]
+    assert {(t.title, c, p) for t, c, p in repository.list_tasks_full()} == {
+        ("Has project", "In Progress", "Website"),
+        ("No project", "Todo", None),
+    }
+
+
+def test_list_tasks_same_created_at_newest_id_first(temp_db):
+    """Test tasks sharing a created_at list in a stable newest-id-first order."""
+    project = repository.create_project("Batch")
+    ids = [
+        repository.create_task(f"Task {i}", column_id=1, project_id=project.id, scope="week").id
+        for i in range(4)
+    ]
+    other = sqlite3.connect(temp_db)
+    other.execute("UPDATE tasks SET created_at = '2024-01-01T09:00:00.000'")
+    other.commit()
+    other.close()
+
+    expected = ids[::-1]
+    assert [t.id for t in repository.list_tasks()] == expected
+    assert [t.id for t in repository.list_tasks(project_id=project.id)] == expected
+    assert [t.id for t in repository.list_tasks(column_id=1)] == expected
+    assert [t.id for t in repository.list_tasks_by_scope("week")] == expected
+    assert [t.id for t in repository.list_tasks_by_scope("week", project.id)] == expected
+    assert [t.id for t, _, _ in repository.list_tasks_full("week")] == expected
+
+
+def test_create_tasks_bulk():
+    """Test bulk insert returns hydrated tasks in input order."""
+    repository.create_task("Existing", column_id=1)
+
+    tasks = repository.create_tasks([
+        ("Bulk 1", 1, None, "backlog"),
+        ("Bulk 2", 1, None, "week"),
+        ("Bulk 3", 1, None, "today"),
+    ])
+
+    assert [t.title for t in tasks] == ["Bulk 1", "Bulk 2", "Bulk 3"]
+    assert [t.scope for t in tasks] == ["backlog", "week", "today"]
+    assert all(t.status == "todo" for t in tasks)
+    assert repository.get_task(tasks[1].id).title == "Bulk 2"
+    assert repository.create_tasks([]) == []
+
+
 def test_update_task_scope():
     """Test updating a task's scope."""
     task = repository.create_task("Test task", column_id=1, scope="backlog")
@@ -194,6 +295,16 @@ def test_service_list_today():
         assert task.scope == "today"
 
 
+def test_service_list_week_by_project():
+    """Test scope views filter by project in the same query."""
+    project = service.create_project("Scoped")
+    mine = service.create_task("Mine", project_id=project.id, scope="week")
+    service.create_task("Other", scope="week")
+
+    assert [t.id for t in service.list_week(project.id)] == [mine.id]
+    assert len(service.list_week()) == 2
+
+
 def test_service_pull_task():
     """Test pulling a task from backlog to week."""
     task = service.create_task("Test task", scope="backlog")
@@ -263,6 +374,246 @@ def test_service_pull_tasks_multiple():
     assert len(week) == 3
 
 
+def test_service_pull_tasks_is_atomic():
+    """Test that a bulk pull with a missing ID moves nothing."""
+    task = service.create_task("Stays put")
+
+    with pytest.raises(exceptions.TaskNotFoundError):
+        service.pull_tasks([task.id, 99999], "today")
+
+    assert repository.get_task(task.id).scope == "backlog"
+
+
+def test_service_complete_tasks_shares_timestamp():
+    """Test bulk completion archives every task with one completed_at."""
+    first = service.create_task("First")
+    second = service.create_task("Second")
+
+    done = service.complete_tasks([first.id, second.id])
+
+    assert [t.id for t in done] == [first.id, second.id]
+    assert all(t.scope == "archived" for t in done)
+    assert done[0].completed_at == done[1].completed_at
+
+    with pytest.raises(exceptions.TaskNotFoundError):
+        service.complete_tasks([service.create_task("Open").id, 99999])
+
+
+def test_scope_views_refresh_after_writes(temp_db):
+    """Test cached scope views see in-process and external writes."""
+    task = service.create_task("Cached", scope="today")
+    assert [t.id for t in service.list_today()] == [task.id]
+
+    # Served from cache: same contents, but a list the caller owns
+    first, second = service.list_today(), service.list_today()
+    assert first == second and first is not second
+
+    service.pull_task(task.id, "week")
+    assert service.list_today() == []
+
+    # A commit from another connection (e.g. a CLI run) is seen too
+    other = sqlite3.connect(temp_db)
+    other.execute("UPDATE tasks SET scope = 'today' WHERE id = ?", (task.id,))
+    other.commit()
+    other.close()
+    assert [t.id for t in service.list_today()] == [task.id]
+
+
+def test_service_list_view_dispatch():
+    """Test list_view serves each named view and rejects unknown ones."""
+    project = service.create_project("Viewed")
+    week_task = service.create_task("Week", scope="week")
+    done_task = service.create_task("Done", project_id=project.id)
+    service.create_task("Done elsewhere")
+    service.complete_task(done_task.id)
+
+    assert [t.id for t in service.list_view("week")] == [week_task.id]
+    assert [t.id for t in service.list_view("completed", project_id=project.id)] == [done_task.id]
+    assert service.list_week() == service.list_view("week")
+
+    with pytest.raises(exceptions.InvalidInputError):
+        service.list_view("someday")
+    with pytest.raises(exceptions.InvalidInputError):
+        service.list_view("today", since="2024-01-01T00:00:00")
+
+
+def test_service_pull_tasks_skip_missing():
+    """Test skip_missing pulls the existing tasks and drops unknown IDs."""
+    first = service.create_task("First")
+    second = service.create_task("Second")
+
+    pulled = service.pull_tasks([first.id, 99999, second.id], "week", skip_missing=True)
+
+    assert [t.id for t in pulled] == [first.id, second.id]
+    assert repository.get_task(second.id).scope == "week"
+
+
+def test_service_uncomplete_task():
+    """Test uncomplete_task reopens into the target scope and clears completed_at."""
+    task = service.create_task("Reopen me")
+    service.complete_task(task.id)
+
+    reopened = service.uncomplete_task(task.id, "week")
+
+    assert reopened.scope == "week"
+    assert reopened.completed_at is None
+    assert repository.get_task(task.id).completed_at is None
+
+    with pytest.raises(exceptions.InvalidInputError):
+        service.uncomplete_task(task.id, "someday")
+    with pytest.raises(exceptions.TaskNotFoundError):
+        service.uncomplete_task(99999)
+
+
+def test_list_tasks_cache_refreshes_after_writes():
+    """Test cached list_tasks/by_project/by_column results follow writes."""
+    project = service.create_project("Cached")
+    service.create_task("First", project_id=project.id)
+
+    assert len(service.list_tasks()) == 1
+    assert len(service.list_tasks_by_project(project.id)) == 1
+    assert len(service.list_tasks_by_column(1)) == 1
+
+    second = service.create_task("Second", project_id=project.id)
+    service.move_task(second.id, 2)
+
+    assert len(service.list_tasks()) == 2
+    assert len(service.list_tasks_by_project(project.id)) == 2
+    assert len(service.list_tasks_by_column(1)) == 1
+
+    # Callers own the returned list
+    service.list_tasks().clear()
+    assert len(service.list_tasks()) == 2
+
+
+def test_init_database_drops_retired_indexes(temp_db):
+    """Test init_database() replaces retired indexes on an existing database."""
+    conn = repository.get_connection()
+    conn.execute("CREATE INDEX idx_tasks_scope_completed ON tasks(scope, completed_at)")
+    conn.execute("DROP INDEX idx_tasks_scope_display")
+    conn.commit()
+
+    repository.init_database(conn)
+
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_tasks_scope_completed" not in names
+    assert "idx_tasks_scope_display" in names
+
+
+def test_get_task_cache_stays_current(temp_db):
+    """Test cached get_task reads follow our writes and other connections'."""
+    project = repository.create_project("Cached")
+    task = repository.create_task("Cached", column_id=1, project_id=project.id)
+
+    # Callers get their own objects, so mutating one can't leak into the cache
+    fetched = repository.get_task(task.id)
+    fetched.title = "Mutated locally"
+    assert repository.get_task(task.id).title == "Cached"
+
+    repository.update_task_title(task.id, "Renamed")
+    assert repository.get_task(task.id).title == "Renamed"
+
+    repository.delete_project(project.id)
+    assert repository.get_task(task.id).project_id is None
+
+    other = sqlite3.connect(temp_db)
+    other.execute("UPDATE tasks SET title = 'External' WHERE id = ?", (task.id,))
+    other.commit()
+    other.close()
+    assert repository.get_task(task.id).title == "External"
+
+
+def test_get_project_cache_stays_current(temp_db):
+    """Test cached project reads follow other connections' deletes and id reuse."""
+    project = repository.create_project("Foo")
+    assert repository.get_project(project.id).name == "Foo"
+    assert [p.name for p in repository.get_projects_by_ids([project.id])] == ["Foo"]
+
+    # Another process deletes the project and a new one takes over its id
+    other = sqlite3.connect(temp_db)
+    other.execute("DELETE FROM projects WHERE id = ?", (project.id,))
+    other.execute("INSERT INTO projects (id, name) VALUES (?, 'Bar')", (project.id,))
+    other.commit()
+    other.close()
+
+    assert repository.get_project(project.id).name == "Bar"
+    assert [p.name for p in repository.get_projects_by_ids([project.id])] == ["Bar"]
+
+
+def test_operation_checks_other_connections_once(temp_db):
+    """Test lookups inside operation() skip the per-call data_version query."""
+    task = repository.create_task("Cached", column_id=1)
+    repository.get_task(task.id)
+    statements = []
+    repository.get_connection().set_trace_callback(statements.append)
+
+    with repository.operation():
+        for _ in range(3):
+            assert repository.get_task(task.id).title == "Cached"
+
+        other = sqlite3.connect(temp_db)
+        other.execute("UPDATE tasks SET title = 'External' WHERE id = ?", (task.id,))
+        other.commit()
+        other.close()
+        assert repository.get_task(task.id).title == "Cached"
+
+    repository.get_connection().set_trace_callback(None)
+    assert statements == ["PRAGMA data_version"]
+    # The next operation (or bare lookup) sees the other connection's commit
+    assert repository.get_task(task.id).title == "External"
+
+
+def test_get_project_by_name_drops_stale_projects(temp_db):
+    """Test get_project_by_name notices other connections' commits too."""
+    foo = repository.create_project("Foo")
+    baz = repository.create_project("Baz")
+    assert repository.get_project(baz.id).name == "Baz"
+
+    other = sqlite3.connect(temp_db)
+    other.execute("UPDATE projects SET name = 'Qux' WHERE id = ?", (baz.id,))
+    other.commit()
+    other.close()
+
+    assert repository.get_project_by_name("Foo").id == foo.id
+    # The stale "Baz" entry is dropped by this lookup, not left for later
+    assert repository._project_cache.get((temp_db, baz.id)) is None
+    assert repository.get_project(baz.id).name == "Qux"
+
+
+def test_task_cache_survives_concurrent_clears(temp_db, monkeypatch):
+    """Test cache inserts/evictions racing clears from other threads don't raise."""
+    import threading
+
+    monkeypatch.setattr(repository, "_TASK_CACHE_SIZE", 4)
+    tasks = [repository.create_task(f"Task {i}", column_id=1) for i in range(8)]
+    errors = []
+
+    def fill():
+        try:
+            for _ in range(2000):
+                for task in tasks:
+                    repository._cache_task(task)
+        except Exception as exc:
+            errors.append(exc)
+
+    def clear():
+        try:
+            for _ in range(2000):
+                repository._forget_all_tasks()
+                repository._forget_task(tasks[0].id)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=fill), threading.Thread(target=clear)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(repository._task_cache) <= 4
+
+
 def test_service_pull_tasks_invalid_scope():
     """Test pull_tasks rejects invalid scope."""
     task = service.create_task("Test task")
@@ -271,6 +622,37 @@ def test_service_pull_tasks_invalid_scope():
         service.pull_tasks([task.id], "invalid")
 
 
+def test_service_list_completed_since():
+    """Test list_completed only returns tasks completed after the cutoff."""
+    old_task = service.create_task("Done long ago")
+    new_task = service.create_task("Done just now")
+    service.complete_task(old_task.id)
+    service.complete_task(new_task.id)
+
+    # Backdate one completion
+    old_task = repository.get_task(old_task.id)
+    old_task.completed_at = "2020-01-01T00:00:00"
+    repository.update_task(old_task)
+
+    recent = service.list_completed(since="2024-01-01T00:00:00")
+    assert [t.id for t in recent] == [new_task.id]
+
+    everything = service.list_completed()
+    assert {t.id for t in everything} == {old_task.id, new_task.id}
+
+
+def test_service_list_completed_since_includes_pulled_to_archive():
+    """Test tasks archived by a pull (no completed_at) still fall in the window."""
+    done = service.create_task("Done")
+    pulled = service.create_task("Pulled to archive")
+    service.complete_task(done.id)
+    service.pull_task(pulled.id, "archived")
+    assert repository.get_task(pulled.id).completed_at is None
+
+    recent = service.list_completed(since="2024-01-01T00:00:00")
+    assert {t.id for t in recent} == {done.id, pulled.id}
+
+
 # --- CLI Tests: Scope Commands ---
 
 def test_cli_today_empty():
@@ -375,6 +757,19 @@ def test_cli_pull_nonexistent_task():
     assert "not found" in result.stderr.lower() or "error" in result.stderr.lower()
 
 
+def test_ordered_id_errors_keeps_input_order():
+    """Test bad and missing IDs are reported in the order they were given."""
+    from barely.cli.main import ordered_id_errors
+
+    errors = ordered_id_errors("x, 999,5, y", {999: "Task 999 not found"}, "task")
+
+    assert errors == [
+        "Invalid task ID: x",
+        "Task 999 not found",
+        "Invalid task ID: y",
+    ]
+
+
 def test_cli_today_json_output():
     """Test CLI today command with JSON output."""
     service.create_task("Today task", scope="today")